@@ -2,6 +2,8 @@
 프로모션 자동화 설정
 """
 
+import json
+
 # 구글 시트 설정
 GOOGLE_SHEET_URL = "https://docs.google.com/spreadsheets/d/1Ca-AXLDXIpyb_N_9AvI_2fT5g-jMEDYlv233mbkRdVs/edit?gid=737496399#gid=737496399"
 GOOGLE_CREDENTIALS_PATH = "inner-sale-979c1e8ed412.json"
@@ -16,6 +18,64 @@ BEEFLOW_PASSWORD = "young124@"
 # 출력 디렉토리
 OUTPUT_DIR = "outputs"
 
+# 상품 채널 조회 API 동시 요청 수 (1이면 순차 조회)
+API_MAX_WORKERS = 8
+
+# 상품 채널 매핑 캐시 (SQLite)
+CHANNEL_CACHE_PATH = f"{OUTPUT_DIR}/channel_cache.db"
+CHANNEL_CACHE_TTL_HOURS = 24 * 7
+
+# 웹 스크래핑 동시 세션 수 (None이면 CPU 코어 수)
+SCRAPER_POOL_SIZE = None
+
+# 상품 검색 XHR 직접 호출 (브라우저는 로그인/요청 캡처에만 사용)
+PRODUCT_SEARCH_REPLAY = True
+REPLAY_BATCH_SIZE = 200
+BEEFLOW_SESSION_PATH = f"{OUTPUT_DIR}/beeflow_session.json"
+
+# 업로더 조건 대기 상한 덮어쓰기 (초, 예: {"ALERT_TIMEOUT": 5.0})
+UPLOADER_WAIT_TIMEOUTS = {}
+
+# 구글 시트 스프레드시트 핸들/워크시트 목록(title ↔ gid) 캐시 유지 시간 (초)
+SHEETS_CACHE_TTL_SECONDS = 600
+
+# 시트를 UNFORMATTED_VALUE/SERIAL_NUMBER로 조회 (숫자·날짜를 문자열 파싱 없이 변환, 할인 컬럼은 표시 문자열, False면 전부 표시 문자열로 조회)
+SHEETS_UNFORMATTED_VALUES = True
+
+# 병렬 업로드 세션 수 (1이면 순차 업로드) / 전체 세션 합산 분당 업로드 시작 수 (None이면 제한 없음)
+UPLOAD_WORKERS = 3
+UPLOAD_RATE_LIMIT_PER_MINUTE = 20
+
+# 파이프라인 모드: 업로드 세션 로그인을 시트 읽기/조회와 동시에 시작하고, 파일이 생성되는 대로 업로드
+# (업로드 여부를 시작할 때 묻고, False면 모든 파일 생성 후 업로드)
+UPLOAD_PIPELINE = True
+
+# 업로드 엑셀 동시 생성 프로세스 수 (None이면 CPU 코어 수, 1이면 순차)
+# 전체 행 수가 EXCEL_PARALLEL_MIN_ROWS 미만이면 프로세스 시작 비용 때문에 순차 생성
+EXCEL_WORKERS = None
+EXCEL_PARALLEL_MIN_ROWS = 5000
+
+# 이 행 수 이상인 파일은 스트리밍(constant_memory) 모드로 생성 (None이면 사용 안 함)
+# EXCEL_REPORT_MEMORY=True면 파일별 피크 메모리 출력 (tracemalloc, 생성 속도 느려짐) → 기준값 조정용
+EXCEL_STREAMING_MIN_ROWS = 50000
+EXCEL_REPORT_MEMORY = False
+
+# 파일당 최대 행 수 (초과 그룹은 번호 붙은 파트 파일로 분할해 각각 업로드, None이면 분할 안 함)
+EXCEL_MAX_ROWS_PER_FILE = 20000
+
+# 그룹 내용 해시/업로드 결과를 OUTPUT_DIR의 매니페스트에 기록해 변경 없는 파일은 재생성·재업로드 생략
+UPLOAD_MANIFEST = True
+UPLOAD_MANIFEST_FILENAME = "upload_manifest.json"
+
+# 업로드 상태 저널 (SQLite, OUTPUT_DIR 안) / 다른 워커의 쓰기 잠금 최대 대기 초
+UPLOAD_JOURNAL_FILENAME = "upload_journal.sqlite3"
+UPLOAD_JOURNAL_TIMEOUT = 30
+
+# 첫 브라우저 업로드의 엑셀 업로드/저장 요청을 학습해 이후 파일은 HTTP로 직접 업로드
+PROMOTION_HTTP_UPLOAD = True
+# 학습한 요청의 첫 HTTP 저장 결과를 확인할 프로모션 목록 페이지
+BEEFLOW_PROMOTION_LIST_URL = "https://b-flow.co.kr/distribution/promotion#/"
+
 # ==================== 채널 마스터 (단일 진실 소스) ====================
 CHANNEL_MASTER = {
     # 표준명: 채널 메타데이터
@@ -280,6 +340,95 @@ CHANNEL_MASTER = {
 
 # ==================== 헬퍼 함수 ====================
 
+def _normalize_channel_key(channel_name: str) -> str:
+    """채널명 비교용 정규화 (대소문자 무시, 공백 제거)"""
+    return channel_name.strip().lower().replace(" ", "")
+
+
+def _channel_master_signature(master: dict) -> str:
+    """CHANNEL_MASTER 내용 서명 (변경 감지용)"""
+    return json.dumps(master, sort_keys=True, ensure_ascii=False)
+
+
+class ChannelRegistry:
+    """
+    CHANNEL_MASTER를 한 번 컴파일한 채널 조회 테이블 (모든 조회 O(1))
+
+    - 필드별 정규화 별칭 dict (dropdown_name, api_key, html_name, uploader_name)
+    - 표준명 + 전체 필드 통합 별칭 dict (get_standard_channel_name 용)
+    - 프로모션 타입별 활성화 채널 (순서 유지 tuple + frozenset)
+    """
+
+    ALIAS_FIELDS = ("dropdown_name", "api_key", "html_name", "uploader_name")
+
+    def __init__(self, master: dict):
+        self.signature = _channel_master_signature(master)
+        self.standard_names = tuple(master)
+        self.fields = {std: dict(info) for std, info in master.items()}
+
+        # 별칭 충돌 시 CHANNEL_MASTER 앞쪽 채널 우선 (기존 선형 검색과 동일)
+        self.by_field = {field: {} for field in self.ALIAS_FIELDS}
+        self.aliases = {}
+        for standard, info in master.items():
+            self.aliases.setdefault(_normalize_channel_key(standard), standard)
+            for field in self.ALIAS_FIELDS:
+                value = info.get(field, "")
+                if value:
+                    key = _normalize_channel_key(value)
+                    self.by_field[field].setdefault(key, standard)
+                    self.aliases.setdefault(key, standard)
+
+        promo_types = {
+            key[len("enabled_"):]
+            for info in master.values() for key in info if key.startswith("enabled_")
+        }
+        self.enabled = {
+            promo_type: tuple(std for std, info in master.items() if info.get(f"enabled_{promo_type}", False))
+            for promo_type in promo_types
+        }
+        self.enabled_sets = {promo_type: frozenset(chs) for promo_type, chs in self.enabled.items()}
+
+    def standard_name(self, channel_name: str) -> str:
+        """아무 별칭 → 표준 채널명 (매칭 실패시 원본 반환)"""
+        if not channel_name:
+            return channel_name
+        return self.aliases.get(_normalize_channel_key(channel_name), channel_name)
+
+    def from_field(self, field: str, value: str):
+        """특정 필드 값 → 표준 채널명 (매칭 실패시 None)"""
+        if not value:
+            return None
+        return self.by_field[field].get(_normalize_channel_key(value))
+
+    def field_of(self, standard: str, field: str):
+        """표준 채널명 → 필드 값 (없으면 None)"""
+        return self.fields.get(standard, {}).get(field)
+
+    def enabled_channels(self, promo_type: str) -> tuple:
+        """활성화된 채널 표준명 (CHANNEL_MASTER 순서)"""
+        return self.enabled.get(promo_type, ())
+
+    def enabled_set(self, promo_type: str) -> frozenset:
+        """활성화된 채널 표준명 집합"""
+        return self.enabled_sets.get(promo_type, frozenset())
+
+
+CHANNEL_REGISTRY = ChannelRegistry(CHANNEL_MASTER)
+
+
+def refresh_channel_registry(force: bool = False) -> ChannelRegistry:
+    """
+    CHANNEL_MASTER가 실행 중 변경되었으면 레지스트리 재컴파일
+
+    Returns:
+        현재 레지스트리
+    """
+    global CHANNEL_REGISTRY
+    if force or _channel_master_signature(CHANNEL_MASTER) != CHANNEL_REGISTRY.signature:
+        CHANNEL_REGISTRY = ChannelRegistry(CHANNEL_MASTER)
+    return CHANNEL_REGISTRY
+
+
 def get_enabled_channels(promo_type: str) -> list:
     """
     프로모션 타입별 활성화된 채널 목록 (표준명)
@@ -290,13 +439,12 @@ def get_enabled_channels(promo_type: str) -> list:
     Returns:
         활성화된 채널의 표준명 리스트
     """
-    key = f"enabled_{promo_type}"
-    return [std for std, info in CHANNEL_MASTER.items() if info.get(key, False)]
+    return list(CHANNEL_REGISTRY.enabled_channels(promo_type))
 
 
 def get_standard_channel_name(channel_name: str) -> str:
     """
-    채널명을 표준 채널명으로 변환
+    채널명을 표준 채널명으로 변환 (대소문자/공백 무시, 표준명 또는 임의 필드 값)
     
     Args:
         channel_name: API 키, 스크래핑 결과, 드롭다운 값 등
@@ -304,26 +452,7 @@ def get_standard_channel_name(channel_name: str) -> str:
     Returns:
         표준 채널명 (매칭 실패시 원본 반환)
     """
-    if not channel_name:
-        return channel_name
-    
-    # 정규화 (대소문자 무시, 공백 제거)
-    normalized = channel_name.strip().lower().replace(" ", "")
-    
-    # CHANNEL_MASTER에서 검색
-    for standard, info in CHANNEL_MASTER.items():
-        # 표준명 자체 확인
-        if normalized == standard.lower().replace(" ", ""):
-            return standard
-        
-        # 각 필드 확인
-        for field in ["dropdown_name", "api_key", "html_name", "uploader_name"]:
-            value = info.get(field, "")
-            if value and normalized == value.lower().replace(" ", ""):
-                return standard
-    
-    # 매칭 실패시 원본 반환
-    return channel_name
+    return CHANNEL_REGISTRY.standard_name(channel_name)
 
 
 # 하위 호환성을 위한 별칭
@@ -5,102 +5,82 @@
 
 import os
 import sys
-import json
 import time
-from datetime import datetime
+import pandas as pd
 from typing import List, Dict, Optional
 
 import config
-from modules.sheets import read_sheet, update_setting_dates
+from modules.sheets import (
+    read_sheet, read_sheets_batch, update_setting_dates, get_sheets_session, parse_sheet_gid,
+)
 from modules.product_hybrid import HybridProductClient
 from modules.processor import process_product_promotion, process_brand_promotion
-from modules.excel import generate_upload_files
+from modules.excel import generate_upload_files, UploadFileGenerationError
+from modules.manifest import UploadManifest
+from modules.upload_journal import UploadJournal
 
 
-# ==================== 상태 관리 ====================
-
-def load_upload_status(status_file: str) -> Optional[Dict]:
-    if not os.path.exists(status_file):
-        return None
-    try:
-        with open(status_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"⚠️  상태 파일 로드 실패: {e}")
-        return None
+# 타입별 시트 읽기 범위: (컬럼 범위, 컬럼 매핑, 데이터 시작 행)
+SHEET_RANGES = {
+    "product": ("K:R", config.PRODUCT_COLUMNS, 4),
+    "brand": ("A:I", config.BRAND_COLUMNS, 3),
+}
 
 
-def save_upload_status(status_file: str, files_status: Dict):
-    data = {
-        "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "files": files_status
-    }
-    try:
-        with open(status_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    except Exception as e:
-        print(f"⚠️  상태 파일 저장 실패: {e}")
-
+# ==================== 상태 관리 ====================
 
-def update_upload_status(status_file: str, filename: str, file_type: str, 
-                         success: bool, error_msg: str = ""):
-    status_data = load_upload_status(status_file)
-    
-    if not status_data:
-        status_data = {"last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "files": {}}
-    
-    if "files" not in status_data:
-        status_data["files"] = {}
-    
-    file_info = status_data["files"].get(filename, {"attempts": 0})
-    
-    file_info["type"] = file_type
-    file_info["status"] = "success" if success else "failed"
-    file_info["attempts"] = file_info.get("attempts", 0) + 1
-    file_info["last_attempt"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    if success:
-        file_info["uploaded_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        if "last_error" in file_info:
-            del file_info["last_error"]
-    else:
-        file_info["last_error"] = error_msg
-    
-    status_data["files"][filename] = file_info
-    status_data["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    save_upload_status(status_file, status_data["files"])
+def open_upload_journal(output_dir: str) -> UploadJournal:
+    """업로드 상태 저널 (기존 upload_status.json은 처음 열 때 저널로 이전)"""
+    return UploadJournal.for_output_dir(output_dir)
+
+
+def group_upload_status(files_status: Dict, filenames: List[str]) -> Dict[str, str]:
+    """
+    분할 파트 파일 상태를 논리 그룹 단위로 집계
+
+    Returns:
+        {그룹 키: "success" | "failed" | "pending"} - 모든 파트가 success여야 success
+    """
+    groups: Dict[str, List[str]] = {}
+    for filename in filenames:
+        info = files_status.get(filename, {})
+        groups.setdefault(info.get("group", filename), []).append(info.get("status", "pending"))
+
+    result = {}
+    for group, statuses in groups.items():
+        if all(status == "success" for status in statuses):
+            result[group] = "success"
+        elif "failed" in statuses:
+            result[group] = "failed"
+        else:
+            result[group] = "pending"
+    return result
 
 
 def smart_resume(output_dir: str) -> Dict:
     """모든 미완료 작업 감지"""
-    status_file = os.path.join(output_dir, "upload_status.json")
-    status_data = load_upload_status(status_file)
+    journal = open_upload_journal(output_dir)
     
-    if not status_data:
+    if not journal.files():
         return {"action": "restart"}
     
     pending_uploads = {"product": [], "brand": []}
     
-    for filename, info in status_data.get("files", {}).items():
-        status = info.get("status")
-        # ✅ failed 또는 pending 모두 미완료로 처리
-        if status in ["failed", "pending"]:
-            file_type = info.get("type", "unknown")
-            filepath = os.path.join(output_dir, filename)
-            
-            if os.path.exists(filepath) and file_type in ["product", "brand"]:
-                pending_uploads[file_type].append(filepath)
+    # ✅ failed 또는 pending 모두 미완료로 처리
+    pending_status = journal.files(statuses=("failed", "pending"))
+    for filename, info in pending_status.items():
+        file_type = info.get("type", "unknown")
+        filepath = os.path.join(output_dir, filename)
+        
+        if os.path.exists(filepath) and file_type in ["product", "brand"]:
+            pending_uploads[file_type].append(filepath)
     
     total_pending = len(pending_uploads["product"]) + len(pending_uploads["brand"])
     
     if total_pending == 0:
         print(f"✓ 이전 업로드 모두 성공")
-        print(f"  상태 파일 삭제\n")
-        try:
-            os.remove(status_file)
-        except:
-            pass
+        print(f"  상태 기록 초기화\n")
+        journal.clear()
         return {"action": "restart"}
     
     print("\n" + "=" * 60)
@@ -111,7 +91,7 @@ def smart_resume(output_dir: str) -> Dict:
         print(f"\n📦 상품: {len(pending_uploads['product'])}개")
         for f in pending_uploads["product"]:
             filename = os.path.basename(f)
-            info = status_data["files"].get(filename, {})
+            info = pending_status.get(filename, {})
             status = info.get("status", "unknown")
             status_text = "⏸️ 중단됨" if status == "pending" else f"❌ {info.get('last_error', '실패')}"
             print(f"  - {filename}")
@@ -121,7 +101,7 @@ def smart_resume(output_dir: str) -> Dict:
         print(f"\n🏷️  브랜드: {len(pending_uploads['brand'])}개")
         for f in pending_uploads["brand"]:
             filename = os.path.basename(f)
-            info = status_data["files"].get(filename, {})
+            info = pending_status.get(filename, {})
             status = info.get("status", "unknown")
             status_text = "⏸️ 중단됨" if status == "pending" else f"❌ {info.get('last_error', '실패')}"
             print(f"  - {filename}")
@@ -134,10 +114,7 @@ def smart_resume(output_dir: str) -> Dict:
         if choice == "1":
             return {"action": "resume", "pending_uploads": pending_uploads}
         elif choice == "2":
-            try:
-                os.remove(status_file)
-            except:
-                pass
+            journal.clear()
             return {"action": "restart"}
 
 
@@ -145,63 +122,71 @@ def smart_resume(output_dir: str) -> Dict:
 
 def upload_with_status_tracking(output_files: List[str], output_dir: str, 
                                 email: str, password: str):
-    """업로드 (실패해도 계속 진행)"""
-    from modules.uploader import BeeflowUploader
-    
-    status_file = os.path.join(output_dir, "upload_status.json")
+    """업로드 (실패해도 계속 진행, UPLOAD_WORKERS > 1이면 세션 여러 개로 병렬 업로드)"""
+    from modules.uploader import BeeflowUploader, parse_upload_filename, upload_files_parallel
     
-    initial_status = {}
-    for file_path in output_files:
-        filename = os.path.basename(file_path)
-        file_type = "brand" if "브랜드" in filename else "product"
-        initial_status[filename] = {"type": file_type, "status": "pending", "attempts": 0}
+    journal = open_upload_journal(output_dir)
     
-    existing = load_upload_status(status_file)
-    if existing and "files" in existing:
-        for fname, finfo in existing["files"].items():
-            if fname not in initial_status:
-                initial_status[fname] = finfo
+    # 매니페스트상 같은 내용으로 이미 업로드 성공한 파일은 건너뜀
+    manifest = UploadManifest(output_dir) if config.UPLOAD_MANIFEST else None
+    already_uploaded = {f for f in output_files if manifest and manifest.is_uploaded(f)}
+    upload_files = [f for f in output_files if f not in already_uploaded]
     
-    save_upload_status(status_file, initial_status)
+    journal.register({
+        os.path.basename(f): _initial_file_status(f, f in already_uploaded) for f in output_files
+    })
     
     print("\n" + "=" * 60)
     print("업로드 시작")
     print("=" * 60)
     
-    uploader = BeeflowUploader(email, password)
+    if already_uploaded:
+        print(f"↷ 이미 업로드된 파일 {len(already_uploaded)}개 건너뜀")
+    if not upload_files:
+        _print_upload_summary(0, 0, 0, _load_group_status(journal, output_files))
+        return
+    
+    def record_result(file_path: str, file_type: str, ok: bool, error_msg: str = ""):
+        journal.record(os.path.basename(file_path), file_type, ok, error_msg)
+        if manifest:
+            manifest.record_upload(file_path, ok)
+    
+    if config.UPLOAD_WORKERS > 1 and len(upload_files) > 1:
+        def on_result(file_path: str, ok: bool, error_msg: str):
+            file_type = "brand" if "브랜드" in os.path.basename(file_path) else "product"
+            record_result(file_path, file_type, ok, error_msg)
+        
+        results = upload_files_parallel(
+            upload_files, email, password,
+            workers=config.UPLOAD_WORKERS,
+            rate_limit_per_minute=config.UPLOAD_RATE_LIMIT_PER_MINUTE,
+            on_result=on_result,
+            wait_timeouts=config.UPLOADER_WAIT_TIMEOUTS,
+        )
+        success_count = sum(1 for ok in results.values() if ok)
+        _print_upload_summary(len(upload_files), success_count, len(upload_files) - success_count,
+                              _load_group_status(journal, output_files))
+        return
+    
+    uploader = BeeflowUploader(email, password, wait_timeouts=config.UPLOADER_WAIT_TIMEOUTS)
     
     try:
         uploader.init_driver()
         uploader.login()
         
-        total = len(output_files)
+        total = len(upload_files)
         success_count = 0
         failed_count = 0
 
-        for idx, file_path in enumerate(output_files, start=1):
+        for idx, file_path in enumerate(upload_files, start=1):
             filename = os.path.basename(file_path)
             print(f"[{idx}/{total}] {filename}", end=" ", flush=True)
 
             try:
-                name_without_ext = filename.replace('.xlsx', '')
-                parts = name_without_ext.split('_')
-                
-                if len(parts) < 3:
-                    raise ValueError(f"파일명 형식 오류")
-                
-                date_range = parts[0]
-                dates = date_range.split('-')
-                start_date = datetime.strptime('20' + dates[0], '%Y%m%d')
-                end_date = datetime.strptime('20' + dates[1], '%Y%m%d')
-                
-                raw_type = parts[1]
-                promotion_type = "brand" if "브랜드" in raw_type else "product"
-                channel_name = parts[2]
+                start_date, end_date, promotion_type, channel_name = parse_upload_filename(filename)
                 
                 # 진행 단계 표시
-                print("→ 페이지 로딩", end="", flush=True)
-                time.sleep(0.3)
-                print(" → 날짜 설정", end="", flush=True)
+                print("→ 페이지 로딩 → 날짜 설정", end="", flush=True)
                 
                 ok = uploader.upload_promotion(
                     file_path=file_path,
@@ -213,49 +198,188 @@ def upload_with_status_tracking(output_files: List[str], output_dir: str,
 
                 if ok:
                     success_count += 1
-                    update_upload_status(status_file, filename, promotion_type, True)
+                    record_result(file_path, promotion_type, True)
                     print(" → ✅ 완료")
                 else:
                     failed_count += 1
-                    update_upload_status(status_file, filename, promotion_type, False, "업로드 실패")
+                    record_result(file_path, promotion_type, False, "업로드 실패")
                     print(" → ❌ 실패")
             
             except Exception as e:
                 failed_count += 1
                 file_type = "brand" if "브랜드" in filename else "product"
-                update_upload_status(status_file, filename, file_type, False, str(e))
+                record_result(file_path, file_type, False, str(e))
                 print(f" → ❌ 예외: {e}")
         
-        print("\n" + "=" * 60)
-        print("업로드 요약")
-        print("-" * 60)
-        print(f"총 대상: {total}개")
-        print(f"성공: {success_count}개")
-        print(f"실패: {failed_count}개")
-        
-        if failed_count > 0:
-            print("\n💡 재실행 시 실패 파일만 재시도")
-        
-        print("=" * 60)
+        _print_upload_summary(total, success_count, failed_count,
+                              _load_group_status(journal, output_files))
         
     finally:
         time.sleep(1)
         uploader.close()
 
 
-# ==================== 메인 함수 ====================
+def _initial_file_status(file_path: str, already_uploaded: bool) -> Dict:
+    """
+    저널 등록용 초기 상태
+
+    분할 파트는 "group"으로 묶어 그룹 단위 성공 여부 판단 (파트끼리는 독립적으로 병렬 업로드)
+    """
+    from modules.uploader import parse_upload_part
+
+    filename = os.path.basename(file_path)
+    group_key, part_no, part_count = parse_upload_part(filename)
+    info = {"type": "brand" if "브랜드" in filename else "product", "status": "pending", "attempts": 0,
+            "group": group_key, "part": f"{part_no}/{part_count}"}
+    if already_uploaded:
+        info["status"] = "success"
+        info["skipped"] = "이미 업로드됨 (내용 동일)"
+    return info
+
+
+class PipelinedUpload:
+    """
+    생성과 업로드를 겹쳐 실행 (생산자/소비자)
+
+    start()로 세션 로그인을 시트 읽기/상품 조회와 동시에 시작하고,
+    generate_upload_files(on_file=submit)로 파일이 만들어지는 대로 업로드 큐에 넣음
+    """
+
+    def __init__(self, output_dir: str, email: str, password: str):
+        from modules.uploader import UploadPipeline
+
+        self.journal = open_upload_journal(output_dir)
+        self.manifest = UploadManifest(output_dir) if config.UPLOAD_MANIFEST else None
+        self.files: List[str] = []
+        self.skipped = 0
+        self._closed = False
+        self.pipeline = UploadPipeline(
+            email, password,
+            workers=config.UPLOAD_WORKERS,
+            rate_limit_per_minute=config.UPLOAD_RATE_LIMIT_PER_MINUTE,
+            on_result=self._on_result,
+            wait_timeouts=config.UPLOADER_WAIT_TIMEOUTS,
+        )
+
+    def start(self) -> "PipelinedUpload":
+        print("업로드 세션 준비 (생성과 병행)")
+        self.pipeline.start()
+        return self
+
+    def submit(self, file_path: str):
+        """생성 완료된 파일 등록 (이미 같은 내용으로 업로드된 파일은 건너뜀)"""
+        self.files.append(file_path)
+        already_uploaded = bool(self.manifest and self.manifest.is_uploaded(file_path))
+        self.journal.register({os.path.basename(file_path): _initial_file_status(file_path, already_uploaded)})
+        if already_uploaded:
+            self.skipped += 1
+            print(f"  ↷ 이미 업로드됨: {os.path.basename(file_path)}")
+        else:
+            self.pipeline.submit(file_path)
+
+    def finish(self):
+        """남은 업로드를 마치고 요약 출력"""
+        results = self._close(cancel=False)
+        success_count = sum(1 for ok in results.values() if ok)
+        if self.skipped:
+            print(f"↷ 이미 업로드된 파일 {self.skipped}개 건너뜀")
+        _print_upload_summary(len(results), success_count, len(results) - success_count,
+                              _load_group_status(self.journal, self.files))
+
+    def cancel(self):
+        """시작하지 않은 업로드는 취소 (저널에 pending으로 남아 다음 실행에서 재시도)"""
+        self._close(cancel=True)
+
+    def _close(self, cancel: bool) -> Dict[str, bool]:
+        if self._closed:
+            return self.pipeline.results
+        self._closed = True
+        return self.pipeline.close(cancel=cancel)
+
+    def _on_result(self, file_path: str, ok: bool, error_msg: str):
+        file_type = "brand" if "브랜드" in os.path.basename(file_path) else "product"
+        self.journal.record(os.path.basename(file_path), file_type, ok, error_msg)
+        if self.manifest:
+            self.manifest.record_upload(file_path, ok)
+
+
+def _confirm_upload(skip_upload_prompt: bool) -> bool:
+    if skip_upload_prompt:
+        return True
+    return input("업로드? (y/n): ").strip().lower() in ['y', 'yes']
+
+
+def _generate_files(df_output, file_prefix: str, pipelined_upload: Optional[PipelinedUpload]):
+    """
+    업로드 파일 생성 (일부 그룹 실패 시 실패 목록을 출력하고 생성된 파일로 계속)
+
+    Returns:
+        (생성된 파일 경로, 생성 실패 파일에 들어갈 df_output 행 인덱스)
+    """
+    try:
+        output_files = generate_upload_files(
+            df_output, config.OUTPUT_DIR, file_prefix,
+            on_file=pipelined_upload.submit if pipelined_upload else None,
+            manifest=pipelined_upload.manifest if pipelined_upload else None,
+        )
+        return output_files, []
+    except UploadFileGenerationError as e:
+        print(f"⚠️  {e}")
+        for filename, message in e.failures:
+            print(f"  ✗ {filename}: {message}")
+        print(f"  → 생성된 {len(e.generated_files)}개 파일로 계속 (실패 그룹은 설정일 기입 제외)")
+        return e.generated_files, e.failed_rows
+
+
+def _exclude_failed_rows(rows_to_set, df_output, failed_rows: list, id_column: str):
+    """생성 실패 파일에 들어간 (시작일, 종료일, 번호) 입력 행은 설정일 기입 대상에서 제외"""
+    if not failed_rows or rows_to_set.empty:
+        return rows_to_set
+    keys = ["시작일", "종료일", id_column]
+    failed = df_output.loc[failed_rows, keys].astype({id_column: "int64"})
+    candidates = rows_to_set[keys].astype({id_column: "int64"})
+    in_failed = pd.MultiIndex.from_frame(candidates).isin(pd.MultiIndex.from_frame(failed))
+    excluded = int(in_failed.sum())
+    if excluded:
+        print(f"  ↷ 생성 실패 그룹 {excluded}개 행은 설정일 기입 제외 (다음 실행에서 다시 처리)")
+    return rows_to_set[~in_failed]
+
+
+def _load_group_status(journal: UploadJournal, output_files: List[str]) -> Optional[Dict[str, str]]:
+    """분할 파트가 있을 때만 그룹별 상태 (없으면 None)"""
+    filenames = [os.path.basename(f) for f in output_files]
+    group_status = group_upload_status(journal.files(), filenames)
+    return group_status if len(group_status) < len(filenames) else None
+
+
+def _print_upload_summary(total: int, success_count: int, failed_count: int,
+                          group_status: Optional[Dict[str, str]] = None):
+    print("\n" + "=" * 60)
+    print("업로드 요약")
+    print("-" * 60)
+    print(f"총 대상: {total}개")
+    print(f"성공: {success_count}개")
+    print(f"실패: {failed_count}개")
+    
+    # 분할 파트가 있으면 논리 그룹 기준 집계도 표시
+    if group_status:
+        group_success = sum(1 for status in group_status.values() if status == "success")
+        print(f"그룹: {group_success}/{len(group_status)}개 성공 (분할 파트 포함)")
+        for group, status in group_status.items():
+            if status != "success":
+                print(f"  - {group}: 일부 파트 미완료")
+    
+    if failed_count > 0:
+        print("\n💡 재실행 시 실패 파일만 재시도")
+    
+    print("=" * 60)
 
-def select_sheet_name():
-    import gspread
-    from google.oauth2.service_account import Credentials
 
-    scopes = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
-    creds = Credentials.from_service_account_file(config.GOOGLE_CREDENTIALS_PATH, scopes=scopes)
-    client = gspread.authorize(creds)
+# ==================== 메인 함수 ====================
 
-    sheet_id = config.GOOGLE_SHEET_URL.split('/d/')[1].split('/')[0]
-    spreadsheet = client.open_by_key(sheet_id)
-    worksheets = spreadsheet.worksheets()
+def select_sheet_name():
+    session = get_sheets_session(config.GOOGLE_CREDENTIALS_PATH)
+    worksheets = session.worksheets(config.GOOGLE_SHEET_URL)
 
     print("\n" + "=" * 60)
     print("📋 시트 목록")
@@ -274,19 +398,34 @@ def select_sheet_name():
                 return selected.title
 
 
-def run_product_promotion(sheet_name=None, skip_upload_prompt=False, resume_mode=False):
-    """상품 프로모션"""
+def read_promotion_inputs(sheet_name: str, promo_types: List[str]) -> Dict:
+    """여러 타입의 시트 범위를 batchGet 1회로 읽기 ({타입: DataFrame})"""
+    ranges = {promo_type: SHEET_RANGES[promo_type] for promo_type in promo_types}
+    return read_sheets_batch(config.GOOGLE_SHEET_URL, config.GOOGLE_CREDENTIALS_PATH, ranges,
+                             sheet_name=sheet_name, interactive=False)
+
+
+def run_product_promotion(sheet_name=None, skip_upload_prompt=False, resume_mode=False, df_input=None):
+    """상품 프로모션 (df_input을 주면 시트를 다시 읽지 않고 사용)"""
     if not resume_mode:
         print("=" * 60)
         print("상품 프로모션")
         print("=" * 60)
     
     hybrid_client = None
+    pipelined_upload = None
     selected_sheet_name = sheet_name
 
     try:
+        # 파이프라인 모드: 업로드 여부를 먼저 정하고 세션 로그인을 시트 읽기와 동시에 진행
+        if config.UPLOAD_PIPELINE and _confirm_upload(skip_upload_prompt):
+            pipelined_upload = PipelinedUpload(config.OUTPUT_DIR, config.BEEFLOW_EMAIL,
+                                               config.BEEFLOW_PASSWORD).start()
+
         print("[1/5] 시트 읽기...")
-        if sheet_name:
+        if df_input is not None:
+            print("✓ 통합 조회 결과 사용")
+        elif sheet_name:
             df_input = read_sheet(config.GOOGLE_SHEET_URL, config.GOOGLE_CREDENTIALS_PATH,
                                 column_range="K:R", column_mapping=config.PRODUCT_COLUMNS,
                                 interactive=False, sheet_name=sheet_name)
@@ -295,15 +434,8 @@ def run_product_promotion(sheet_name=None, skip_upload_prompt=False, resume_mode
                                 column_range="K:R", column_mapping=config.PRODUCT_COLUMNS,
                                 interactive=True)
             if 'gid=' in config.GOOGLE_SHEET_URL:
-                import gspread
-                from google.oauth2.service_account import Credentials
-                scopes = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
-                creds = Credentials.from_service_account_file(config.GOOGLE_CREDENTIALS_PATH, scopes=scopes)
-                client = gspread.authorize(creds)
-                sheet_id = config.GOOGLE_SHEET_URL.split('/d/')[1].split('/')[0]
-                spreadsheet = client.open_by_key(sheet_id)
-                gid = config.GOOGLE_SHEET_URL.split('gid=')[1].split('&')[0].split('#')[0]
-                worksheet = spreadsheet.get_worksheet_by_id(int(gid))
+                worksheet = get_sheets_session(config.GOOGLE_CREDENTIALS_PATH).worksheet(
+                    config.GOOGLE_SHEET_URL, gid=parse_sheet_gid(config.GOOGLE_SHEET_URL))
                 selected_sheet_name = worksheet.title
 
         print(f"✓ {len(df_input)}개\n")
@@ -311,7 +443,8 @@ def run_product_promotion(sheet_name=None, skip_upload_prompt=False, resume_mode
         print("[2/5] 상품 조회...")
         hybrid_client = HybridProductClient(config.BEEFLOW_API_BASE_URL,
                                            config.BEEFLOW_EMAIL, config.BEEFLOW_PASSWORD)
-        products_to_query = df_input[df_input["설정일"].isna()]["상품번호"].unique()
+        rows_to_set = df_input[df_input["설정일"].isna()]
+        products_to_query = rows_to_set["상품번호"].unique()
         channel_mappings = hybrid_client.query_products(products_to_query)
         print(f"✓ 완료\n")
 
@@ -320,26 +453,26 @@ def run_product_promotion(sheet_name=None, skip_upload_prompt=False, resume_mode
         print(f"✓ {len(df_output)}개\n")
 
         print("[4/5] 파일 생성...")
-        output_files = generate_upload_files(df_output, config.OUTPUT_DIR, "상품")
+        output_files, failed_rows = _generate_files(df_output, "상품", pipelined_upload)
         print(f"✓ {len(output_files)}개\n")
 
         upload_success = False
-        if output_files:
+        if pipelined_upload:
+            print("[5/5] 업로드 마무리...")
+            pipelined_upload.finish()
+            upload_success = bool(output_files)
+        elif output_files and not config.UPLOAD_PIPELINE:
             print("[5/5] 업로드...")
             
-            if not skip_upload_prompt:
-                response = input("업로드? (y/n): ").strip().lower()
-            else:
-                response = 'y'
-            
-            if response in ['y', 'yes']:
+            if _confirm_upload(skip_upload_prompt):
                 upload_with_status_tracking(output_files, config.OUTPUT_DIR,
                                            config.BEEFLOW_EMAIL, config.BEEFLOW_PASSWORD)
                 upload_success = True
 
-        if upload_success and len(products_to_query) > 0:
+        rows_to_set = _exclude_failed_rows(rows_to_set, df_output, failed_rows, "상품번호")
+        if upload_success and len(rows_to_set) > 0:
             update_setting_dates(config.GOOGLE_SHEET_URL, config.GOOGLE_CREDENTIALS_PATH,
-                               products_to_query.tolist(), "M", "R", selected_sheet_name)
+                               rows_to_set.index, "R", selected_sheet_name)
 
         print("\n✅ 완료")
         
@@ -352,22 +485,32 @@ def run_product_promotion(sheet_name=None, skip_upload_prompt=False, resume_mode
         traceback.print_exc()
         sys.exit(1)
     finally:
+        if pipelined_upload:
+            pipelined_upload.cancel()
         if hybrid_client:
             hybrid_client.close()
 
 
-def run_brand_promotion(sheet_name=None, skip_upload_prompt=False, resume_mode=False):
-    """브랜드 프로모션"""
+def run_brand_promotion(sheet_name=None, skip_upload_prompt=False, resume_mode=False, df_input=None):
+    """브랜드 프로모션 (df_input을 주면 시트를 다시 읽지 않고 사용)"""
     if not resume_mode:
         print("=" * 60)
         print("브랜드 프로모션")
         print("=" * 60)
     
+    pipelined_upload = None
     selected_sheet_name = sheet_name
 
     try:
+        # 파이프라인 모드: 업로드 여부를 먼저 정하고 세션 로그인을 시트 읽기와 동시에 진행
+        if config.UPLOAD_PIPELINE and _confirm_upload(skip_upload_prompt):
+            pipelined_upload = PipelinedUpload(config.OUTPUT_DIR, config.BEEFLOW_EMAIL,
+                                               config.BEEFLOW_PASSWORD).start()
+
         print("[1/4] 시트 읽기...")
-        if sheet_name:
+        if df_input is not None:
+            print("✓ 통합 조회 결과 사용")
+        elif sheet_name:
             df_input = read_sheet(config.GOOGLE_SHEET_URL, config.GOOGLE_CREDENTIALS_PATH,
                                 column_range="A:I", column_mapping=config.BRAND_COLUMNS,
                                 start_row=3, interactive=False, sheet_name=sheet_name)
@@ -376,15 +519,8 @@ def run_brand_promotion(sheet_name=None, skip_upload_prompt=False, resume_mode=F
                                 column_range="A:I", column_mapping=config.BRAND_COLUMNS,
                                 start_row=3, interactive=True)
             if 'gid=' in config.GOOGLE_SHEET_URL:
-                import gspread
-                from google.oauth2.service_account import Credentials
-                scopes = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
-                creds = Credentials.from_service_account_file(config.GOOGLE_CREDENTIALS_PATH, scopes=scopes)
-                client = gspread.authorize(creds)
-                sheet_id = config.GOOGLE_SHEET_URL.split('/d/')[1].split('/')[0]
-                spreadsheet = client.open_by_key(sheet_id)
-                gid = config.GOOGLE_SHEET_URL.split('gid=')[1].split('&')[0].split('#')[0]
-                worksheet = spreadsheet.get_worksheet_by_id(int(gid))
+                worksheet = get_sheets_session(config.GOOGLE_CREDENTIALS_PATH).worksheet(
+                    config.GOOGLE_SHEET_URL, gid=parse_sheet_gid(config.GOOGLE_SHEET_URL))
                 selected_sheet_name = worksheet.title
 
         print(f"✓ {len(df_input)}개\n")
@@ -394,27 +530,27 @@ def run_brand_promotion(sheet_name=None, skip_upload_prompt=False, resume_mode=F
         print(f"✓ {len(df_output)}개\n")
 
         print("[3/4] 파일 생성...")
-        output_files = generate_upload_files(df_output, config.OUTPUT_DIR, "브랜드")
+        output_files, failed_rows = _generate_files(df_output, "브랜드", pipelined_upload)
         print(f"✓ {len(output_files)}개\n")
 
         upload_success = False
-        if output_files:
+        if pipelined_upload:
+            print("[4/4] 업로드 마무리...")
+            pipelined_upload.finish()
+            upload_success = bool(output_files)
+        elif output_files and not config.UPLOAD_PIPELINE:
             print("[4/4] 업로드...")
             
-            if not skip_upload_prompt:
-                response = input("업로드? (y/n): ").strip().lower()
-            else:
-                response = 'y'
-            
-            if response in ['y', 'yes']:
+            if _confirm_upload(skip_upload_prompt):
                 upload_with_status_tracking(output_files, config.OUTPUT_DIR,
                                            config.BEEFLOW_EMAIL, config.BEEFLOW_PASSWORD)
                 upload_success = True
 
-        brands_to_update = df_input[df_input["설정일"].isna()]["브랜드번호"].unique()
-        if upload_success and len(brands_to_update) > 0:
+        rows_to_set = _exclude_failed_rows(df_input[df_input["설정일"].isna()], df_output,
+                                           failed_rows, "브랜드번호")
+        if upload_success and len(rows_to_set) > 0:
             update_setting_dates(config.GOOGLE_SHEET_URL, config.GOOGLE_CREDENTIALS_PATH,
-                               brands_to_update.tolist(), "C", "I", selected_sheet_name)
+                               rows_to_set.index, "I", selected_sheet_name)
 
         print("\n✅ 완료")
         
@@ -426,6 +562,9 @@ def run_brand_promotion(sheet_name=None, skip_upload_prompt=False, resume_mode=F
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        if pipelined_upload:
+            pipelined_upload.cancel()
 
 
 def run_both_promotions():
@@ -436,11 +575,16 @@ def run_both_promotions():
     
     sheet_name = select_sheet_name()
     
+    # 상품/브랜드 범위를 한 번에 읽어 두 단계가 같은 스냅샷 사용
+    inputs = read_promotion_inputs(sheet_name, ["product", "brand"])
+    
     print("\n[1단계] 상품\n")
-    run_product_promotion(sheet_name=sheet_name, skip_upload_prompt=True, resume_mode=True)
+    run_product_promotion(sheet_name=sheet_name, skip_upload_prompt=True, resume_mode=True,
+                          df_input=inputs["product"])
     
     print("\n[2단계] 브랜드\n")
-    run_brand_promotion(sheet_name=sheet_name, skip_upload_prompt=True, resume_mode=True)
+    run_brand_promotion(sheet_name=sheet_name, skip_upload_prompt=True, resume_mode=True,
+                        df_input=inputs["brand"])
     
     print("\n✅ 통합 완료")
 
@@ -462,12 +606,11 @@ def main():
                                        config.BEEFLOW_EMAIL, config.BEEFLOW_PASSWORD)
             
             # 업로드 성공 확인
-            status_file = os.path.join(config.OUTPUT_DIR, "upload_status.json")
-            status_data = load_upload_status(status_file)
-            if status_data:
+            files_status = open_upload_journal(config.OUTPUT_DIR).files()
+            if files_status:
                 product_files = [os.path.basename(f) for f in pending["product"]]
                 all_success = all(
-                    status_data["files"].get(fname, {}).get("status") == "success"
+                    files_status.get(fname, {}).get("status") == "success"
                     for fname in product_files
                 )
                 upload_success["product"] = all_success
@@ -478,12 +621,11 @@ def main():
                                        config.BEEFLOW_EMAIL, config.BEEFLOW_PASSWORD)
             
             # 업로드 성공 확인
-            status_file = os.path.join(config.OUTPUT_DIR, "upload_status.json")
-            status_data = load_upload_status(status_file)
-            if status_data:
+            files_status = open_upload_journal(config.OUTPUT_DIR).files()
+            if files_status:
                 brand_files = [os.path.basename(f) for f in pending["brand"]]
                 all_success = all(
-                    status_data["files"].get(fname, {}).get("status") == "success"
+                    files_status.get(fname, {}).get("status") == "success"
                     for fname in brand_files
                 )
                 upload_success["brand"] = all_success
@@ -495,47 +637,40 @@ def main():
             # 시트 선택
             sheet_name = select_sheet_name()
             
-            if upload_success["product"]:
+            # 필요한 범위를 한 번에 읽기
+            promo_types = [t for t in ("product", "brand") if upload_success[t]]
+            try:
+                inputs = read_promotion_inputs(sheet_name, promo_types)
+            except Exception as e:
+                print(f"⚠️  시트 읽기 실패: {e}")
+                inputs = {}
+            
+            if upload_success["product"] and "product" in inputs:
                 try:
                     # 상품 설정일 업데이트
-                    df_input = read_sheet(
-                        config.GOOGLE_SHEET_URL,
-                        config.GOOGLE_CREDENTIALS_PATH,
-                        column_range="K:R",
-                        column_mapping=config.PRODUCT_COLUMNS,
-                        interactive=False,
-                        sheet_name=sheet_name
-                    )
-                    products_to_update = df_input[df_input["설정일"].isna()]["상품번호"].unique()
-                    if len(products_to_update) > 0:
+                    df_input = inputs["product"]
+                    rows_to_set = df_input[df_input["설정일"].isna()]
+                    if len(rows_to_set) > 0:
                         update_setting_dates(
                             config.GOOGLE_SHEET_URL,
                             config.GOOGLE_CREDENTIALS_PATH,
-                            products_to_update.tolist(),
-                            "M", "R", sheet_name
+                            rows_to_set.index,
+                            "R", sheet_name
                         )
                 except Exception as e:
                     print(f"⚠️  상품 설정일 업데이트 실패: {e}")
             
-            if upload_success["brand"]:
+            if upload_success["brand"] and "brand" in inputs:
                 try:
                     # 브랜드 설정일 업데이트
-                    df_input = read_sheet(
-                        config.GOOGLE_SHEET_URL,
-                        config.GOOGLE_CREDENTIALS_PATH,
-                        column_range="A:I",
-                        column_mapping=config.BRAND_COLUMNS,
-                        start_row=3,
-                        interactive=False,
-                        sheet_name=sheet_name
-                    )
-                    brands_to_update = df_input[df_input["설정일"].isna()]["브랜드번호"].unique()
-                    if len(brands_to_update) > 0:
+                    df_input = inputs["brand"]
+                    rows_to_set = df_input[df_input["설정일"].isna()]
+                    if len(rows_to_set) > 0:
                         update_setting_dates(
                             config.GOOGLE_SHEET_URL,
                             config.GOOGLE_CREDENTIALS_PATH,
-                            brands_to_update.tolist(),
-                            "C", "I", sheet_name
+                            rows_to_set.index,
+                            "I", sheet_name
                         )
                 except Exception as e:
                     print(f"⚠️  브랜드 설정일 업데이트 실패: {e}")
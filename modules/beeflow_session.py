@@ -0,0 +1,147 @@
+"""
+비플로우 인증 세션 저장/복원 모듈
+Selenium 로그인으로 얻은 쿠키를 파일에 저장하고 requests.Session으로 재사용
+"""
+
+import sys
+from pathlib import Path
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+import os
+import json
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+import requests
+import config
+
+
+# 재전송하면 안 되는 헤더 (requests가 직접 채우거나 쿠키 jar로 대체)
+_SKIP_HEADERS = {"cookie", "content-length", "host", "connection", "accept-encoding"}
+
+# 세션 파일 읽기-수정-저장 구간 잠금 (쿠키, 검색/업로드 템플릿을 여러 스레드가 갱신)
+STATE_LOCK = threading.Lock()
+
+
+class SessionExpiredError(Exception):
+    """저장된 쿠키가 만료되어 재로그인이 필요한 경우"""
+
+
+def load_session_state(path: Optional[str] = None) -> Dict:
+    """
+    저장된 세션 상태 로드
+
+    Returns:
+        {"cookies": [...], "saved_at": "...", ...} (없거나 손상되면 빈 dict)
+    """
+    path = path or config.BEEFLOW_SESSION_PATH
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️  세션 파일 로드 실패: {e}")
+        return {}
+
+
+def save_session_state(state: Dict, path: Optional[str] = None):
+    """세션 상태 저장 (임시 파일에 쓴 뒤 교체)"""
+    path = path or config.BEEFLOW_SESSION_PATH
+    state = dict(state, saved_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+
+    path_dir = os.path.dirname(path)
+    if path_dir:
+        os.makedirs(path_dir, exist_ok=True)
+
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"⚠️  세션 파일 저장 실패: {e}")
+
+
+def clear_session_state(path: Optional[str] = None):
+    """저장된 세션 삭제 (만료 시)"""
+    path = path or config.BEEFLOW_SESSION_PATH
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def filter_replay_headers(headers: Dict[str, str]) -> Dict[str, str]:
+    """브라우저에서 캡처한 헤더 중 재전송 가능한 것만 남김"""
+    return {
+        k: v for k, v in (headers or {}).items()
+        if not k.startswith(":") and k.lower() not in _SKIP_HEADERS
+    }
+
+
+def enable_network_capture(options):
+    """ChromeOptions에 성능 로그(네트워크 이벤트) 수집 설정"""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def read_network_requests(driver) -> List[dict]:
+    """
+    브라우저가 보낸 XHR/fetch 요청 목록 (enable_network_capture 필요, 호출 시 로그는 비워짐)
+
+    Returns:
+        [{"request_id", "url", "method", "headers", "post_data"}]
+    """
+    requests_sent = []
+    for entry in driver.get_log("performance"):
+        try:
+            message = json.loads(entry["message"])["message"]
+        except Exception:
+            continue
+
+        if message.get("method") != "Network.requestWillBeSent":
+            continue
+
+        params = message.get("params", {})
+        if params.get("type") not in ("XHR", "Fetch"):
+            continue
+
+        request = params.get("request", {})
+        requests_sent.append({
+            "request_id": params.get("requestId"),
+            "url": request.get("url", ""),
+            "method": request.get("method", "GET"),
+            "headers": request.get("headers", {}),
+            "post_data": request.get("postData"),
+        })
+
+    return requests_sent
+
+
+def read_response_json(driver, request_id: str):
+    """캡처된 요청의 응답 본문(JSON) 조회 (버퍼에서 사라졌거나 JSON이 아니면 None)"""
+    try:
+        body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        return json.loads(body.get("body", ""))
+    except Exception:
+        return None
+
+
+def cookies_to_session(cookies: List[dict], session: Optional[requests.Session] = None) -> requests.Session:
+    """
+    Selenium get_cookies() 형식의 쿠키를 requests.Session에 적재
+
+    Args:
+        cookies: [{"name", "value", "domain", "path", ...}]
+        session: 기존 세션 (없으면 새로 생성)
+    """
+    session = session or requests.Session()
+    for cookie in cookies:
+        session.cookies.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain"),
+            path=cookie.get("path", "/"),
+        )
+    return session
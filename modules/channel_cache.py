@@ -0,0 +1,136 @@
+"""
+상품 채널 매핑 영구 캐시 모듈
+조회된 {표준_채널명: 채널상품번호}를 SQLite에 저장하여 재실행 시 재사용
+"""
+
+import sys
+from pathlib import Path
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+import os
+import json
+import sqlite3
+import time
+from typing import Dict, Iterable, Optional
+import config
+
+
+class ChannelMappingCache:
+    """BRICH 상품번호 → 채널 매핑 SQLite 캐시 (TTL 지원)"""
+
+    def __init__(self, db_path: Optional[str] = None, ttl_hours: Optional[float] = None):
+        """
+        Args:
+            db_path: 캐시 DB 경로 (기본: config.CHANNEL_CACHE_PATH)
+            ttl_hours: 캐시 유효 시간 (기본: config.CHANNEL_CACHE_TTL_HOURS)
+        """
+        self.db_path = db_path or config.CHANNEL_CACHE_PATH
+        if ttl_hours is None:
+            ttl_hours = config.CHANNEL_CACHE_TTL_HOURS
+        self.ttl_seconds = float(ttl_hours) * 3600
+
+        self.hits = 0
+        self.misses = 0
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS channel_mappings (
+                product_id INTEGER PRIMARY KEY,
+                channels TEXT NOT NULL,
+                source TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self.conn.commit()
+
+    def get_many(self, product_ids: Iterable[int]) -> Dict[int, Dict[str, str]]:
+        """
+        TTL 이내의 캐시된 매핑 조회
+
+        Args:
+            product_ids: BRICH 상품번호 리스트
+
+        Returns:
+            {상품번호: {표준_채널명: 채널상품번호}} (캐시 적중분만, 입력 키 그대로)
+        """
+        product_ids = list(product_ids)
+        if not product_ids:
+            return {}
+
+        min_updated_at = time.time() - self.ttl_seconds
+        found: Dict[int, Dict[str, str]] = {}
+
+        # SQLite 변수 개수 제한(999)을 넘지 않도록 나눠서 조회
+        keys = [int(pid) for pid in product_ids]
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT product_id, channels FROM channel_mappings "
+                f"WHERE product_id IN ({placeholders}) AND updated_at >= ?",
+                (*chunk, min_updated_at),
+            ).fetchall()
+            for product_id, channels in rows:
+                found[product_id] = json.loads(channels)
+
+        results = {pid: found[int(pid)] for pid in product_ids if int(pid) in found}
+        self.hits += len(results)
+        self.misses += len(product_ids) - len(results)
+        return results
+
+    def put_many(self, mappings: Dict[int, Dict[str, str]], source: str):
+        """
+        매핑 저장 (빈 매핑은 조회 실패로 보고 저장하지 않음)
+
+        Args:
+            mappings: {상품번호: {표준_채널명: 채널상품번호}}
+            source: 조회 출처 ("api" 또는 "scraper")
+        """
+        now = time.time()
+        rows = [
+            (int(pid), json.dumps(channels, ensure_ascii=False), source, now)
+            for pid, channels in mappings.items()
+            if channels
+        ]
+        if not rows:
+            return
+
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO channel_mappings (product_id, channels, source, updated_at) "
+            "VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        self.conn.commit()
+
+    def invalidate(self, product_ids: Optional[Iterable[int]] = None):
+        """
+        캐시 삭제
+
+        Args:
+            product_ids: 삭제할 상품번호 (None이면 전체 삭제)
+        """
+        if product_ids is None:
+            self.conn.execute("DELETE FROM channel_mappings")
+        else:
+            self.conn.executemany(
+                "DELETE FROM channel_mappings WHERE product_id = ?",
+                [(int(pid),) for pid in product_ids],
+            )
+        self.conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """적중/미적중 통계"""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        """DB 연결 종료"""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
@@ -9,14 +9,55 @@ from pathlib import Path
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.append(str(Path(__file__).parent.parent))
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import config
 
 
+class _DropdownCache:
+    """드롭다운 문법/파싱 결과 캐시 (채널 레지스트리가 재컴파일되면 비움)"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.clear()
+
+    def clear(self):
+        self.registry = None
+        self.grammars: Dict[str, Dict[str, object]] = {}
+        self.entries: Dict[Tuple[str, str], Dict] = {}
+
+    def sync(self):
+        """CHANNEL_MASTER 변경(refresh_channel_registry)으로 레지스트리가 바뀌었으면 무효화"""
+        registry = config.CHANNEL_REGISTRY
+        if registry is not self.registry:
+            self.clear()
+            self.registry = registry
+        return registry
+
+
+_CACHE = _DropdownCache()
+
+
+def invalidate_dropdown_cache():
+    """드롭다운 캐시 전체 삭제"""
+    _CACHE.clear()
+
+
+def dropdown_cache_stats() -> Dict[str, float]:
+    """드롭다운 파싱 캐시 적중 통계"""
+    total = _CACHE.hits + _CACHE.misses
+    return {
+        "hits": _CACHE.hits,
+        "misses": _CACHE.misses,
+        "hit_rate": _CACHE.hits / total if total else 0.0,
+        "size": len(_CACHE.entries),
+    }
+
+
 def _get_dropdown_mapping(promo_type: str) -> Dict[str, any]:
     """
-    프로모션 타입별 드롭다운 매핑 동적 생성
+    프로모션 타입별 드롭다운 매핑 (타입별 1회 컴파일 후 캐시)
     
     Args:
         promo_type: "product" 또는 "brand"
@@ -24,7 +65,12 @@ def _get_dropdown_mapping(promo_type: str) -> Dict[str, any]:
     Returns:
         드롭다운 문자열 → 표준 채널명 매핑
     """
-    enabled_channels = config.get_enabled_channels(promo_type)
+    registry = _CACHE.sync()
+    mapping = _CACHE.grammars.get(promo_type)
+    if mapping is not None:
+        return mapping
+
+    enabled_channels = registry.enabled_channels(promo_type)
     
     mapping = {
         "*전 채널": "ALL",
@@ -34,8 +80,7 @@ def _get_dropdown_mapping(promo_type: str) -> Dict[str, any]:
     
     # 개별 채널 추가
     for std in enabled_channels:
-        info = config.CHANNEL_MASTER[std]
-        dropdown_name = info["dropdown_name"]
+        dropdown_name = registry.field_of(std, "dropdown_name")
         mapping[dropdown_name] = [std]
     
     # 특수 조합 (지마켓/옥션)
@@ -43,9 +88,71 @@ def _get_dropdown_mapping(promo_type: str) -> Dict[str, any]:
         if "지마켓" in enabled_channels and "옥션" in enabled_channels:
             mapping["지마켓/옥션"] = ["지마켓", "옥션"]
     
+    _CACHE.grammars[promo_type] = mapping
     return mapping
 
 
+def _compile_dropdown(channel_str: str, promo_type: str) -> Dict:
+    """
+    드롭다운 문자열 1개를 규칙으로 컴파일
+
+    Returns:
+        {"rules": (("ALL", 제외 채널 또는 None) | ("LIST", (표준_채널명, ...)), ...),
+         "order": 특정 채널만 있으면 중복 제거된 채널 순서 (전체 채널 규칙 포함 시 None),
+         "channel_set": order의 frozenset,
+         "fixed": {promo_type: 조회 채널 없이 펼친 결과} (브랜드용, 지연 계산)}
+    """
+    if "," in channel_str:
+        parts = [p.strip() for p in channel_str.split(",") if p.strip()]
+    else:
+        parts = [channel_str]
+
+    dropdown_mapping = _get_dropdown_mapping(promo_type)
+    rules = []
+    for part in parts:
+        if part not in dropdown_mapping:
+            print(f"    ⚠️  알 수 없는 드롭다운 값: '{part}'")
+            continue
+
+        mapping_value = dropdown_mapping[part]
+        if mapping_value == "ALL":
+            rules.append(("ALL", None))
+        elif mapping_value == "ALL_EXCEPT_GS":
+            rules.append(("ALL", "GS Shop"))
+        elif mapping_value == "ALL_EXCEPT_QUEENIT":
+            rules.append(("ALL", "퀸잇"))
+        else:
+            rules.append(("LIST", tuple(config.get_standard_channel_name(ch) for ch in mapping_value)))
+
+    order = None
+    if all(kind == "LIST" for kind, _ in rules):
+        order = tuple(dict.fromkeys(ch for _, chs in rules for ch in chs))
+
+    return {
+        "rules": tuple(rules),
+        "order": order,
+        "channel_set": frozenset(order or ()),
+        "fixed": None,
+    }
+
+
+def _dropdown_entry(channel_str, promo_type: str) -> Optional[Dict]:
+    """드롭다운 문자열별 컴파일 결과 (캐시 조회, 빈 값이면 None)"""
+    if not channel_str or pd.isna(channel_str):
+        return None
+
+    _CACHE.sync()
+    key = (promo_type, str(channel_str).strip())
+    entry = _CACHE.entries.get(key)
+    if entry is None:
+        _CACHE.misses += 1
+        entry = _compile_dropdown(key[1], promo_type)
+        _CACHE.entries[key] = entry
+    else:
+        _CACHE.hits += 1
+    return entry
+
+
 def parse_channel_dropdown(
     channel_str: str, 
     available_channels: Optional[Dict[str, str]] = None,
@@ -53,6 +160,7 @@ def parse_channel_dropdown(
 ) -> Dict[str, str]:
     """
     채널 드롭다운 값을 파싱하여 채널 리스트로 변환
+    (드롭다운 문자열별 파싱 결과는 캐시, 상품은 조회된 채널과 교집합만 계산)
     
     Args:
         channel_str: 드롭다운 값 (예: "*전 채널", "SSG", "지마켓/옥션", "SSG, CJ몰")
@@ -63,96 +171,125 @@ def parse_channel_dropdown(
     Returns:
         {표준_채널명: 채널ID 또는 ""} 딕셔너리
     """
-    result: Dict[str, str] = {}
-
-    if not channel_str or pd.isna(channel_str):
-        return result
-
-    channel_str = str(channel_str).strip()
-    
     # 프로모션 타입 추론 (하위 호환성)
     if available_channels is not None:
         promo_type = "product"
-    
-    # 동적 드롭다운 매핑 생성
-    DROPDOWN_MAPPING = _get_dropdown_mapping(promo_type)
-    enabled_channels = config.get_enabled_channels(promo_type)
 
-    # 콤마로 여러 채널이 들어있는 케이스
-    if "," in channel_str:
-        parts = [p.strip() for p in channel_str.split(",") if p.strip()]
-        merged: Dict[str, str] = {}
-        for part in parts:
-            sub = parse_channel_dropdown(part, available_channels, promo_type)
-            merged.update(sub)
-        return merged
-
-    # 드롭다운 매핑 확인
-    if channel_str not in DROPDOWN_MAPPING:
-        print(f"    ⚠️  알 수 없는 드롭다운 값: '{channel_str}'")
-        return result
-
-    mapping_value = DROPDOWN_MAPPING[channel_str]
+    entry = _dropdown_entry(channel_str, promo_type)
+    if entry is None:
+        return {}
 
     # === 상품 프로모션 (available_channels 있음) ===
     if available_channels is not None:
-        # 전체 채널
-        if mapping_value == "ALL":
-            return available_channels.copy()
+        # 특정 채널만 → 조회된 채널과 교집합 (드롭다운 순서 유지)
+        if entry["order"] is not None:
+            found = entry["channel_set"] & available_channels.keys()
+            return {ch: available_channels[ch] for ch in entry["order"] if ch in found}
 
-        # GS 제외
-        if mapping_value == "ALL_EXCEPT_GS":
-            return {
-                k: v for k, v in available_channels.items()
-                if k != "GS Shop"
-            }
+        # 전체 채널 포함 → 콤마 앞부분부터 순서대로 병합
+        result: Dict[str, str] = {}
+        for kind, arg in entry["rules"]:
+            if kind == "ALL":
+                for ch, ch_id in available_channels.items():
+                    if ch != arg:
+                        result.setdefault(ch, ch_id)
+            else:
+                for ch in arg:
+                    if ch in available_channels:
+                        result.setdefault(ch, available_channels[ch])
+        return result
 
-        # 퀸잇 제외
-        if mapping_value == "ALL_EXCEPT_QUEENIT":
-            return {
-                k: v for k, v in available_channels.items()
-                if k != "퀸잇"
-            }
+    # === 브랜드 프로모션 (available_channels 없음) → 활성화 채널 기준, 결과 자체를 캐시 ===
+    if entry["fixed"] is None:
+        registry = _CACHE.registry
+        enabled_channels = registry.enabled_channels(promo_type)
+        enabled_set = registry.enabled_set(promo_type)
+        fixed: Dict[str, str] = {}
+        for kind, arg in entry["rules"]:
+            if kind == "ALL":
+                for ch in enabled_channels:
+                    if ch != arg:
+                        fixed.setdefault(ch, "")
+            else:
+                for ch in arg:
+                    if ch in enabled_set:
+                        fixed.setdefault(ch, "")
+        entry["fixed"] = fixed
+    return dict(entry["fixed"])
 
-        # 특정 채널(들) - 표준명으로 매칭
-        target_channels = mapping_value  # 리스트
 
-        for target in target_channels:
-            # 타겟을 표준명으로 변환
-            target_standard = config.get_standard_channel_name(target)
+def resolve_channel_dropdown(channel_str: str, promo_type: str = "product") -> List[Tuple[str, object]]:
+    """
+    드롭다운 값을 채널 규칙으로 해석 (상품별 채널 정보 없이 값당 한 번만 계산)
 
-            # available_channels에서 표준명으로 검색
-            if target_standard in available_channels:
-                result[target_standard] = available_channels[target_standard]
+    parse_channel_dropdown과 같은 규칙이며, 벡터화 처리에서 상품 채널과 조인하는 용도
 
-        return result
+    Args:
+        channel_str: 드롭다운 값 (예: "*전 채널", "SSG", "SSG, CJ몰")
+        promo_type: "product" 또는 "brand"
 
-    # === 브랜드 프로모션 (available_channels 없음) ===
-    else:
-        # 전체 채널 → 드롭다운 활성화된 채널만
-        if mapping_value == "ALL":
-            return {ch: "" for ch in enabled_channels}
-
-        # GS 제외
-        if mapping_value == "ALL_EXCEPT_GS":
-            return {
-                ch: "" for ch in enabled_channels
-                if ch != "GS Shop"
-            }
-
-        # 퀸잇 제외
-        if mapping_value == "ALL_EXCEPT_QUEENIT":
-            return {
-                ch: "" for ch in enabled_channels
-                if ch != "퀸잇"
-            }
-
-        # 특정 채널(들)
-        target_channels = mapping_value  # 리스트
-        result = {}
-        for ch in target_channels:
-            standard_ch = config.get_standard_channel_name(ch)
-            # 활성화된 채널인지 확인
-            if standard_ch in enabled_channels:
-                result[standard_ch] = ""
-        return result
\ No newline at end of file
+    Returns:
+        콤마로 나뉜 부분별 규칙 리스트 (순서 유지)
+        - ("ALL", 제외 채널 또는 None): 조회된/활성화된 전체 채널
+        - ("LIST", [표준_채널명, ...]): 특정 채널
+    """
+    entry = _dropdown_entry(channel_str, promo_type)
+    if entry is None:
+        return []
+    return [(kind, list(arg) if kind == "LIST" else arg) for kind, arg in entry["rules"]]
+
+
+def _linear_standard_channel_name(channel_name: str) -> str:
+    """기존 CHANNEL_MASTER 선형 검색 (벤치마크/검증용 기준 구현)"""
+    if not channel_name:
+        return channel_name
+
+    normalized = channel_name.strip().lower().replace(" ", "")
+    for standard, info in config.CHANNEL_MASTER.items():
+        if normalized == standard.lower().replace(" ", ""):
+            return standard
+        for field in ["dropdown_name", "api_key", "html_name", "uploader_name"]:
+            value = info.get(field, "")
+            if value and normalized == value.lower().replace(" ", ""):
+                return standard
+    return channel_name
+
+
+def benchmark_channel_lookup(n_lookups: int = 200000, seed: int = 0) -> Dict[str, float]:
+    """
+    채널명 조회 처리량 벤치마크 (선형 검색 vs 채널 레지스트리, 결과 동일성 검증 포함)
+
+    Args:
+        n_lookups: 조회 횟수 (API 키/HTML명/드롭다운명/미등록 값 혼합)
+        seed: 난수 시드
+
+    Returns:
+        {"linear": 초당 조회 수, "registry": 초당 조회 수, "speedup": 배}
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    names = [info[field] for info in config.CHANNEL_MASTER.values() for field in config.ChannelRegistry.ALIAS_FIELDS]
+    names += ["미등록 채널", "unknown"]
+    probes = [rng.choice(names) for _ in range(n_lookups)]
+
+    results = {}
+    throughput = {}
+    for label, func in [("linear", _linear_standard_channel_name),
+                        ("registry", config.get_standard_channel_name)]:
+        started = time.perf_counter()
+        results[label] = [func(name) for name in probes]
+        throughput[label] = n_lookups / (time.perf_counter() - started)
+
+    assert results["linear"] == results["registry"]
+    throughput["speedup"] = throughput["registry"] / throughput["linear"]
+
+    print(f"채널명 조회 {n_lookups:,}회 (결과 동일)")
+    print(f"  linear:   {throughput['linear']:,.0f}회/초")
+    print(f"  registry: {throughput['registry']:,.0f}회/초 ({throughput['speedup']:.1f}배)")
+    return throughput
+
+
+if __name__ == "__main__":
+    benchmark_channel_lookup()
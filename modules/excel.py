@@ -3,17 +3,434 @@
 xlsxwriter 사용 - Laravel Excel 완벽 호환
 """
 
+import sys
+from pathlib import Path
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
 import pandas as pd
 import os
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 import xlsxwriter
-from typing import List
+from typing import Callable, Dict, List, Optional, Tuple
+from pandas.api.types import (
+    is_bool_dtype,
+    is_integer_dtype,
+    is_numeric_dtype,
+    is_object_dtype,
+    is_string_dtype,
+)
+import config
+from modules.manifest import UploadManifest, content_hash
+
+
+# 그룹 키 (파일 단위로 분리되고 시트에는 쓰지 않음)
+GROUP_COLUMNS = ['시작일', '종료일', '채널명']
+
+# 정수로 기록하는 컬럼
+DISCOUNT_VALUE_COLUMNS = ['내부할인', '연동할인', '외부할인가', '할인', '할인2']
+RATE_COLUMNS = ['채널분담율', '브리치분담율', '입점사분담율']
+
+MAX_COLUMN_WIDTH = 50
 
+# 쓰기 계획/값 리스트를 만드는 행 단위 (큰 그룹도 Python 객체는 구간만큼만 생성)
+WRITE_CHUNK_ROWS = 10000
 
-def generate_upload_files(df: pd.DataFrame, output_dir: str, file_prefix: str = "상품") -> List[str]:
+
+class UploadFileGenerationError(Exception):
+    """일부 그룹의 파일 생성 실패 (나머지 파일은 생성됨)"""
+
+    def __init__(self, failures: List[Tuple[str, str]], generated_files: List[str],
+                 failed_rows: Optional[list] = None):
+        """
+        Args:
+            failures: [(파일명, 에러 메시지)]
+            generated_files: 정상 생성된 파일 경로 (그룹 순서)
+            failed_rows: 생성 실패 파일에 들어갈 df 행 인덱스
+        """
+        self.failures = failures
+        self.generated_files = generated_files
+        self.failed_rows = failed_rows or []
+        names = ", ".join(name for name, _ in failures)
+        super().__init__(f"{len(failures)}개 파일 생성 실패: {names}")
+
+
+def generate_upload_files(df: pd.DataFrame, output_dir: str, file_prefix: str = "상품",
+                          workers: Optional[int] = None,
+                          max_rows_per_file: Optional[int] = None,
+                          use_manifest: Optional[bool] = None,
+                          on_file: Optional[Callable[[str], None]] = None,
+                          manifest: Optional[UploadManifest] = None) -> List[str]:
     """
     채널별로 분리된 업로드 파일들 생성 (xlsxwriter 사용)
     
+    Args:
+        df: 출력 데이터 DataFrame (시작일, 종료일, 채널명 포함)
+        output_dir: 출력 디렉토리
+        file_prefix: 파일명 prefix ("상품" 또는 "브랜드")
+        workers: 동시 생성 프로세스 수 (None이면 config.EXCEL_WORKERS, 1이면 순차)
+        max_rows_per_file: 파일당 최대 행 수 (None이면 config.EXCEL_MAX_ROWS_PER_FILE,
+                           초과 그룹은 "_1of3" 형식의 번호 붙은 파트 파일로 분할, 0이면 분할 안 함)
+        use_manifest: 내용 해시가 같은 기존 파일은 다시 만들지 않음 (None이면 config.UPLOAD_MANIFEST)
+        on_file: 파일이 준비될 때마다 호출 (경로) - 완료 순서대로, 업로드 큐에 바로 넣는 용도
+        manifest: 업로드 단계와 공유할 매니페스트 (주면 use_manifest 무시, 생성 기록이 on_file보다 먼저 반영)
+    
+    Returns:
+        파일 경로 리스트 (그룹 순서, 같은 그룹의 파트는 번호 순, 재사용한 기존 파일 포함)
+
+    Raises:
+        UploadFileGenerationError: 일부 그룹 실패 (나머지 그룹은 모두 생성한 뒤 발생)
+    """
+    # 출력 디렉토리 생성
+    os.makedirs(output_dir, exist_ok=True)
+    
+    if max_rows_per_file is None:
+        max_rows_per_file = config.EXCEL_MAX_ROWS_PER_FILE
+
+    # (시작일, 종료일, 채널명)으로 그룹화, 큰 그룹은 파트로 분할
+    tasks = []
+    for (start_date, end_date, channel_name), group_df in df.groupby(GROUP_COLUMNS):
+        parts = _split_group(group_df, max_rows_per_file)
+        for part_no, part_df in enumerate(parts, start=1):
+            part = (part_no, len(parts)) if len(parts) > 1 else None
+            filename = _upload_filename(start_date, end_date, channel_name, len(part_df),
+                                        file_prefix, part)
+            tasks.append((os.path.join(output_dir, filename), part_df))
+
+    # 매니페스트: 같은 파일명 + 같은 내용 해시의 파일이 남아 있으면 재사용
+    if manifest is None:
+        if use_manifest is None:
+            use_manifest = config.UPLOAD_MANIFEST
+        manifest = UploadManifest(output_dir) if use_manifest else None
+    digests = {}
+    reused = set()
+    if manifest:
+        for idx, (filepath, group_df) in enumerate(tasks):
+            digests[idx] = content_hash(group_df, file_prefix)
+            if manifest.is_current(filepath, digests[idx]):
+                reused.add(idx)
+                print(f"  ↷ 변경 없음: {os.path.basename(filepath)}")
+                if on_file:
+                    on_file(filepath)
+    write_indexes = [idx for idx in range(len(tasks)) if idx not in reused]
+    write_tasks = [tasks[idx] for idx in write_indexes]
+
+    def file_written(write_idx: int):
+        filepath, group_df = write_tasks[write_idx]
+        if manifest:
+            manifest.record_generated(filepath, digests[write_indexes[write_idx]], len(group_df))
+        if on_file:
+            on_file(filepath)
+
+    if workers is None:
+        workers = config.EXCEL_WORKERS or os.cpu_count() or 1
+    workers = min(workers, len(write_tasks))
+
+    # 행 수가 많은 그룹은 스트리밍(constant_memory) 모드
+    write_options = {
+        "file_prefix": file_prefix,
+        "streaming_min_rows": config.EXCEL_STREAMING_MIN_ROWS,
+        "measure_memory": config.EXCEL_REPORT_MEMORY,
+    }
+
+    # 그룹이 여러 개이고 충분히 클 때만 프로세스 풀 (작은 작업은 프로세스 시작 비용이 더 큼)
+    if workers > 1 and sum(len(group_df) for _, group_df in write_tasks) >= config.EXCEL_PARALLEL_MIN_ROWS:
+        write_errors = _write_groups_parallel(write_tasks, write_options, workers, file_written)
+    else:
+        write_errors = {}
+        for idx, (filepath, group_df) in enumerate(write_tasks):
+            try:
+                result = _write_group(filepath, group_df, **write_options)
+                print(_generated_message(filepath, result))
+            except Exception as e:
+                write_errors[idx] = str(e)
+                print(f"  ✗ 생성 실패: {os.path.basename(filepath)} - {e}")
+                continue
+            file_written(idx)
+    errors = {write_indexes[idx]: msg for idx, msg in write_errors.items()}
+
+    if manifest:
+        manifest.save()
+
+    generated_files = [filepath for idx, (filepath, _) in enumerate(tasks) if idx not in errors]
+    if errors:
+        failures = [(os.path.basename(tasks[idx][0]), msg) for idx, msg in sorted(errors.items())]
+        failed_rows = [row for idx in sorted(errors) for row in tasks[idx][1].index]
+        raise UploadFileGenerationError(failures, generated_files, failed_rows)
+    
+    return generated_files
+
+
+def _write_groups_parallel(tasks: List[Tuple[str, pd.DataFrame]], write_options: Dict,
+                           workers: int, on_done: Optional[Callable[[int], None]] = None) -> Dict[int, str]:
+    """
+    그룹별 파일을 프로세스 풀에서 생성 (완료되는 순서대로 on_done(그룹 인덱스) 호출)
+
+    Returns:
+        {실패한 그룹 인덱스: 에러 메시지}
+    """
+    errors: Dict[int, str] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_write_group, filepath, group_df, **write_options): idx
+            for idx, (filepath, group_df) in enumerate(tasks)
+        }
+        for future in as_completed(futures):
+            idx = futures[future]
+            filename = os.path.basename(tasks[idx][0])
+            try:
+                print(_generated_message(tasks[idx][0], future.result()))
+            except Exception as e:
+                errors[idx] = str(e) or type(e).__name__
+                print(f"  ✗ 생성 실패: {filename} - {errors[idx]}")
+                continue
+            if on_done:
+                on_done(idx)
+    return errors
+
+
+def _write_group(filepath: str, group_df: pd.DataFrame, file_prefix: str,
+                 streaming_min_rows: Optional[int], measure_memory: bool) -> Tuple[bool, Optional[int]]:
+    """
+    그룹 1개 파일 생성 (프로세스 풀 작업 단위)
+
+    Returns:
+        (스트리밍 모드 여부, 피크 메모리 바이트 또는 None)
+    """
+    streaming = streaming_min_rows is not None and len(group_df) >= streaming_min_rows
+    peak = _write_upload_workbook(filepath, group_df, file_prefix,
+                                  streaming=streaming, measure_memory=measure_memory)
+    return streaming, peak
+
+
+def _generated_message(filepath: str, result: Tuple[bool, Optional[int]]) -> str:
+    streaming, peak = result
+    details = []
+    if streaming:
+        details.append("스트리밍")
+    if peak is not None:
+        details.append(f"피크 메모리 {peak / 1024 / 1024:.1f}MB")
+    suffix = f" ({', '.join(details)})" if details else ""
+    return f"  ✓ 생성: {os.path.basename(filepath)}{suffix}"
+
+
+def _split_group(group_df: pd.DataFrame, max_rows: Optional[int]) -> List[pd.DataFrame]:
+    """그룹을 max_rows 행 이하 파트로 분할 (행 순서 유지, max_rows 없으면 그대로)"""
+    if not max_rows or len(group_df) <= max_rows:
+        return [group_df]
+    return [group_df.iloc[start:start + max_rows] for start in range(0, len(group_df), max_rows)]
+
+
+def _upload_filename(start_date, end_date, channel_name: str, item_count: int, file_prefix: str,
+                     part: Optional[Tuple[int, int]] = None) -> str:
+    """
+    업로드 파일명 (uploader.parse_upload_filename / parse_upload_part와 짝)
+
+    분할 파일은 끝에 "_{파트}of{전체}" (예: 251101-251205_상품_SSG_20000_1of3.xlsx)
+    """
+    start_str = start_date.strftime('%y%m%d') if pd.notna(start_date) else '000000'
+    end_str = end_date.strftime('%y%m%d') if pd.notna(end_date) else '000000'
+    part_str = f"_{part[0]}of{part[1]}" if part else ""
+    return f"{start_str}-{end_str}_{file_prefix}_{channel_name}_{item_count}{part_str}.xlsx"
+
+
+def _to_int_values(series: pd.Series) -> pd.Series:
+    """
+    int(float(x)) 열 단위 변환 (빈 값/'' → 0)
+
+    숫자 dtype은 벡터 연산, 문자열 등 object 열만 값 단위 변환
+    """
+    if is_numeric_dtype(series):
+        return series.fillna(0).astype('int64')
+    return series.apply(
+        lambda x: int(float(x)) if pd.notna(x) and str(x) != '' else 0
+    )
+
+
+def _prepare_upload_frame(group_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    그룹 → 시트 데이터 (그룹 키 제외, 번호/할인/분담율 정수 변환)
+
+    상품번호는 숫자, 브랜드번호는 문자열 (비플로우 Laravel Excel 검증 기준)
+    """
+    columns_to_save = [col for col in group_df.columns if col not in GROUP_COLUMNS]
+    df_to_save = group_df[columns_to_save]
+    converted = {}
+
+    if '상품번호' in df_to_save.columns:
+        product_ids = df_to_save['상품번호']
+        if not is_integer_dtype(product_ids):
+            product_ids = product_ids.apply(lambda x: int(float(x)) if pd.notna(x) else None)
+        converted['상품번호'] = product_ids
+    elif '브랜드번호' in df_to_save.columns:
+        brand_ids = df_to_save['브랜드번호']
+        if is_integer_dtype(brand_ids):
+            brand_ids = brand_ids.astype(str).astype(object)
+        else:
+            brand_ids = brand_ids.apply(lambda x: str(int(float(x))) if pd.notna(x) else '')
+        converted['브랜드번호'] = brand_ids
+
+    for col in DISCOUNT_VALUE_COLUMNS + RATE_COLUMNS:
+        if col in df_to_save.columns:
+            converted[col] = _to_int_values(df_to_save[col])
+
+    return df_to_save.assign(**converted)
+
+
+def _max_str_length(series: pd.Series) -> int:
+    """값을 문자열로 바꿨을 때 최대 길이 (컬럼 너비 계산용)"""
+    if len(series) == 0:
+        return 0
+    if is_integer_dtype(series) or is_bool_dtype(series):
+        lengths = series.astype(str).str.len()
+    else:
+        lengths = series.map(str).str.len()
+    return int(lengths.max())
+
+
+def _column_plans(df_to_save: pd.DataFrame, worksheet, text_format, number_format, file_prefix: str) -> list:
+    """
+    컬럼별 기록 방식 결정 (셀마다 타입 판단하지 않도록 컬럼당 1회)
+
+    Returns:
+        [(컬럼 인덱스, 쓰기 함수, 값 리스트, 유효 여부 리스트 또는 None, 포맷)]
+    """
+    def write_int(row, col, value, cell_format):
+        worksheet.write_number(row, col, int(value), cell_format)
+
+    def write_str(row, col, value, cell_format):
+        worksheet.write_string(row, col, str(value), cell_format)
+
+    def write_auto(row, col, value, cell_format):
+        # 기타 컬럼: 숫자는 숫자, 나머지는 문자열
+        if isinstance(value, (int, float)):
+            worksheet.write_number(row, col, value, number_format)
+        else:
+            worksheet.write_string(row, col, str(value), text_format)
+
+    plans = []
+    for col_idx, col_name in enumerate(df_to_save.columns):
+        series = df_to_save[col_name]
+        valid = series.notna()
+
+        # A열 (상품번호/브랜드번호)
+        if col_idx == 0:
+            if file_prefix == "브랜드":
+                writer, cell_format = write_str, text_format
+            else:
+                writer, cell_format = write_int, number_format
+        # 타입 컬럼 (내부할인타입, 연동할인타입 등)
+        elif '타입' in col_name:
+            writer, cell_format = write_str, text_format
+        # 할인 값 / 분담율 컬럼
+        elif col_name in DISCOUNT_VALUE_COLUMNS or col_name in RATE_COLUMNS:
+            writer, cell_format = write_int, number_format
+        # 기타
+        elif is_numeric_dtype(series):
+            writer, cell_format = worksheet.write_number, number_format
+        else:
+            writer, cell_format = write_auto, None
+
+        # 값 단위 변환이 필요 없는 열은 xlsxwriter 메서드 직접 사용
+        if writer is write_int and is_integer_dtype(series):
+            writer = worksheet.write_number
+        elif writer is write_str and _is_string_column(series, valid):
+            writer = worksheet.write_string
+
+        plans.append((
+            col_idx,
+            writer,
+            series.tolist(),
+            None if valid.all() else valid.tolist(),
+            cell_format,
+        ))
+    return plans
+
+
+def _is_string_column(series: pd.Series, valid: pd.Series) -> bool:
+    """유효한 값이 모두 str인 열인지"""
+    if not (is_object_dtype(series) or is_string_dtype(series)):
+        return False
+    return all(isinstance(value, str) for value in series[valid].tolist())
+
+
+def _write_upload_workbook(filepath: str, group_df: pd.DataFrame, file_prefix: str,
+                           streaming: bool = False, measure_memory: bool = False) -> Optional[int]:
+    """
+    그룹 1개를 업로드 엑셀로 기록
+
+    셀 타입은 기존과 동일: 헤더/타입/브랜드번호는 문자열(@), 상품번호/할인/분담율은 숫자(0),
+    빈 값은 셀을 만들지 않음. 행 순서대로 기록해 공유 문자열 순서도 동일하게 유지
+
+    Args:
+        streaming: constant_memory 모드 (행을 바로 임시 파일로 내보내 시트 전체를 메모리에 두지 않음,
+                   문자열은 sharedStrings 대신 인라인 문자열로 기록)
+        measure_memory: tracemalloc으로 파일 생성 중 피크 메모리 측정
+
+    Returns:
+        피크 메모리 (바이트, measure_memory=False면 None)
+    """
+    started_tracing = False
+    if measure_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        tracemalloc.reset_peak()
+
+    try:
+        df_to_save = _prepare_upload_frame(group_df)
+        columns_to_save = list(df_to_save.columns)
+
+        workbook = xlsxwriter.Workbook(filepath, {
+            'strings_to_numbers': False,
+            'strings_to_urls': False,
+            'strings_to_formulas': False,
+            'constant_memory': streaming  # False: sharedStrings 사용
+        })
+        worksheet = workbook.add_worksheet()
+        
+        # 포맷 정의
+        text_format = workbook.add_format({'num_format': '@'})  # 텍스트
+        number_format = workbook.add_format({'num_format': '0'})  # 숫자
+        
+        # 헤더 작성
+        for col_idx, col_name in enumerate(columns_to_save):
+            worksheet.write_string(0, col_idx, col_name, text_format)
+        
+        # 데이터 작성 (구간별로 컬럼 쓰기 함수를 정하고 행 순서대로, 너비용 최대 길이도 함께 계산)
+        max_lengths = [len(col_name) for col_name in columns_to_save]
+        for chunk_start in range(0, len(df_to_save), WRITE_CHUNK_ROWS):
+            chunk = df_to_save.iloc[chunk_start:chunk_start + WRITE_CHUNK_ROWS]
+            plans = _column_plans(chunk, worksheet, text_format, number_format, file_prefix)
+            for row_offset in range(len(chunk)):
+                row_idx = chunk_start + row_offset + 1
+                for col_idx, writer, values, valid, cell_format in plans:
+                    if valid is None or valid[row_offset]:
+                        writer(row_idx, col_idx, values[row_offset], cell_format)
+
+            for col_idx, col_name in enumerate(columns_to_save):
+                max_lengths[col_idx] = max(max_lengths[col_idx], _max_str_length(chunk[col_name]))
+        
+        # 컬럼 너비 자동 조정
+        for col_idx, max_length in enumerate(max_lengths):
+            worksheet.set_column(col_idx, col_idx, min(max_length + 2, MAX_COLUMN_WIDTH))
+        
+        workbook.close()
+
+        if measure_memory:
+            return tracemalloc.get_traced_memory()[1]
+        return None
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def _generate_upload_files_cellwise(df: pd.DataFrame, output_dir: str, file_prefix: str = "상품") -> List[str]:
+    """
+    채널별로 분리된 업로드 파일들 생성 (셀 단위 기준 구현, 벤치마크/검증용)
+    
     Args:
         df: 출력 데이터 DataFrame (시작일, 종료일, 채널명 포함)
         output_dir: 출력 디렉토리
@@ -141,11 +558,139 @@ def generate_upload_files(df: pd.DataFrame, output_dir: str, file_prefix: str =
         workbook.close()
         
         generated_files.append(filepath)
-        print(f"  ✓ 생성: {filename}")
     
     return generated_files
 
 
+def benchmark_generate_upload_files(n_rows: int = 50000, seed: int = 0) -> dict:
+    """
+    업로드 파일 생성 벤치마크 (셀 단위 기준 구현 vs 컬럼 단위, 파일 내용 동일성 검증 포함)
+
+    Args:
+        n_rows: 단일 채널 그룹 행 수
+        seed: 난수 시드
+
+    Returns:
+        {"cellwise": 초, "columnar": 초, "speedup": 배}
+    """
+    import io
+    import time
+    import zipfile
+    import tempfile
+    import contextlib
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        '시작일': pd.Timestamp('2025-11-01'),
+        '종료일': pd.Timestamp('2025-12-05'),
+        '채널명': 'SSG',
+        '상품번호': rng.integers(100_000_000, 999_999_999, n_rows),
+        '내부할인타입': rng.choice(['P', 'W'], n_rows).astype(object),
+        '내부할인': rng.choice([10.0, 17.0, 3000.0], n_rows),
+        '연동할인타입': 'P',
+        '연동할인': 0,
+        '외부할인타입': 'P',
+        '외부할인가': 0,
+        '채널분담율': 0,
+        '브리치분담율': 0,
+        '입점사분담율': 100,
+    })
+
+    # 스트리밍/파트 분할 기준과 무관하게 같은 (sharedStrings) 형식의 단일 파일끼리 비교
+    def columnar(df, out_dir, file_prefix):
+        os.makedirs(out_dir, exist_ok=True)
+        path = os.path.join(out_dir, "columnar.xlsx")
+        _write_upload_workbook(path, df, file_prefix)
+        return [path]
+
+    timings = {}
+    files = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, func in [("cellwise", _generate_upload_files_cellwise),
+                           ("columnar", columnar)]:
+            out_dir = os.path.join(tmp_dir, name)
+            with contextlib.redirect_stdout(io.StringIO()):
+                started = time.perf_counter()
+                paths = func(df, out_dir, "상품")
+                timings[name] = time.perf_counter() - started
+            # 생성 시각이 들어가는 docProps/core.xml 외 모든 파트 비교
+            with zipfile.ZipFile(paths[0]) as zf:
+                files[name] = {n: zf.read(n) for n in zf.namelist() if n != "docProps/core.xml"}
+
+    assert files["cellwise"] == files["columnar"], "생성 파일 내용이 다름"
+    timings["speedup"] = timings["cellwise"] / timings["columnar"]
+
+    print(f"업로드 파일 생성 {n_rows:,}행 (파일 내용 동일)")
+    print(f"  cellwise: {timings['cellwise']:.2f}초")
+    print(f"  columnar: {timings['columnar']:.2f}초 ({timings['speedup']:.1f}배)")
+    return timings
+
+
+def benchmark_parallel_generation(n_groups: int = 8, rows_per_group: int = 5000,
+                                  workers: Optional[int] = None, seed: int = 0) -> dict:
+    """
+    그룹별 파일 생성 순차 vs 프로세스 풀 비교 (파일 순서/내용 동일성 검증 포함)
+
+    Args:
+        n_groups: 날짜 구간 그룹 수 (채널 1개)
+        rows_per_group: 그룹당 행 수
+        workers: 프로세스 수 (None이면 CPU 코어 수)
+
+    Returns:
+        {"sequential": 초, "parallel": 초, "speedup": 배}
+    """
+    import io
+    import time
+    import zipfile
+    import tempfile
+    import contextlib
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    n_rows = n_groups * rows_per_group
+    start_dates = pd.date_range('2025-11-01', periods=n_groups, freq='D')
+    df = pd.DataFrame({
+        '시작일': np.repeat(start_dates, rows_per_group),
+        '종료일': pd.Timestamp('2025-12-31'),
+        '채널명': 'SSG',
+        '상품번호': rng.integers(100_000_000, 999_999_999, n_rows),
+        '내부할인타입': 'P',
+        '내부할인': 17.0,
+        '연동할인타입': 'P',
+        '연동할인': 0,
+        '외부할인타입': 'P',
+        '외부할인가': 0,
+        '채널분담율': 0,
+        '브리치분담율': 0,
+        '입점사분담율': 100,
+    })
+    workers = workers or os.cpu_count() or 1
+
+    timings = {}
+    files = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, n_workers in [("sequential", 1), ("parallel", workers)]:
+            out_dir = os.path.join(tmp_dir, name)
+            with contextlib.redirect_stdout(io.StringIO()):
+                started = time.perf_counter()
+                paths = generate_upload_files(df, out_dir, "상품", workers=n_workers)
+                timings[name] = time.perf_counter() - started
+            files[name] = []
+            for path in paths:
+                with zipfile.ZipFile(path) as zf:
+                    parts = {n: zf.read(n) for n in zf.namelist() if n != "docProps/core.xml"}
+                files[name].append((os.path.basename(path), parts))
+
+    assert files["sequential"] == files["parallel"], "생성 파일 순서/내용이 다름"
+    timings["speedup"] = timings["sequential"] / timings["parallel"]
+
+    print(f"그룹 {n_groups}개 × {rows_per_group:,}행 (파일 순서/내용 동일)")
+    print(f"  sequential:          {timings['sequential']:.2f}초")
+    print(f"  parallel ({workers} workers): {timings['parallel']:.2f}초 ({timings['speedup']:.1f}배)")
+    return timings
+
+
 if __name__ == "__main__":
     # 테스트 - 상품 프로모션
     df_test_product = pd.DataFrame({
@@ -181,4 +726,9 @@ if __name__ == "__main__":
     })
     
     output_files = generate_upload_files(df_test_brand, '/home/claude/test_output', '브랜드')
-    print(f"\n브랜드 테스트 완료: {len(output_files)}개 파일 생성")
\ No newline at end of file
+    print(f"\n브랜드 테스트 완료: {len(output_files)}개 파일 생성")
+
+    # 벤치마크
+    print()
+    benchmark_generate_upload_files()
+    benchmark_parallel_generation()
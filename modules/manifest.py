@@ -0,0 +1,111 @@
+"""
+업로드 파일 매니페스트 모듈
+그룹 행 데이터의 내용 해시와 업로드 결과를 기록해 변경 없는 파일은 재생성/재업로드하지 않음
+"""
+
+import sys
+from pathlib import Path
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+import os
+import json
+import hashlib
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+import pandas as pd
+import config
+
+
+# 해시 규칙이나 파일 형식이 바뀌면 올려서 기존 기록 무효화
+MANIFEST_VERSION = 1
+
+
+def content_hash(group_df: pd.DataFrame, file_prefix: str) -> str:
+    """
+    그룹 행 데이터의 내용 해시 (행 순서/컬럼/값이 같으면 같은 해시)
+
+    Returns:
+        sha256 hex 문자열
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{MANIFEST_VERSION}|{file_prefix}|".encode("utf-8"))
+    digest.update("\x1f".join(map(str, group_df.columns)).encode("utf-8"))
+    row_hashes = pd.util.hash_pandas_object(group_df, index=False)
+    digest.update(row_hashes.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class UploadManifest:
+    """
+    OUTPUT_DIR별 매니페스트 ({파일명: {hash, rows, generated_at, uploaded, uploaded_at}})
+
+    같은 파일명은 같은 (기간, 타입, 채널, 행 수, 파트)이므로 파일명 + 해시로 동일 파일 판단
+    """
+
+    def __init__(self, output_dir: str, filename: Optional[str] = None):
+        self.path = os.path.join(output_dir, filename or config.UPLOAD_MANIFEST_FILENAME)
+        self._lock = threading.Lock()
+        self.files: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"⚠️  매니페스트 로드 실패: {e}")
+            return {}
+        if data.get("version") != MANIFEST_VERSION:
+            return {}
+        return data.get("files", {})
+
+    def save(self):
+        """매니페스트 저장 (임시 파일에 쓴 뒤 교체)"""
+        with self._lock:
+            data = {
+                "version": MANIFEST_VERSION,
+                "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "files": self.files,
+            }
+            tmp_path = f"{self.path}.tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                print(f"⚠️  매니페스트 저장 실패: {e}")
+
+    def is_current(self, file_path: str, digest: str) -> bool:
+        """같은 내용으로 생성된 파일이 디스크에 남아 있는지"""
+        entry = self.files.get(os.path.basename(file_path))
+        return bool(entry) and entry.get("hash") == digest and os.path.exists(file_path)
+
+    def is_uploaded(self, file_path: str) -> bool:
+        """현재 파일 내용 그대로 업로드 성공한 적이 있는지"""
+        entry = self.files.get(os.path.basename(file_path))
+        return bool(entry) and entry.get("uploaded", False) and os.path.exists(file_path)
+
+    def record_generated(self, file_path: str, digest: str, rows: int):
+        """새로 생성한 파일 기록 (내용이 바뀌었으면 업로드 기록 초기화)"""
+        filename = os.path.basename(file_path)
+        with self._lock:
+            entry = self.files.get(filename, {})
+            if entry.get("hash") != digest:
+                entry = {"hash": digest, "rows": rows, "uploaded": False}
+            entry["generated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.files[filename] = entry
+
+    def record_upload(self, file_path: str, success: bool):
+        """업로드 결과 기록 (매니페스트에 없는 파일은 무시)"""
+        filename = os.path.basename(file_path)
+        with self._lock:
+            entry = self.files.get(filename)
+            if entry is None:
+                return
+            entry["uploaded"] = success
+            if success:
+                entry["uploaded_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.save()
@@ -9,14 +9,173 @@ from pathlib import Path
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.append(str(Path(__file__).parent.parent))
 
+import numpy as np
 import pandas as pd
-from typing import Dict
-from modules.channels import parse_channel_dropdown
+from typing import Dict, Optional
+import config
+from modules.channels import parse_channel_dropdown, resolve_channel_dropdown, dropdown_cache_stats
+
+
+# 상품 프로모션 업로드 양식 (13개 컬럼)
+PRODUCT_OUTPUT_COLUMNS = [
+    '시작일',
+    '종료일',
+    '채널명',
+    '상품번호',
+    '내부할인타입',
+    '내부할인',
+    '연동할인타입',
+    '연동할인',
+    '외부할인타입',
+    '외부할인가',
+    '채널분담율',
+    '브리치분담율',
+    '입점사분담율'
+]
+
+# 브랜드 프로모션 업로드 양식 (9개 컬럼)
+BRAND_OUTPUT_COLUMNS = [
+    '시작일',
+    '종료일',
+    '채널명',
+    '브랜드번호',
+    '할인타입',
+    '할인',
+    '채널분담율',
+    '브리치분담율',
+    '입점사분담율'
+]
 
 
 def process_product_promotion(df_input: pd.DataFrame, channel_mappings: Dict) -> pd.DataFrame:
     """
-    상품 프로모션 데이터 처리
+    상품 프로모션 데이터 처리 (벡터화)
+
+    드롭다운 값마다 채널 규칙을 한 번만 해석하고, 채널 매핑을 (상품, 채널, 채널상품번호)
+    long 테이블로 펼쳐 조인 → 행 단위 Python 루프 없이 _process_product_promotion_iterrows와
+    같은 행/순서/값을 생성
+
+    Args:
+        df_input: K~R열 DataFrame
+        channel_mappings: {상품번호: {채널명: 채널상품번호}}
+
+    Returns:
+        product_promotion_upload 형식의 DataFrame
+    """
+    # CHANNEL_MASTER가 실행 중 바뀌었으면 채널 레지스트리/드롭다운 캐시 갱신
+    config.refresh_channel_registry()
+
+    # 설정일이 없는 상품만 처리
+    df_to_process = df_input[df_input["설정일"].isna()]
+
+    print(f"  디버그: df_input 전체 {len(df_input)}개, 설정일 없음 {len(df_to_process)}개")
+
+    if df_to_process.empty:
+        return pd.DataFrame([], columns=PRODUCT_OUTPUT_COLUMNS)
+
+    rows = pd.DataFrame({
+        "_row": np.arange(len(df_to_process)),
+        "상품번호": df_to_process["상품번호"].astype("int64").to_numpy(),
+        "채널": df_to_process["채널"].to_numpy(),
+    })
+
+    # 채널 매핑 → long 테이블 (입력에 있는 상품만)
+    product_ids = rows["상품번호"].unique().tolist()
+    long_rows = [
+        (pid, channel_name, pos)
+        for pid in product_ids if pid in channel_mappings
+        for pos, channel_name in enumerate(channel_mappings[pid])
+    ]
+    df_channels = pd.DataFrame(long_rows, columns=["상품번호", "_channel", "_channel_pos"]).astype(
+        {"상품번호": "int64", "_channel_pos": "int64"}
+    )
+
+    missing = ~rows["상품번호"].isin([pid for pid in product_ids if pid in channel_mappings])
+    if missing.any():
+        print(f"  ✗ 채널 매핑 정보 없음: {rows.loc[missing, '상품번호'].nunique()}개 상품")
+
+    # 드롭다운 값별 규칙 (값당 1회 해석)
+    all_rules, list_rules = [], []
+    for value in rows["채널"].drop_duplicates():
+        for part_no, (kind, arg) in enumerate(resolve_channel_dropdown(value, "product")):
+            if kind == "ALL":
+                all_rules.append((value, part_no, arg or ""))
+            else:
+                list_rules.extend((value, part_no, ch, pos) for pos, ch in enumerate(arg))
+
+    df_all_rules = pd.DataFrame(all_rules, columns=["채널", "_part", "_exclude"]).astype({"_part": "int64"})
+    df_list_rules = pd.DataFrame(list_rules, columns=["채널", "_part", "_channel", "_rank"]).astype(
+        {"_part": "int64", "_rank": "int64"}
+    )
+
+    # 전체 채널 규칙: 상품의 모든 채널 (제외 채널 빼고), 조회된 채널 순서 유지
+    matched_all = rows.merge(df_all_rules, on="채널").merge(df_channels, on="상품번호")
+    matched_all = matched_all[matched_all["_channel"] != matched_all["_exclude"]]
+    matched_all = matched_all.rename(columns={"_channel_pos": "_rank"})
+
+    # 특정 채널 규칙: 조회된 채널에 있는 것만, 드롭다운 순서 유지
+    matched_list = rows.merge(df_list_rules, on="채널").merge(
+        df_channels[["상품번호", "_channel"]], on=["상품번호", "_channel"]
+    )
+
+    # 콤마 값은 앞 부분에서 먼저 나온 채널 우선 (dict.update 순서와 동일)
+    keys = ["_row", "_part", "_rank", "_channel"]
+    matched = pd.concat([matched_all[keys], matched_list[keys]], ignore_index=True)
+    matched = matched.sort_values(["_row", "_part", "_rank"], kind="stable")
+    matched = matched.drop_duplicates(["_row", "_channel"])
+
+    if matched.empty:
+        return pd.DataFrame([], columns=PRODUCT_OUTPUT_COLUMNS)
+
+    source = df_to_process.iloc[matched["_row"].to_numpy()].reset_index(drop=True)
+    discount_type = source["내부할인타입"] if "내부할인타입" in source.columns else pd.Series("", index=source.index)
+    discount_value = _normalize_discount(source.get("내부할인"), discount_type, len(source))
+
+    df_output = pd.DataFrame({
+        '시작일': source.get("시작일"),
+        '종료일': source.get("종료일"),
+        '채널명': matched["_channel"].to_numpy(),
+        '상품번호': rows["상품번호"].to_numpy()[matched["_row"].to_numpy()],
+        '내부할인타입': discount_type,
+        '내부할인': discount_value,
+        '연동할인타입': discount_type,
+        '연동할인': 0,
+        '외부할인타입': discount_type,
+        '외부할인가': 0,
+        '채널분담율': 0,
+        '브리치분담율': 0,
+        '입점사분담율': 100,
+    }, columns=PRODUCT_OUTPUT_COLUMNS)
+
+    return df_output.infer_objects()
+
+
+def _normalize_discount(raw: Optional[pd.Series], discount_type: pd.Series, length: int) -> pd.Series:
+    """
+    할인값 열 단위 정규화 (_create_product_row/_create_brand_row와 동일 규칙)
+
+    - 빈 값 → 0, 타입 P이고 0 < x < 1이면 ×100
+    - 모든 값이 빈 값이면 정수 0 열 (행 단위 생성 시 dtype과 동일)
+    """
+    if raw is None:
+        values = pd.Series(0.0, index=discount_type.index)
+        all_missing = False
+    else:
+        values = pd.to_numeric(raw).astype("float64")
+        all_missing = bool(values.isna().all()) and length > 0
+        values = values.fillna(0.0)
+
+    is_fraction_percent = (discount_type == 'P') & (values > 0) & (values < 1)
+    values = values.where(~is_fraction_percent, values * 100)
+
+    if all_missing:
+        return values.astype("int64")
+    return values
+
+
+def _process_product_promotion_iterrows(df_input: pd.DataFrame, channel_mappings: Dict) -> pd.DataFrame:
+    """
+    상품 프로모션 데이터 처리 (행 단위 기준 구현, 벤치마크/검증용)
     
     Args:
         df_input: K~R열 DataFrame
@@ -62,28 +221,77 @@ def process_product_promotion(df_input: pd.DataFrame, channel_mappings: Dict) ->
             output_rows.append(output_row)
     
     # DataFrame 생성
-    df_output = pd.DataFrame(output_rows, columns=[
-        '시작일',
-        '종료일',
-        '채널명',
-        '상품번호',
-        '내부할인타입',
-        '내부할인',
-        '연동할인타입',
-        '연동할인',
-        '외부할인타입',
-        '외부할인가',
-        '채널분담율',
-        '브리치분담율',
-        '입점사분담율'
-    ])
+    df_output = pd.DataFrame(output_rows, columns=PRODUCT_OUTPUT_COLUMNS)
     
     return df_output
 
 
 def process_brand_promotion(df_input: pd.DataFrame) -> pd.DataFrame:
     """
-    브랜드 프로모션 데이터 처리
+    브랜드 프로모션 데이터 처리 (벡터화)
+
+    드롭다운 값마다 채널 리스트를 한 번만 펼치고 브랜드 행과 조인
+    → _process_brand_promotion_iterrows와 같은 행/순서/값을 생성
+
+    Args:
+        df_input: A~I열 DataFrame
+
+    Returns:
+        brand_promotion_upload 형식의 DataFrame
+    """
+    # CHANNEL_MASTER가 실행 중 바뀌었으면 채널 레지스트리/드롭다운 캐시 갱신
+    config.refresh_channel_registry()
+
+    # 설정일이 없는 브랜드만 처리
+    df_to_process = df_input[df_input["설정일"].isna()]
+
+    print(f"  디버그: df_input 전체 {len(df_input)}개, 설정일 없음 {len(df_to_process)}개")
+
+    if df_to_process.empty:
+        return pd.DataFrame([], columns=BRAND_OUTPUT_COLUMNS)
+
+    rows = pd.DataFrame({
+        "_row": np.arange(len(df_to_process)),
+        "채널": df_to_process["채널"].to_numpy(),
+    })
+
+    # 드롭다운 값별 채널 리스트 (브랜드는 API 조회 없이 활성화 채널 기준)
+    expansion = [
+        (value, pos, channel_name)
+        for value in rows["채널"].drop_duplicates()
+        for pos, channel_name in enumerate(
+            parse_channel_dropdown(value, available_channels=None, promo_type="brand")
+        )
+    ]
+    df_expansion = pd.DataFrame(expansion, columns=["채널", "_pos", "_channel"]).astype({"_pos": "int64"})
+
+    matched = rows.merge(df_expansion, on="채널").sort_values(["_row", "_pos"], kind="stable")
+
+    if matched.empty:
+        return pd.DataFrame([], columns=BRAND_OUTPUT_COLUMNS)
+
+    source = df_to_process.iloc[matched["_row"].to_numpy()].reset_index(drop=True)
+    discount_type = source["할인타입"] if "할인타입" in source.columns else pd.Series("", index=source.index)
+    discount_value = _normalize_discount(source.get("할인"), discount_type, len(source))
+
+    df_output = pd.DataFrame({
+        '시작일': source.get("시작일"),
+        '종료일': source.get("종료일"),
+        '채널명': matched["_channel"].to_numpy(),
+        '브랜드번호': source["브랜드번호"].astype("int64"),
+        '할인타입': discount_type,
+        '할인': discount_value,
+        '채널분담율': 0,
+        '브리치분담율': 0,
+        '입점사분담율': 100,
+    }, columns=BRAND_OUTPUT_COLUMNS)
+
+    return df_output.infer_objects()
+
+
+def _process_brand_promotion_iterrows(df_input: pd.DataFrame) -> pd.DataFrame:
+    """
+    브랜드 프로모션 데이터 처리 (행 단위 기준 구현, 벤치마크/검증용)
     
     Args:
         df_input: A~I열 DataFrame
@@ -115,17 +323,7 @@ def process_brand_promotion(df_input: pd.DataFrame) -> pd.DataFrame:
             output_rows.append(output_row)
     
     # DataFrame 생성
-    df_output = pd.DataFrame(output_rows, columns=[
-        '시작일',
-        '종료일',
-        '채널명',
-        '브랜드번호',
-        '할인타입',
-        '할인',
-        '채널분담율',
-        '브리치분담율',
-        '입점사분담율'
-    ])
+    df_output = pd.DataFrame(output_rows, columns=BRAND_OUTPUT_COLUMNS)
     
     return df_output
 
@@ -228,6 +426,107 @@ def _create_brand_row(input_row: pd.Series, channel_name: str, brand_id: int) ->
     return row
 
 
+def _benchmark(label: str, n_rows: int, reference, vectorized, args: tuple, repeat: int) -> Dict[str, float]:
+    """행 단위 기준 구현과 벡터화 구현 시간 비교 (결과 동일성 검증 포함, 부동소수 값도 정확히 일치해야 함)"""
+    import io
+    import time
+    import contextlib
+
+    timings = {}
+    outputs = {}
+    for name, func in [("iterrows", reference), ("vectorized", vectorized)]:
+        best = float("inf")
+        for _ in range(repeat):
+            with contextlib.redirect_stdout(io.StringIO()):
+                started = time.perf_counter()
+                outputs[name] = func(*args)
+                best = min(best, time.perf_counter() - started)
+        timings[name] = best
+
+    pd.testing.assert_frame_equal(outputs["iterrows"], outputs["vectorized"], check_exact=True)
+    timings["speedup"] = timings["iterrows"] / timings["vectorized"]
+
+    print(f"{label} {n_rows:,}행 → 출력 {len(outputs['vectorized']):,}행 (결과 동일)")
+    print(f"  iterrows:   {timings['iterrows']:.3f}초")
+    print(f"  vectorized: {timings['vectorized']:.3f}초 ({timings['speedup']:.1f}배)")
+    return timings
+
+
+def benchmark_product_promotion(n_rows: int = 20000, repeat: int = 3, seed: int = 0) -> Dict[str, float]:
+    """
+    상품 프로모션 처리 벤치마크 (행 단위 기준 구현 vs 벡터화, 결과 동일성 검증 포함)
+
+    Args:
+        n_rows: 합성 입력 행 수
+        repeat: 반복 횟수 (최소 시간 사용)
+        seed: 난수 시드
+
+    Returns:
+        {"iterrows": 초, "vectorized": 초, "speedup": 배}
+    """
+    rng = np.random.default_rng(seed)
+    channels = config.get_enabled_channels("product")
+    dropdowns = ["*전 채널", "*전 채널 (gs제외)", "*전 채널 (퀸잇제외)", "SSG, CJ몰"] + [
+        config.CHANNEL_MASTER[ch]["dropdown_name"] for ch in channels
+    ]
+
+    product_ids = rng.integers(100_000_000, 999_999_999, n_rows)
+    df_input = pd.DataFrame({
+        '시작일': pd.Timestamp('2025-11-01'),
+        '종료일': pd.Timestamp('2025-12-05'),
+        '상품번호': product_ids,
+        '내부할인타입': rng.choice(['P', 'W'], n_rows),
+        '내부할인': rng.choice([0.1, 0.15, 0.29, 17, 5000, np.nan], n_rows),
+        '채널': rng.choice(dropdowns, n_rows),
+        '추가설명': '',
+        '설정일': None,
+    })
+    channel_mappings = {
+        int(pid): {ch: str(1000000000 + i) for i, ch in enumerate(channels) if rng.random() < 0.7}
+        for pid in np.unique(product_ids)
+    }
+
+    return _benchmark(
+        "상품 프로모션", n_rows, _process_product_promotion_iterrows, process_product_promotion,
+        (df_input, channel_mappings), repeat,
+    )
+
+
+def benchmark_brand_promotion(n_rows: int = 20000, repeat: int = 3, seed: int = 0) -> Dict[str, float]:
+    """
+    브랜드 프로모션 처리 벤치마크 (행 단위 기준 구현 vs 벡터화, 결과 동일성 검증 포함)
+
+    Args:
+        n_rows: 합성 입력 행 수
+        repeat: 반복 횟수 (최소 시간 사용)
+        seed: 난수 시드
+
+    Returns:
+        {"iterrows": 초, "vectorized": 초, "speedup": 배}
+    """
+    rng = np.random.default_rng(seed)
+    dropdowns = ["*전 채널", "*전 채널 (gs제외)", "*전 채널 (퀸잇제외)"] + [
+        config.CHANNEL_MASTER[ch]["dropdown_name"] for ch in config.get_enabled_channels("brand")
+    ]
+
+    df_input = pd.DataFrame({
+        '시작일': pd.Timestamp('2025-10-01'),
+        '종료일': pd.Timestamp('2025-10-31'),
+        '브랜드번호': rng.integers(1, 5000, n_rows),
+        '할인타입': rng.choice(['P', 'W'], n_rows),
+        '할인': rng.choice([0.1, 0.29, 15, 3000, np.nan], n_rows),
+        '할인2': 0,
+        '추가설명': '',
+        '채널': rng.choice(dropdowns, n_rows),
+        '설정일': None,
+    })
+
+    return _benchmark(
+        "브랜드 프로모션", n_rows, _process_brand_promotion_iterrows, process_brand_promotion,
+        (df_input,), repeat,
+    )
+
+
 if __name__ == "__main__":
     # 테스트
     
@@ -270,4 +569,12 @@ if __name__ == "__main__":
     
     df_output_brand = process_brand_promotion(df_test_brand)
     print(df_output_brand)
-    print(f"\n✅ 브랜드 행 수: {len(df_output_brand)} (예상: 1, SSG만)")
\ No newline at end of file
+    print(f"\n✅ 브랜드 행 수: {len(df_output_brand)} (예상: 1, SSG만)")
+
+    # 벤치마크
+    print("\n=== 벤치마크 ===")
+    benchmark_product_promotion()
+    benchmark_brand_promotion()
+
+    stats = dropdown_cache_stats()
+    print(f"드롭다운 캐시: 적중 {stats['hits']:,} / 미적중 {stats['misses']:,} ({stats['hit_rate']:.1%})")
@@ -10,27 +10,36 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional
 import requests
+from requests.adapters import HTTPAdapter
 import config
 
 
 class ProductAPIClient:
     """상품 채널 정보 조회 클라이언트"""
     
-    def __init__(self, api_base_url: str, timeout: int = 5):
+    def __init__(self, api_base_url: str, timeout: int = 5, max_workers: int = 1):
         """
         Args:
             api_base_url: 내부 API 베이스 URL (예: "http://192.168.0.10:10645")
             timeout: API 요청 타임아웃 (초)
+            max_workers: 동시 요청 수 (1이면 순차 조회)
         """
         if not api_base_url:
             raise ValueError("api_base_url은 필수입니다.")
 
         self.api_base_url = api_base_url.rstrip("/")
         self.timeout = timeout
+        self.max_workers = max(1, int(max_workers or 1))
         self.session = requests.Session()
 
+        # 동시 요청 수만큼 커넥션 풀 확보 (기본 10개 초과 시 커넥션 폐기 방지)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def query_products(self, product_ids: List[int]) -> Dict[int, Dict[str, str]]:
         """
         여러 상품에 대해 채널별 상품번호 조회
@@ -46,6 +55,9 @@ class ProductAPIClient:
                 }
             }
         """
+        if self.max_workers > 1 and len(product_ids) > 1:
+            return self._query_products_concurrent(product_ids)
+
         results: Dict[int, Dict[str, str]] = {}
         total = len(product_ids)
 
@@ -69,6 +81,48 @@ class ProductAPIClient:
 
         return results
 
+    def _query_products_concurrent(self, product_ids: List[int]) -> Dict[int, Dict[str, str]]:
+        """
+        스레드 풀을 사용한 동시 조회 (max_workers개까지 병렬 요청)
+
+        Args:
+            product_ids: BRICH 상품번호 리스트
+
+        Returns:
+            query_products와 동일한 형식 (입력 순서 유지)
+        """
+        total = len(product_ids)
+        print(f"  [API] {total}개 상품 동시 조회 (최대 {self.max_workers}개 병렬)...")
+
+        fetched: Dict[int, Dict[str, str]] = {}
+        done = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._query_single_product, product_id): product_id
+                for product_id in product_ids
+            }
+
+            for future in as_completed(futures):
+                product_id = futures[future]
+                done += 1
+
+                try:
+                    mapping = future.result()
+                except Exception as e:
+                    print(f"  [API] [{done}/{total}] 상품 {product_id} ✗ 오류: {e}")
+                    mapping = {}
+                else:
+                    if mapping:
+                        print(f"  [API] [{done}/{total}] 상품 {product_id} ✓ {len(mapping)}개 채널 발견")
+                    else:
+                        print(f"  [API] [{done}/{total}] 상품 {product_id} ✗ 채널 정보 없음")
+
+                fetched[product_id] = mapping
+
+        # 순차 조회와 같은 키 순서로 반환
+        return {product_id: fetched.get(product_id, {}) for product_id in product_ids}
+
     def _query_single_product(self, product_id: int) -> Dict[str, str]:
         """
         내부 API를 사용한 단일 상품 조회
@@ -85,18 +139,18 @@ class ProductAPIClient:
             resp = self.session.get(url, timeout=self.timeout)
             resp.raise_for_status()
         except requests.RequestException as e:
-            print(f"    ✗ API 요청 실패: {e}")
+            print(f"    ✗ 상품 {product_id} API 요청 실패: {e}")
             return {}
 
         try:
             data = resp.json()
         except ValueError:
-            print("    ✗ API 응답 JSON 파싱 실패")
+            print(f"    ✗ 상품 {product_id} API 응답 JSON 파싱 실패")
             return {}
 
         if str(data.get("code")) != "200":
             print(
-                f"    ✗ API 응답 코드 비정상: code={data.get('code')} / message={data.get('message')}"
+                f"    ✗ 상품 {product_id} API 응답 코드 비정상: code={data.get('code')} / message={data.get('message')}"
             )
             return {}
 
@@ -127,20 +181,12 @@ class ProductAPIClient:
         Returns:
             표준 채널명 (매칭 실패시 None)
         """
-        if not api_key:
-            return None
-
-        # CHANNEL_MASTER에서 api_key로 검색
-        for standard, info in config.CHANNEL_MASTER.items():
-            if api_key.strip().lower() == info["api_key"].lower():
-                return standard
-        
-        return None
+        return config.CHANNEL_REGISTRY.from_field("api_key", api_key)
 
 
 if __name__ == "__main__":
     # 테스트
-    client = ProductAPIClient("http://192.168.0.10:10645")
+    client = ProductAPIClient("http://192.168.0.10:10645", max_workers=config.API_MAX_WORKERS)
     
     test_products = [986269048]
     results = client.query_products(test_products)
@@ -11,24 +11,41 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from typing import Dict, List
 from modules.product_api import ProductAPIClient
-from modules.product_scraper import ProductWebScraper
+from modules.product_scraper import ProductScraperPool
+from modules.product_replay import ProductSearchReplayClient, SessionExpiredError
+from modules.channel_cache import ChannelMappingCache
 import config
 
 
 class HybridProductClient:
     """API와 웹 스크래핑을 결합한 상품 정보 조회 클라이언트"""
     
-    def __init__(self, api_base_url: str, email: str = None, password: str = None):
+    def __init__(self, api_base_url: str, email: str = None, password: str = None,
+                 api_max_workers: int = None, use_cache: bool = True,
+                 refresh_cache: bool = False):
         """
         Args:
             api_base_url: 내부 API 베이스 URL
             email: 비플로우 이메일 (웹 스크래핑용, 선택사항)
             password: 비플로우 비밀번호 (웹 스크래핑용, 선택사항)
+            api_max_workers: API 동시 요청 수 (기본: config.API_MAX_WORKERS)
+            use_cache: 채널 매핑 영구 캐시 사용 여부
+            refresh_cache: True면 캐시를 무시하고 전부 재조회 (결과는 캐시에 갱신)
         """
-        self.api_client = ProductAPIClient(api_base_url)
+        if api_max_workers is None:
+            api_max_workers = config.API_MAX_WORKERS
+        self.api_client = ProductAPIClient(api_base_url, max_workers=api_max_workers)
         self.scraper = None
+        self.replay = None
         self.email = email
         self.password = password
+        self.cache = None
+        self.refresh_cache = refresh_cache
+        if use_cache:
+            try:
+                self.cache = ChannelMappingCache()
+            except Exception as e:
+                print(f"⚠️  채널 캐시 열기 실패 - 캐시 없이 진행: {e}")
     
     def _normalize_channel_dict(self, channels: Dict[str, str]) -> Dict[str, str]:
         """
@@ -41,16 +58,45 @@ class HybridProductClient:
         Returns:
             {표준_채널명: 채널상품번호}
         """
-        normalized = {}
-        for ch_name, ch_id in channels.items():
-            standard_name = config.get_standard_channel_name(ch_name)
-            normalized[standard_name] = ch_id
-        
-        return normalized
+        standard_name = config.CHANNEL_REGISTRY.standard_name
+        return {standard_name(ch_name): ch_id for ch_name, ch_id in channels.items()}
     
-    def query_products(self, product_ids: List[int]) -> Dict[int, Dict[str, str]]:
+    def query_products(self, product_ids: List[int], refresh: bool = None) -> Dict[int, Dict[str, str]]:
         """
         여러 상품에 대해 채널별 상품번호 조회
+        0차: 영구 캐시 (TTL 이내)
+        1차: 캐시 미적중 상품 API 조회
+        2차: API 실패 시 웹 스크래핑 (자동)
+
+        Args:
+            product_ids: BRICH 상품번호 리스트
+            refresh: True면 캐시를 무시하고 재조회 (기본: 생성자의 refresh_cache)
+
+        Returns:
+            {상품번호: {표준_채널명: 채널상품번호}} 딕셔너리 (입력 순서 유지)
+        """
+        product_ids = list(product_ids)
+        if refresh is None:
+            refresh = self.refresh_cache
+
+        cached: Dict[int, Dict[str, str]] = {}
+        if self.cache is not None and not refresh:
+            cached = self.cache.get_many(product_ids)
+            print(f"\n[캐시] 적중 {len(cached)}개 / 미적중 {len(product_ids) - len(cached)}개")
+        elif self.cache is not None:
+            print("\n[캐시] 강제 갱신 - 전체 재조회")
+
+        to_query = [pid for pid in product_ids if pid not in cached]
+        fetched = self._query_remote(to_query) if to_query else {}
+
+        return {
+            pid: cached[pid] if pid in cached else fetched.get(pid, {})
+            for pid in product_ids
+        }
+
+    def _query_remote(self, product_ids: List[int]) -> Dict[int, Dict[str, str]]:
+        """
+        캐시에 없는 상품에 대해 채널별 상품번호 조회 (결과는 캐시에 저장)
         1차: API 시도
         2차: API 실패 시 웹 스크래핑 (자동)
         
@@ -72,6 +118,7 @@ class HybridProductClient:
             pid: self._normalize_channel_dict(channels)
             for pid, channels in api_results.items()
         }
+        self._cache_put(api_results, "api")
         
         # API 실패한 상품들 확인
         failed_products = [
@@ -94,14 +141,17 @@ class HybridProductClient:
         print("\n[2단계] 웹 스크래핑을 통한 재조회 자동 수행...")
 
         try:
-            if self.scraper is None:
-                self.scraper = ProductWebScraper(
-                    batch_size=20,
-                    headless=True,
-                )
-                self.scraper.login(self.email, self.password)
+            scraper_results = {}
+            scrape_targets = failed_products
+            
+            # 검색 API 직접 호출로 처리된 상품은 UI 스크래핑 생략
+            if config.PRODUCT_SEARCH_REPLAY:
+                scraper_results.update(self._query_replay(failed_products))
+                scrape_targets = [pid for pid in failed_products if pid not in scraper_results]
             
-            scraper_results = self.scraper.scrape_products(failed_products)
+            if scrape_targets:
+                self._ensure_scraper()
+                scraper_results.update(self.scraper.scrape_products(scrape_targets))
             
             # 스크래핑 결과도 이미 표준명으로 반환됨 (product_scraper에서 처리)
             # 추가 정규화는 검증 목적으로만 수행
@@ -109,6 +159,7 @@ class HybridProductClient:
                 pid: self._normalize_channel_dict(channels)
                 for pid, channels in scraper_results.items()
             }
+            self._cache_put(scraper_results, "scraper")
             
             # 결과 병합
             for product_id, channels in scraper_results.items():
@@ -126,10 +177,87 @@ class HybridProductClient:
         
         return api_results
     
+    def _ensure_scraper(self):
+        """스크래퍼 풀 생성 및 로그인 (최초 1회)"""
+        if self.scraper is None:
+            self.scraper = ProductScraperPool(
+                size=config.SCRAPER_POOL_SIZE,
+                batch_size=20,
+                headless=True,
+                capture_network=config.PRODUCT_SEARCH_REPLAY,
+            )
+            self.scraper.login(self.email, self.password)
+    
+    def _query_replay(self, product_ids: List[int]) -> Dict[int, Dict[str, str]]:
+        """
+        검색 XHR 재전송으로 조회 (브라우저 없이)
+        저장된 세션이 없거나 만료되면 로그인 세션에서 한 배치를 UI로 검색하며 요청을 캡처
+        
+        Returns:
+            처리된 상품의 결과 (빠진 상품은 UI 스크래핑 대상)
+        """
+        if self.replay is None:
+            self.replay = ProductSearchReplayClient()
+            if self.replay.load():
+                print("  ✓ 저장된 검색 API 세션 사용")
+        
+        covered: Dict[int, Dict[str, str]] = {}
+        remaining = list(product_ids)
+        
+        for _ in range(2):
+            if not self.replay.ready:
+                try:
+                    self._ensure_scraper()
+                except Exception as e:
+                    print(f"  ✗ 검색 API 캡처용 로그인 실패: {e}")
+                    return covered
+                
+                sample = remaining[:self.scraper.batch_size]
+                covered.update(self.replay.learn(self.scraper.primary, sample))
+                remaining = remaining[len(sample):]
+                
+                if not self.replay.ready or not remaining:
+                    return covered
+            
+            try:
+                replay_results = self.replay.query_products(remaining)
+            except SessionExpiredError as e:
+                print(f"  ⚠️ 검색 API 세션 만료: {e}")
+                self.replay.invalidate()
+                continue
+            
+            # 응답 구조를 해석하지 못한 경우 → UI 스크래핑에 맡김
+            if not any(replay_results.values()):
+                print("  ⚠️ 검색 API 응답에서 채널 정보를 찾지 못함 - UI 스크래핑으로 전환")
+                return covered
+            
+            # 채널 정보가 비어 있는 상품은 UI 스크래핑으로 다시 확인
+            found = {pid: channels for pid, channels in replay_results.items() if channels}
+            empty_count = len(replay_results) - len(found)
+            if empty_count:
+                print(f"  ↷ 검색 API 채널 정보 없음 {empty_count}개 → UI 스크래핑으로 확인")
+            covered.update(found)
+            return covered
+        
+        return covered
+    
+    def _cache_put(self, results: Dict[int, Dict[str, str]], source: str):
+        """조회 결과를 캐시에 저장 (캐시 오류는 조회 결과에 영향 없음)"""
+        if self.cache is None:
+            return
+        try:
+            self.cache.put_many(results, source)
+        except Exception as e:
+            print(f"  ⚠️  캐시 저장 실패: {e}")
+    
     def close(self):
         """리소스 정리"""
         if self.scraper:
             self.scraper.close()
+        if self.cache:
+            stats = self.cache.stats()
+            print(f"  [캐시] 누적 적중 {stats['hits']}개 / 미적중 {stats['misses']}개")
+            self.cache.close()
 
 
 if __name__ == "__main__":
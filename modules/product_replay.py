@@ -0,0 +1,513 @@
+"""
+비플로우 상품 검색 XHR 재전송 모듈
+Selenium으로 한 번 검색하며 SPA의 검색 API 요청을 캡처한 뒤,
+이후 조회는 브라우저 없이 requests.Session으로 직접 호출
+"""
+
+import sys
+from pathlib import Path
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+import json
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, quote_plus, urlsplit, urlunsplit, parse_qsl, urlencode
+import requests
+import config
+from modules.beeflow_session import (
+    SessionExpiredError,
+    STATE_LOCK,
+    load_session_state,
+    save_session_state,
+    filter_replay_headers,
+    read_response_json,
+    cookies_to_session,
+)
+
+
+# 캡처한 요청에서 상품번호 목록이 들어갈 자리
+IDS_PLACEHOLDER = "__BRICH_IDS__"
+
+# 한 페이지 결과 수를 배치 크기로 늘릴 파라미터 후보
+_PAGE_SIZE_KEYS = ("per_page", "perPage", "page_size", "pageSize", "limit", "size")
+
+# 채널 연동 상태로 볼 필드명 (부분 일치, 소문자)
+_STATUS_KEYS = ("status", "state", "result", "link", "sync", "연동", "상태")
+
+# 학습한 상태 값이 없을 때 연동 성공으로 인정할 상태 텍스트 (UI 스크래퍼와 동일)
+_LINKED_TEXT = "연동 성공"
+
+
+class ProductSearchReplayClient:
+    """캡처한 상품 검색 XHR을 재전송하는 브라우저 없는 조회 클라이언트"""
+
+    STATE_KEY = "product_search"
+
+    def __init__(self, batch_size: Optional[int] = None, session_path: Optional[str] = None,
+                 timeout: int = 30):
+        """
+        Args:
+            batch_size: 요청당 상품 수 (기본: config.REPLAY_BATCH_SIZE)
+            session_path: 세션 파일 경로 (기본: config.BEEFLOW_SESSION_PATH)
+            timeout: 요청 타임아웃 (초)
+        """
+        self.batch_size = batch_size or config.REPLAY_BATCH_SIZE
+        self.session_path = session_path
+        self.timeout = timeout
+        self.session: Optional[requests.Session] = None
+        self.template: Optional[Dict] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.session is not None and self.template is not None
+
+    def load(self) -> bool:
+        """저장된 쿠키 + 검색 요청 템플릿 복원"""
+        state = load_session_state(self.session_path)
+        cookies = state.get("cookies")
+        template = state.get(self.STATE_KEY)
+        # 상품번호 경로를 학습하지 않은 이전 템플릿은 다시 캡처
+        if not cookies or not template or not template.get("id_path"):
+            return False
+
+        self._activate(cookies, template)
+        return True
+
+    def invalidate(self):
+        """만료된 검색 템플릿 폐기 (세션 파일의 다른 항목 - 쿠키, 업로드 템플릿은 유지)"""
+        self.session = None
+        self.template = None
+        with STATE_LOCK:
+            state = load_session_state(self.session_path)
+            if state.pop(self.STATE_KEY, None) is not None:
+                save_session_state(state, self.session_path)
+
+    def learn(self, scraper, sample_ids: List[int]) -> Dict[int, Dict[str, str]]:
+        """
+        로그인된 스크래퍼로 한 배치를 UI 검색하면서 검색 XHR 캡처
+
+        Args:
+            scraper: capture_network=True로 생성되어 로그인된 ProductWebScraper
+            sample_ids: UI로 검색할 상품번호 (결과는 그대로 반환)
+
+        Returns:
+            UI 검색 결과 {상품번호: {표준_채널명: 채널상품번호}}
+        """
+        scraper.get_network_requests()  # 이전 로그 비우기
+        ui_results = scraper._scrape_batch(sample_ids)
+
+        template, request_id = self._build_template(scraper.get_network_requests(), sample_ids)
+        if template is None:
+            print("    ⚠️ 검색 API 요청을 찾지 못함 - UI 스크래핑 유지")
+            return ui_results
+
+        # 캡처한 응답에서 상품번호 경로/연동 상태 값을 학습하고 UI 결과와 같은지 확인
+        payload = read_response_json(scraper.driver, request_id)
+        if not self._learn_response(template, payload, sample_ids, ui_results):
+            print("    ⚠️ 검색 API 응답이 UI 결과와 다름 - UI 스크래핑 유지")
+            return ui_results
+
+        cookies = scraper.export_cookies()
+        self._activate(cookies, template)
+
+        with STATE_LOCK:
+            state = load_session_state(self.session_path)
+            state.update({"cookies": cookies, self.STATE_KEY: template})
+            save_session_state(state, self.session_path)
+
+        print(f"    ✓ 검색 API 캡처: {template['method']} {template['url'].split('?')[0]}")
+        return ui_results
+
+    def query_products(self, product_ids: List[int]) -> Dict[int, Dict[str, str]]:
+        """
+        검색 API 직접 호출로 채널 정보 조회
+
+        Raises:
+            SessionExpiredError: 쿠키 만료 / 로그인 페이지 응답
+        """
+        if not self.ready:
+            raise SessionExpiredError("검색 세션이 준비되지 않았습니다.")
+
+        results: Dict[int, Dict[str, str]] = {}
+        total = len(product_ids)
+
+        for start in range(0, total, self.batch_size):
+            batch = list(product_ids[start:start + self.batch_size])
+            print(f"  [검색 API] [{start + 1}-{start + len(batch)}/{total}] 조회 중...")
+
+            payload = self._request(batch)
+            found = extract_channel_mappings(payload, batch, self.template["id_path"],
+                                             self.template.get("status_markers"))
+
+            for pid in batch:
+                results[pid] = found.get(int(pid), {})
+
+            success_count = sum(1 for pid in batch if results[pid])
+            print(f"    ✓ {success_count}/{len(batch)}개 채널 정보 확인")
+
+        return results
+
+    def _activate(self, cookies: List[dict], template: Dict):
+        session = cookies_to_session(cookies)
+        session.headers.update(template.get("headers", {}))
+        self.session = session
+        self.template = template
+
+    def _request(self, batch: List[int]):
+        ids = [str(int(pid)) for pid in batch]
+        url, body = self._fill_template(ids)
+
+        try:
+            resp = self.session.request(
+                self.template["method"],
+                url,
+                data=body.encode("utf-8") if body is not None else None,
+                timeout=self.timeout,
+                allow_redirects=False,
+            )
+        except requests.RequestException as e:
+            raise SessionExpiredError(f"검색 API 요청 실패: {e}")
+
+        if resp.status_code in (301, 302, 303, 401, 403, 419):
+            raise SessionExpiredError(f"세션 만료 (HTTP {resp.status_code})")
+        resp.raise_for_status()
+
+        try:
+            return resp.json()
+        except ValueError:
+            # 로그인 페이지 HTML 등
+            raise SessionExpiredError("검색 API 응답이 JSON이 아닙니다.")
+
+    def _fill_template(self, ids: List[str]) -> tuple:
+        encoding = self.template["encoding"]
+        if encoding == "json_list_str":
+            replacement = json.dumps(ids)
+        elif encoding == "json_list_int":
+            replacement = json.dumps([int(i) for i in ids])
+        elif encoding == "percent":
+            replacement = quote(" ".join(ids))
+        elif encoding == "plus":
+            replacement = quote_plus(" ".join(ids))
+        else:
+            replacement = " ".join(ids)
+
+        placeholder = IDS_PLACEHOLDER
+        if encoding.startswith("json_list"):
+            placeholder = f'"{IDS_PLACEHOLDER}"'
+
+        url = self.template["url"].replace(placeholder, replacement)
+        body = self.template.get("post_data")
+        if body is not None:
+            body = body.replace(placeholder, replacement)
+        return url, body
+
+    @staticmethod
+    def _learn_response(template: Dict, payload, sample_ids: List[int],
+                        ui_results: Dict[int, Dict[str, str]]) -> bool:
+        """
+        캡처한 검색 응답에서 상품번호 필드 경로와 연동 성공 상태 값을 학습해 template에 기록
+
+        Returns:
+            학습한 규칙으로 응답을 해석한 결과가 샘플 UI 결과와 같으면 True
+        """
+        if payload is None:
+            return False
+
+        id_path = _learn_id_path(payload, sample_ids)
+        if id_path is None:
+            return False
+
+        entries = _extract_entries(payload, sample_ids, id_path)
+        markers = _learn_status_markers(entries, ui_results)
+        found = _linked_channels(entries, markers)
+        if any(found.get(int(pid), {}) != ui_results.get(pid, {}) for pid in sample_ids):
+            return False
+
+        template["id_path"] = list(id_path)
+        template["status_markers"] = [list(marker) for marker in markers]
+        return True
+
+    def _build_template(self, captured: List[dict], sample_ids: List[int]) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        캡처된 요청 중 상품번호 검색어가 들어간 요청을 템플릿으로 변환
+
+        Returns:
+            (템플릿, 캡처 요청 ID) - 찾지 못하면 (None, None)
+        """
+        ids = [str(int(pid)) for pid in sample_ids]
+        raw = " ".join(ids)
+        variants = [("raw", raw), ("percent", quote(raw)), ("plus", quote_plus(raw))]
+
+        # 마지막 검색 요청이 실제 결과 요청
+        for req in reversed(captured):
+            url = req["url"]
+            body = req.get("post_data")
+            headers = filter_replay_headers(req.get("headers"))
+
+            for encoding, text in variants:
+                if text in url or (body and text in body):
+                    return {
+                        "method": req["method"],
+                        "url": _widen_page_size(url.replace(text, IDS_PLACEHOLDER), self.batch_size),
+                        "post_data": body.replace(text, IDS_PLACEHOLDER) if body else body,
+                        "headers": headers,
+                        "encoding": encoding,
+                    }, req.get("request_id")
+
+            # JSON 바디에 상품번호 배열로 들어간 경우
+            if body:
+                try:
+                    parsed = json.loads(body)
+                except ValueError:
+                    continue
+                encoding = _replace_id_list(parsed, ids)
+                if encoding:
+                    _widen_json_page_size(parsed, self.batch_size)
+                    return {
+                        "method": req["method"],
+                        "url": _widen_page_size(url, self.batch_size),
+                        "post_data": json.dumps(parsed, ensure_ascii=False),
+                        "headers": headers,
+                        "encoding": encoding,
+                    }, req.get("request_id")
+
+        return None, None
+
+
+def _replace_id_list(node, ids: List[str]) -> Optional[str]:
+    """JSON에서 상품번호 배열을 찾아 placeholder로 교체 (교체한 형식 반환)"""
+    items = node.items() if isinstance(node, dict) else enumerate(node) if isinstance(node, list) else []
+    for key, value in items:
+        if isinstance(value, list) and value and [str(v) for v in value] == ids:
+            node[key] = IDS_PLACEHOLDER
+            return "json_list_int" if isinstance(value[0], int) else "json_list_str"
+        if isinstance(value, (dict, list)):
+            encoding = _replace_id_list(value, ids)
+            if encoding:
+                return encoding
+    return None
+
+
+def _widen_page_size(url: str, batch_size: int) -> str:
+    """URL 쿼리의 페이지 크기 파라미터를 배치 크기 이상으로"""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    changed = False
+    widened = []
+    for key, value in query:
+        if key in _PAGE_SIZE_KEYS and value.isdigit() and int(value) < batch_size:
+            value = str(batch_size)
+            changed = True
+        widened.append((key, value))
+    if not changed:
+        return url
+    # placeholder는 인코딩하지 않음
+    new_query = urlencode(widened, safe=IDS_PLACEHOLDER)
+    return urlunsplit(parts._replace(query=new_query))
+
+
+def _widen_json_page_size(body: Dict, batch_size: int):
+    if not isinstance(body, dict):
+        return
+    for key in _PAGE_SIZE_KEYS:
+        value = body.get(key)
+        if isinstance(value, int) and value < batch_size:
+            body[key] = batch_size
+
+
+def _as_int(value) -> Optional[int]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value.strip())
+    return None
+
+
+def _channel_of(name) -> Optional[str]:
+    """API 키/HTML명 등 → 표준 채널명 (CHANNEL_MASTER에 없으면 None)"""
+    if not isinstance(name, str) or not name:
+        return None
+    standard = config.CHANNEL_REGISTRY.standard_name(name)
+    return standard if standard in config.CHANNEL_REGISTRY.fields else None
+
+
+def _channel_product_id(value, product_id: int) -> Optional[str]:
+    """스크래퍼와 같은 규칙: 공백/하이픈 제거 후 8자리 이상 숫자"""
+    if value is None or isinstance(value, bool):
+        return None
+    clean = str(value).strip().replace(" ", "").replace("-", "")
+    if clean.isdigit() and len(clean) >= 8 and int(clean) != product_id:
+        return clean
+    return None
+
+
+def _status_fields(node: Dict) -> Dict:
+    """채널 항목의 연동 상태 필드 (스칼라 값만)"""
+    return {
+        str(k): v for k, v in node.items()
+        if isinstance(v, (str, int, float, bool)) and any(t in str(k).lower() for t in _STATUS_KEYS)
+    }
+
+
+def _path_value(node: Dict, path) -> Optional[int]:
+    for key in path:
+        if not isinstance(node, dict) or key not in node:
+            return None
+        node = node[key]
+    return _as_int(node)
+
+
+def _iter_dicts(node):
+    if isinstance(node, list):
+        for item in node:
+            yield from _iter_dicts(item)
+    elif isinstance(node, dict):
+        yield node
+        for value in node.values():
+            yield from _iter_dicts(value)
+
+
+def _learn_id_path(payload, sample_ids: List[int]) -> Optional[Tuple[str, ...]]:
+    """
+    응답 레코드에서 상품번호가 들어 있는 필드 경로 학습 (예: ("goodsNo",), ("product", "id"))
+
+    샘플 상품번호를 가장 많이 담은 경로 (같으면 짧은 경로, 먼저 나온 경로)
+    """
+    wanted = {int(pid) for pid in sample_ids}
+    hits: Dict[Tuple[str, ...], set] = {}
+    for node in _iter_dicts(payload):
+        for key, value in node.items():
+            paths = [((key,), value)]
+            if isinstance(value, dict):
+                paths.extend(((key, sub_key), sub_value) for sub_key, sub_value in value.items())
+            for path, leaf in paths:
+                pid = _as_int(leaf)
+                if pid in wanted:
+                    hits.setdefault(path, set()).add(pid)
+    if not hits:
+        return None
+    return max(hits, key=lambda path: (len(hits[path]), -len(path)))
+
+
+def _collect_channels(node, product_id: int, channels: Dict[str, tuple], depth: int = 0):
+    """채널 항목 수집 {표준_채널명: (채널상품번호, 상태 필드)}"""
+    if depth > 3:
+        return
+
+    if isinstance(node, list):
+        for item in node:
+            _collect_channels(item, product_id, channels, depth + 1)
+        return
+
+    if not isinstance(node, dict):
+        return
+
+    # 형태 1: {"ssg": "채널상품번호"} 또는 {"ssg": {"product_no": "채널상품번호", "status": ...}}
+    for key, value in node.items():
+        standard = _channel_of(key)
+        if not standard:
+            continue
+        statuses = {}
+        if isinstance(value, dict):
+            statuses = _status_fields(value)
+            value = next(
+                (v for k, v in value.items()
+                 if any(t in str(k).lower() for t in ("id", "no", "code"))
+                 and _channel_product_id(v, product_id)),
+                None,
+            )
+        channel_id = _channel_product_id(value, product_id) if not isinstance(value, list) else None
+        if channel_id:
+            channels.setdefault(standard, (channel_id, statuses))
+
+    # 형태 2: {"channel": "ssg", "channel_product_id": "...", "status": ...}
+    standard = None
+    for key, value in node.items():
+        key_lower = str(key).lower()
+        if any(k in key_lower for k in ("channel", "mall", "market")):
+            standard = standard or _channel_of(value)
+    if standard:
+        for key, value in node.items():
+            key_lower = str(key).lower()
+            if isinstance(value, (dict, list)) or not any(k in key_lower for k in ("id", "no", "code")):
+                continue
+            channel_id = _channel_product_id(value, product_id)
+            if channel_id:
+                channels.setdefault(standard, (channel_id, _status_fields(node)))
+                break
+
+    for value in node.values():
+        if isinstance(value, (dict, list)):
+            _collect_channels(value, product_id, channels, depth + 1)
+
+
+def _extract_entries(payload, product_ids: List[int], id_path) -> Dict[int, Dict[str, tuple]]:
+    """상품번호 경로(id_path) 값이 요청한 상품번호인 레코드에서 채널 항목 수집"""
+    wanted = {int(pid) for pid in product_ids}
+    id_path = tuple(id_path)
+    found: Dict[int, Dict[str, tuple]] = {}
+
+    def visit(node):
+        if isinstance(node, list):
+            for item in node:
+                visit(item)
+        elif isinstance(node, dict):
+            product_id = _path_value(node, id_path)
+            if product_id in wanted and product_id not in found:
+                channels: Dict[str, tuple] = {}
+                _collect_channels(node, product_id, channels)
+                found[product_id] = channels
+                return
+            for value in node.values():
+                visit(value)
+
+    visit(payload)
+    return found
+
+
+def _learn_status_markers(entries: Dict[int, Dict[str, tuple]],
+                          ui_results: Dict[int, Dict[str, str]]) -> List[tuple]:
+    """
+    연동 성공 상태 값 학습: UI가 연동 성공으로 읽은 채널 항목에 모두 있고
+    UI가 거른 채널 항목에는 없는 (필드, 값) 쌍
+    """
+    linked, unlinked = [], []
+    for pid, channels in entries.items():
+        for channel, (_, statuses) in channels.items():
+            pairs = set(statuses.items())
+            (linked if channel in ui_results.get(pid, {}) else unlinked).append(pairs)
+    if not linked:
+        return []
+    markers = set.intersection(*linked) - set().union(*unlinked)
+    return sorted(markers, key=str)
+
+
+def _is_linked(statuses: Dict, markers) -> bool:
+    """채널 항목이 연동 성공인지 (UI 스크래퍼의 '연동 성공' 셀만 인정과 같은 기준)"""
+    if markers:
+        return all(statuses.get(key) == value for key, value in markers)
+    # 학습한 값이 없으면 상태 필드가 없거나 '연동 성공' 텍스트인 항목만
+    return not statuses or any(_LINKED_TEXT in str(value) for value in statuses.values())
+
+
+def _linked_channels(entries: Dict[int, Dict[str, tuple]], markers) -> Dict[int, Dict[str, str]]:
+    return {
+        pid: {channel: channel_id for channel, (channel_id, statuses) in channels.items()
+              if _is_linked(statuses, markers)}
+        for pid, channels in entries.items()
+    }
+
+
+def extract_channel_mappings(payload, product_ids: List[int], id_path,
+                             status_markers=None) -> Dict[int, Dict[str, str]]:
+    """
+    검색 API JSON 응답 → {상품번호: {표준_채널명: 채널상품번호}}
+
+    응답 구조를 고정하지 않고, 학습한 상품번호 경로(id_path) 값이 요청한 상품번호인 레코드를 찾아
+    그 안의 채널 키(CHANNEL_MASTER 기준)와 채널상품번호를 추출
+    연동 성공 상태(status_markers, learn에서 학습)인 채널만 반환
+    """
+    markers = [tuple(marker) for marker in status_markers or []]
+    return _linked_channels(_extract_entries(payload, product_ids, id_path), markers)
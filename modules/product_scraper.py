@@ -7,14 +7,17 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
+import os
 import time
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import config
+from modules.beeflow_session import enable_network_capture, read_network_requests
 
 
 class ProductWebScraper:
@@ -27,17 +30,23 @@ class ProductWebScraper:
         driver: webdriver.Chrome = None,
         batch_size: int = 20,
         headless: bool = True,
+        capture_network: bool = False,
     ):
         self.driver = driver
         self.should_close_driver = False
         self.batch_size = batch_size
         self.headless = headless
+        self.capture_network = capture_network
 
         # ✅ CHANNEL_MASTER에서 html_name 순서대로 CHANNEL_ORDER 생성
         self.CHANNEL_ORDER = [
             info["html_name"] 
             for standard, info in config.CHANNEL_MASTER.items()
         ]
+        # HTML 채널명 → 표준 채널명 (셀마다 변환하지 않도록 미리 계산)
+        self.CHANNEL_STANDARD = [
+            config.CHANNEL_REGISTRY.standard_name(html_name) for html_name in self.CHANNEL_ORDER
+        ]
 
         if self.driver is None:
             self.should_close_driver = True
@@ -56,6 +65,10 @@ class ProductWebScraper:
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--window-size=1920,1080")
 
+        if self.capture_network:
+            # 검색 XHR 캡처용 (get_network_requests)
+            enable_network_capture(options)
+
         self.driver = webdriver.Chrome(options=options)
         self.wait = WebDriverWait(self.driver, 20)
     
@@ -110,6 +123,51 @@ class ProductWebScraper:
             print(f"  ✗ 로그인 실패: {e}")
             raise
     
+    def export_cookies(self) -> List[dict]:
+        """로그인된 세션 쿠키 반환 (다른 세션에 재사용)"""
+        return self.driver.get_cookies()
+    
+    def get_network_requests(self) -> List[dict]:
+        """
+        지금까지 브라우저가 보낸 XHR/fetch 요청 목록 (capture_network=True 필요)
+        
+        Returns:
+            [{"request_id", "url", "method", "headers", "post_data"}] - 호출 시 로그는 비워짐
+        """
+        if not self.capture_network:
+            return []
+        return read_network_requests(self.driver)
+    
+    def login_with_cookies(self, cookies: List[dict]) -> bool:
+        """
+        다른 세션에서 받은 쿠키로 로그인 (로그인 폼 생략)
+        
+        Returns:
+            검색 폼이 로드되면 True
+        """
+        # 쿠키는 같은 도메인 페이지가 열려 있어야 추가 가능
+        self.driver.get(self.BASE_URL)
+        
+        for cookie in cookies:
+            cookie = {
+                k: v for k, v in cookie.items()
+                if k in ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")
+            }
+            try:
+                self.driver.add_cookie(cookie)
+            except Exception:
+                continue
+        
+        self.driver.get(self.BASE_URL)
+        
+        try:
+            self.wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ".search-form"))
+            )
+            return True
+        except Exception:
+            return False
+    
     def scrape_products(self, product_ids: List[int]) -> Dict[int, Dict[str, str]]:
         """여러 상품의 채널 정보 스크래핑"""
         results = {}
@@ -230,33 +288,51 @@ class ProductWebScraper:
         except Exception as e:
             print(f"    ⚠️ 검색 타입 선택 실패: {type(e).__name__}")
     
+    # tbody 전체 셀 텍스트를 한 번의 WebDriver 호출로 추출 (행별 find_elements/.text 왕복 제거)
+    _EXTRACT_ROWS_JS = """
+        return Array.from(document.querySelectorAll('tbody tr')).map(function (row) {
+            return Array.from(row.querySelectorAll('td')).map(function (td) {
+                return td.innerText || '';
+            });
+        });
+    """
+
     def _parse_table_rows(self, expected_product_ids: List[int]) -> Dict[int, Dict[str, str]]:
-        """테이블 파싱 (원본 로직 유지)"""
+        """테이블 파싱 (execute_script 1회로 추출, 실패 시 행 단위 파싱)"""
         results = {pid: {} for pid in expected_product_ids}
+        expected = set(expected_product_ids)
         
         try:
-            rows = self.driver.find_elements(By.CSS_SELECTOR, "tbody tr")
+            try:
+                row_texts = self.driver.execute_script(self._EXTRACT_ROWS_JS)
+            except Exception as e:
+                print(f"    ⚠️ 일괄 추출 실패 ({type(e).__name__}) - 행 단위 파싱")
+                row_texts = None
+            
+            if row_texts is None:
+                rows = self.driver.find_elements(By.CSS_SELECTOR, "tbody tr")
+                parsed_rows = []
+                for row_idx, row in enumerate(rows):
+                    try:
+                        parsed_rows.append(self._parse_single_row(row))
+                    except Exception as e:
+                        print(f"    ⚠️ 행 {row_idx} 파싱 실패: {e}")
+            else:
+                parsed_rows = [self._parse_row_texts(texts) for texts in row_texts]
             
-            if not rows:
+            if not parsed_rows:
                 print("    ⚠️ 검색 결과 없음")
                 return results
             
-            print(f"    발견된 상품 행: {len(rows)}개")
+            print(f"    발견된 상품 행: {len(parsed_rows)}개")
             
-            for row_idx, row in enumerate(rows):
-                try:
-                    product_id, channels = self._parse_single_row(row)
-                    
-                    if product_id and product_id in expected_product_ids:
-                        results[product_id] = channels
-                        if channels:
-                            print(f"    ✓ 상품 {product_id}: {len(channels)}개 채널")
-                        else:
-                            print(f"    ○ 상품 {product_id}: 채널 정보 없음")
-                    
-                except Exception as e:
-                    print(f"    ⚠️ 행 {row_idx} 파싱 실패: {e}")
-                    continue
+            for product_id, channels in parsed_rows:
+                if product_id and product_id in expected:
+                    results[product_id] = channels
+                    if channels:
+                        print(f"    ✓ 상품 {product_id}: {len(channels)}개 채널")
+                    else:
+                        print(f"    ○ 상품 {product_id}: 채널 정보 없음")
             
             return results
             
@@ -266,21 +342,33 @@ class ProductWebScraper:
     
     def _parse_single_row(self, row) -> tuple:
         """
-        테이블 한 행 파싱 - ✅ 채널명만 CHANNEL_MASTER 기반으로 변환
+        테이블 한 행 파싱 (WebElement 기반 - 일괄 추출 실패 시 사용)
         """
         cells = row.find_elements(By.TAG_NAME, "td")
         
         if len(cells) < 60:
             return None, {}
         
+        return self._parse_row_texts([cell.text for cell in cells])
+    
+    def _parse_row_texts(self, cell_texts: List[str]) -> tuple:
+        """
+        셀 텍스트 리스트로 한 행 파싱 - ✅ 채널명만 CHANNEL_MASTER 기반으로 변환
+        
+        Args:
+            cell_texts: 한 행의 td 텍스트 리스트
+        
+        Returns:
+            (상품번호 또는 None, {표준_채널명: 채널상품번호})
+        """
+        if len(cell_texts) < 60:
+            return None, {}
+        
         # 상품번호 추출
         product_id = None
-        try:
-            text = cells[10].text.strip()
-            if text and text.isdigit() and len(text) >= 8:
-                product_id = int(text)
-        except:
-            pass
+        text = (cell_texts[10] or "").strip()
+        if text and text.isdigit() and len(text) >= 8:
+            product_id = int(text)
         
         if not product_id:
             return None, {}
@@ -289,31 +377,24 @@ class ProductWebScraper:
         channels = {}
         channel_start_idx = 58
         
-        for idx, html_channel_name in enumerate(self.CHANNEL_ORDER):
+        for idx, standard_name in enumerate(self.CHANNEL_STANDARD):
             cell_index = channel_start_idx + idx
             
-            if cell_index >= len(cells):
+            if cell_index >= len(cell_texts):
                 break
             
-            cell = cells[cell_index]
+            cell_text = cell_texts[cell_index] or ""
             
-            try:
-                if "연동 성공" not in cell.text:
-                    continue
-                
-                lines = cell.text.split('\n')
-                
-                for line in lines:
-                    line = line.strip()
-                    clean = line.replace(' ', '').replace('-', '')
-                    
-                    if clean.isdigit() and len(clean) >= 8:
-                        # ✅ HTML 채널명 → 표준 채널명 변환
-                        standard_name = config.get_standard_channel_name(html_channel_name)
-                        channels[standard_name] = clean
-                        break
-            except:
+            if "연동 성공" not in cell_text:
                 continue
+            
+            for line in cell_text.split('\n'):
+                line = line.strip()
+                clean = line.replace(' ', '').replace('-', '')
+                
+                if clean.isdigit() and len(clean) >= 8:
+                    channels[standard_name] = clean
+                    break
         
         return product_id, channels
     
@@ -326,6 +407,123 @@ class ProductWebScraper:
                 pass
 
 
+class ProductScraperPool:
+    """
+    로그인 세션 하나를 공유하는 ProductWebScraper 풀
+    첫 세션만 로그인 폼을 거치고, 나머지는 쿠키를 복사해 병렬로 스크래핑
+    """
+    
+    def __init__(self, size: Optional[int] = None, batch_size: int = 20, headless: bool = True,
+                 capture_network: bool = False):
+        """
+        Args:
+            size: 최대 동시 세션 수 (None이면 CPU 코어 수)
+            batch_size: 세션별 검색 배치 크기
+            headless: 헤드리스 모드 여부
+            capture_network: 첫 세션의 XHR 캡처 여부 (검색 API 재전송용)
+        """
+        self.size = max(1, size or os.cpu_count() or 1)
+        self.batch_size = batch_size
+        self.headless = headless
+        self.capture_network = capture_network
+        self.scrapers: List[ProductWebScraper] = []
+        self.email = None
+        self.password = None
+        self.cookies: List[dict] = []
+    
+    def login(self, email: str, password: str):
+        """첫 세션 로그인 후 쿠키 보관 (추가 세션은 필요할 때 생성)"""
+        self.email = email
+        self.password = password
+        
+        primary = ProductWebScraper(
+            batch_size=self.batch_size,
+            headless=self.headless,
+            capture_network=self.capture_network,
+        )
+        self.scrapers.append(primary)
+        primary.login(email, password)
+        self.cookies = primary.export_cookies()
+    
+    @property
+    def primary(self) -> Optional[ProductWebScraper]:
+        """로그인 폼을 거친 첫 세션"""
+        return self.scrapers[0] if self.scrapers else None
+    
+    def _spawn_session(self) -> Optional[ProductWebScraper]:
+        """쿠키를 공유하는 추가 세션 생성 (쿠키 로그인 실패 시 직접 로그인)"""
+        scraper = None
+        try:
+            scraper = ProductWebScraper(batch_size=self.batch_size, headless=self.headless)
+            if not scraper.login_with_cookies(self.cookies):
+                scraper.login(self.email, self.password)
+            return scraper
+        except Exception as e:
+            print(f"  ⚠️ 추가 스크래퍼 세션 생성 실패: {e}")
+            if scraper:
+                scraper.close()
+            return None
+    
+    def _ensure_sessions(self, count: int):
+        """세션 수를 count개까지 병렬로 늘림"""
+        missing = min(count, self.size) - len(self.scrapers)
+        if missing <= 0:
+            return
+        
+        print(f"  [스크래퍼 풀] 세션 {missing}개 추가 생성 중...")
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            spawned = list(executor.map(lambda _: self._spawn_session(), range(missing)))
+        
+        self.scrapers.extend(s for s in spawned if s is not None)
+        print(f"  [스크래퍼 풀] 사용 가능 세션: {len(self.scrapers)}개")
+    
+    def scrape_products(self, product_ids: List[int]) -> Dict[int, Dict[str, str]]:
+        """상품번호를 세션 수만큼 나눠 병렬 스크래핑 후 병합"""
+        product_ids = list(product_ids)
+        if not product_ids:
+            return {}
+        
+        if not self.scrapers:
+            raise RuntimeError("로그인된 스크래퍼 세션이 없습니다.")
+        
+        # 배치 수보다 많은 세션은 만들지 않음
+        batch_count = -(-len(product_ids) // self.batch_size)
+        self._ensure_sessions(batch_count)
+        
+        # 세션별로 배치 단위 분배 (세션 i는 i, i+k, i+2k ... 번째 배치 담당)
+        batches = [
+            product_ids[start:start + self.batch_size]
+            for start in range(0, len(product_ids), self.batch_size)
+        ]
+        worker_count = min(len(self.scrapers), len(batches))
+        shards = [
+            [pid for batch in batches[i::worker_count] for pid in batch]
+            for i in range(worker_count)
+        ]
+        
+        results: Dict[int, Dict[str, str]] = {}
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            futures = [
+                executor.submit(scraper.scrape_products, shard)
+                for scraper, shard in zip(self.scrapers, shards)
+            ]
+            for shard, future in zip(shards, futures):
+                try:
+                    results.update(future.result())
+                except Exception as e:
+                    print(f"    ✗ 세션 스크래핑 실패: {e}")
+                    for pid in shard:
+                        results[pid] = {}
+        
+        return {pid: results.get(pid, {}) for pid in product_ids}
+    
+    def close(self):
+        """모든 세션 종료"""
+        for scraper in self.scrapers:
+            scraper.close()
+        self.scrapers = []
+
+
 if __name__ == "__main__":
     scraper = ProductWebScraper(headless=False)
     
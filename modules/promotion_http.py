@@ -0,0 +1,591 @@
+"""
+비플로우 프로모션 HTTP 업로드 모듈
+Selenium 업로드 1회에서 엑셀 업로드(multipart) + 저장 요청을 캡처해 템플릿으로 만들고,
+이후 파일은 브라우저 없이 같은 요청을 직접 전송
+"""
+
+import sys
+from pathlib import Path
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+import os
+import re
+import json
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlencode
+import requests
+from urllib3.exceptions import NewConnectionError
+import config
+from modules.beeflow_session import (
+    SessionExpiredError,
+    STATE_LOCK,
+    load_session_state,
+    save_session_state,
+    filter_replay_headers,
+    cookies_to_session,
+    read_response_json,
+)
+
+
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# 저장 요청 본문에서 찾을 날짜 형식 후보 (UI가 보내는 형식을 학습)
+_DATETIME_FORMATS = [
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M",
+    "%Y-%m-%d",
+    "%Y.%m.%d %H:%M",
+    "%Y%m%d",
+    "iso_utc_ms",
+    "iso_utc",
+    "iso_local",
+]
+
+_CHANNEL_FIELDS = ["uploader_name", "api_key", "dropdown_name", "html_name", "standard"]
+
+# 저장 본문에서 채널 전용 값으로 볼 필드명 (부분 일치, 소문자)
+_CHANNEL_KEY_TOKENS = ("channel", "mall", "market", "shop", "store", "site", "채널")
+
+# 리다이렉트/HTML 응답이 로그인 페이지인지 판단할 문자열
+_LOGIN_MARKERS = ("login", "signin", "sign_in", 'type="password"', "type='password'")
+
+# 엑셀 업로드 응답 값 중 저장 본문 참조로 볼 최소 길이 (id/토큰 등)
+_MIN_REFERENCE_LEN = 3
+
+
+class TemplateMissingError(Exception):
+    """해당 프로모션 타입/채널의 요청 템플릿이 아직 학습되지 않은 경우"""
+
+
+def format_datetime(value: datetime, fmt: str) -> str:
+    """학습된 형식으로 날짜 문자열 생성 (naive datetime은 로컬 시간으로 간주)"""
+    if fmt == "iso_utc_ms":
+        return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    if fmt == "iso_utc":
+        return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    if fmt == "iso_local":
+        return value.astimezone().isoformat(timespec="milliseconds")
+    return value.strftime(fmt)
+
+
+def upload_datetimes(start_date: datetime, end_date: datetime) -> Tuple[datetime, datetime]:
+    """UI와 같은 시각으로 보정 (시작 00:00, 종료 23:59)"""
+    return (
+        start_date.replace(hour=0, minute=0, second=0, microsecond=0),
+        end_date.replace(hour=23, minute=59, second=0, microsecond=0),
+    )
+
+
+def _channel_values(channel_name: str) -> Dict[str, str]:
+    registry = config.CHANNEL_REGISTRY
+    values = {field: registry.field_of(channel_name, field) for field in _CHANNEL_FIELDS}
+    values = {field: value for field, value in values.items() if value}
+    values["standard"] = channel_name
+    return values
+
+
+def _parse_multipart_fields(post_data: Optional[str]) -> Tuple[Optional[str], Dict[str, str]]:
+    """캡처된 multipart 본문에서 (파일 필드명, 텍스트 필드) 추출"""
+    if not post_data:
+        return None, {}
+
+    file_field = None
+    fields: Dict[str, str] = {}
+    for part in re.split(r"-{2,}[^\r\n]*\r?\n", post_data):
+        match = re.search(r'name="([^"]+)"(; filename="[^"]*")?', part)
+        if not match:
+            continue
+        if match.group(2):
+            file_field = match.group(1)
+            continue
+        body = re.split(r"\r?\n\r?\n", part, maxsplit=1)
+        if len(body) == 2:
+            fields[match.group(1)] = body[1].rstrip("\r\n")
+    return file_field, fields
+
+
+def _is_reference_scalar(value) -> bool:
+    """응답의 id/토큰처럼 저장 본문에서 참조될 만한 값 (0/1/짧은 코드 등 우연히 겹치는 값 제외)"""
+    if value is None or isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        return False
+    return len(str(value)) >= _MIN_REFERENCE_LEN
+
+
+def _subtree_index(node, path=None, index=None) -> Dict[str, list]:
+    """응답 JSON의 하위 트리/스칼라 값 → 경로 (저장 본문에서 응답 데이터 재사용 탐지용)"""
+    path = path or []
+    index = {} if index is None else index
+    if isinstance(node, (dict, list)) and node:
+        index.setdefault(json.dumps(node, sort_keys=True, ensure_ascii=False), list(path))
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for key, value in items:
+            _subtree_index(value, path + [key], index)
+    elif _is_reference_scalar(node):
+        index.setdefault(json.dumps(node, ensure_ascii=False), list(path))
+    return index
+
+
+def _upload_reference_key(node, index: Dict[str, list]) -> Tuple[Optional[str], bool]:
+    """
+    저장 본문 값이 엑셀 업로드 응답의 어느 값과 같은지 → (색인 키, 문자열 변환 여부)
+    (form 본문은 숫자 id도 문자열로 전송되므로 숫자로도 비교)
+    """
+    if isinstance(node, (dict, list)) and not node:
+        return None, False
+    if isinstance(node, (dict, list)) or _is_reference_scalar(node):
+        key = json.dumps(node, sort_keys=True, ensure_ascii=False)
+        if key in index:
+            return key, False
+    if isinstance(node, str) and re.fullmatch(r"-?\d+", node):
+        key = json.dumps(int(node))
+        if key in index:
+            return key, True
+    return None, False
+
+
+def _literal_values(node):
+    """자리표시로 바꾸지 않고 남은 본문 스칼라 값"""
+    if isinstance(node, dict):
+        if "__param__" in node or "__upload__" in node:
+            return
+        for value in node.values():
+            yield from _literal_values(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _literal_values(value)
+    else:
+        yield node
+
+
+def _has_channel_literal(body, encoding: str, in_channel: bool = False) -> bool:
+    """
+    자리표시로 바꾼 저장 본문에 채널 필드(channel/mall/shop 등)의 고정 값이 남았는지
+    (채널 내부 id/코드가 남은 본문을 다른 채널에 재사용하면 엉뚱한 채널에 업로드됨)
+    """
+    if encoding == "form":
+        return any(
+            _has_channel_literal(value, "json", any(t in str(key).lower() for t in _CHANNEL_KEY_TOKENS))
+            for key, value in body
+        )
+    if isinstance(body, dict):
+        if "__param__" in body or "__upload__" in body:
+            return False
+        return any(
+            _has_channel_literal(value, encoding,
+                                 in_channel or any(t in str(key).lower() for t in _CHANNEL_KEY_TOKENS))
+            for key, value in body.items()
+        )
+    if isinstance(body, list):
+        return any(_has_channel_literal(value, encoding, in_channel) for value in body)
+    if body is None or isinstance(body, bool) or body == "":
+        return False
+    return in_channel
+
+
+def _may_have_reached_server(error: requests.RequestException) -> bool:
+    """요청이 서버에 전달된 뒤 실패했을 수 있는지 (연결 수립 전 실패만 False)"""
+    if isinstance(error, (requests.exceptions.ConnectTimeout, requests.exceptions.SSLError)):
+        return False
+    if isinstance(error, requests.ConnectionError):
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return not isinstance(reason, NewConnectionError)
+    return isinstance(error, (requests.exceptions.ReadTimeout, requests.exceptions.ChunkedEncodingError,
+                              requests.exceptions.ContentDecodingError))
+
+
+def _get_path(node, path: list):
+    for key in path:
+        node = node[key]
+    return node
+
+
+class PromotionHTTPUploader:
+    """캡처한 엑셀 업로드 + 저장 요청을 재전송하는 브라우저 없는 업로더"""
+
+    STATE_KEY = "promotion_upload"
+
+    # 응답 본문에서 실패로 판단할 키워드 (UI 알럿 키워드와 동일)
+    EXCEL_ERROR_KEYWORDS = ["엑셀 양식", "양식이 맞지", "양식이 올바르지", "엑셀 형식", "엑셀형식"]
+    FAIL_KEYWORDS = ["실패", "에러", "오류", "잘못된", "불러올 수 없습니다"]
+
+    def __init__(self, cookies: List[dict], session_path: Optional[str] = None, timeout: int = 60):
+        """
+        Args:
+            cookies: 로그인된 브라우저의 get_cookies() 결과
+            session_path: 템플릿 저장 파일 (기본: config.BEEFLOW_SESSION_PATH)
+            timeout: 요청 타임아웃 (초)
+        """
+        self.session = cookies_to_session(cookies)
+        self.session_path = session_path
+        self.timeout = timeout
+        with STATE_LOCK:
+            self.templates: Dict[str, Dict] = load_session_state(session_path).get(self.STATE_KEY, {})
+
+    def has_template(self, promotion_type: str, channel_name: str) -> bool:
+        return self._find_template(promotion_type, channel_name) is not None
+
+    def _find_template(self, promotion_type: str, channel_name: str) -> Optional[Dict]:
+        for _ in range(2):
+            template = (
+                self._generic_template(promotion_type)
+                or self.templates.get(f"{promotion_type}:{channel_name}")
+            )
+            if template is not None:
+                return template
+            # 다른 업로드 워커가 그 사이 학습했을 수 있으므로 파일 다시 확인
+            with STATE_LOCK:
+                self.templates = load_session_state(self.session_path).get(self.STATE_KEY, {})
+        return None
+
+    def is_verified(self, promotion_type: str, channel_name: str) -> bool:
+        template = self._find_template(promotion_type, channel_name)
+        return bool(template and template.get("verified"))
+
+    def confirm_template(self, promotion_type: str, channel_name: str, saved: bool) -> None:
+        """
+        첫 HTTP 저장 결과를 브라우저에서 확인한 뒤 호출
+        (저장이 확인되면 확인된 템플릿으로 표시, 아니면 폐기해 다음 업로드에서 다시 학습)
+        """
+        key = promotion_type if self._generic_template(promotion_type) else f"{promotion_type}:{channel_name}"
+        with STATE_LOCK:
+            state = load_session_state(self.session_path)
+            templates = state.get(self.STATE_KEY, {})
+            if key in templates:
+                if saved:
+                    templates[key]["verified"] = True
+                else:
+                    templates.pop(key)
+                state[self.STATE_KEY] = templates
+                save_session_state(state, self.session_path)
+            self.templates = templates
+
+    def _generic_template(self, promotion_type: str) -> Optional[Dict]:
+        # 채널 전용 값이 모두 자리표시로 바뀐 것이 확인된 템플릿만 모든 채널에 사용
+        template = self.templates.get(promotion_type)
+        if template is not None and template.get("channel_generic"):
+            return template
+        return None
+
+    # ==================== 학습 ====================
+
+    def learn(self, driver, captured: List[dict], promotion_name: str, channel_name: str,
+              start_date: datetime, end_date: datetime, promotion_type: str) -> bool:
+        """
+        성공한 Selenium 업로드에서 캡처한 요청으로 템플릿 생성
+
+        Args:
+            driver: 업로드한 브라우저 (응답 본문 조회용)
+            captured: read_network_requests 결과 (업로드 시작~저장까지)
+            나머지: 해당 업로드에 입력한 값
+
+        Returns:
+            템플릿 저장 여부
+        """
+        excel_req = None
+        for req in captured:
+            content_type = {k.lower(): v for k, v in req["headers"].items()}.get("content-type", "")
+            if req["method"] in ("POST", "PUT") and "multipart/form-data" in content_type:
+                excel_req = req
+        if excel_req is None:
+            return False
+
+        save_req = None
+        after_excel = captured[captured.index(excel_req) + 1:]
+        for req in after_excel:
+            body = req.get("post_data") or ""
+            if req["method"] in ("POST", "PUT", "PATCH") and (
+                promotion_name in body or promotion_name in unquote(body.replace("+", " "))
+            ):
+                save_req = req
+        if save_req is None:
+            return False
+
+        file_field, text_fields = _parse_multipart_fields(excel_req.get("post_data"))
+        upload_payload = read_response_json(driver, excel_req["request_id"])
+
+        body, encoding = self._decode_body(save_req.get("post_data") or "")
+        if body is None:
+            return False
+
+        start_at, end_at = upload_datetimes(start_date, end_date)
+        params = {
+            "name": {"": promotion_name},
+            "start": {fmt: format_datetime(start_at, fmt) for fmt in _DATETIME_FORMATS},
+            "end": {fmt: format_datetime(end_at, fmt) for fmt in _DATETIME_FORMATS},
+            "channel": _channel_values(channel_name),
+        }
+        found = set()
+        upload_index = _subtree_index(upload_payload) if upload_payload is not None else {}
+        body = self._parameterize(body, params, upload_index, found)
+
+        if not {"name", "start", "end"} <= found:
+            # 입력값 위치를 못 찾으면 재사용 불가
+            return False
+
+        if "upload" not in found:
+            # 엑셀 업로드 응답 값이 본문에 고정 값으로 남으면 다음 저장이 이번 업로드를 가리킴
+            upload_values = {
+                str(value) for value in _literal_values(upload_payload) if _is_reference_scalar(value)
+            }
+            literals = _literal_values([value for _, value in body] if encoding == "form" else body)
+            if any(str(value) in upload_values for value in literals if _is_reference_scalar(value)):
+                print("    ⚠️  저장 요청이 엑셀 업로드 응답 값을 참조하는 위치를 찾지 못해 학습하지 않음")
+                return False
+
+        template = {
+            "excel": {
+                "method": excel_req["method"],
+                "url": excel_req["url"],
+                "headers": self._without_content_type(filter_replay_headers(excel_req["headers"])),
+                "file_field": file_field or "file",
+                "fields": text_fields,
+            },
+            "save": {
+                "method": save_req["method"],
+                "url": save_req["url"],
+                "headers": self._without_content_type(filter_replay_headers(save_req["headers"])),
+                "body": body,
+                "encoding": encoding,
+            },
+        }
+
+        # 채널 값을 모두 자리표시로 바꿨을 때만 공용 템플릿,
+        # 채널 필드에 내부 id/코드 등 고정 값이 남아 있으면 해당 채널 전용 템플릿
+        channel_generic = "channel" in found and not _has_channel_literal(body, encoding)
+        template["channel_generic"] = channel_generic
+        # 첫 HTTP 저장 결과를 브라우저 목록에서 확인한 뒤에야 확인된 템플릿으로 표시
+        template["verified"] = False
+        key = promotion_type if channel_generic else f"{promotion_type}:{channel_name}"
+
+        with STATE_LOCK:
+            state = load_session_state(self.session_path)
+            templates = state.get(self.STATE_KEY, {})
+            templates[key] = template
+            state[self.STATE_KEY] = templates
+            save_session_state(state, self.session_path)
+            self.templates = templates
+
+        return True
+
+    @staticmethod
+    def _without_content_type(headers: Dict[str, str]) -> Dict[str, str]:
+        # multipart boundary / 본문 형식은 requests가 새로 설정
+        return {k: v for k, v in headers.items() if k.lower() != "content-type"}
+
+    @staticmethod
+    def _decode_body(post_data: str):
+        try:
+            return json.loads(post_data), "json"
+        except ValueError:
+            pass
+        pairs = parse_qsl(post_data, keep_blank_values=True)
+        if pairs:
+            return [list(pair) for pair in pairs], "form"
+        return None, None
+
+    def _parameterize(self, node, params: Dict[str, Dict[str, str]], upload_index: Dict[str, list], found: set):
+        """입력값/엑셀 응답 데이터와 같은 부분을 자리표시 dict로 교체"""
+        if isinstance(node, (dict, list)):
+            key, _ = _upload_reference_key(node, upload_index)
+            if key is not None:
+                found.add("upload")
+                return {"__upload__": upload_index[key]}
+
+        if isinstance(node, dict):
+            return {k: self._parameterize(v, params, upload_index, found) for k, v in node.items()}
+        if isinstance(node, list):
+            return [self._parameterize(v, params, upload_index, found) for v in node]
+        if isinstance(node, str):
+            for name, variants in params.items():
+                for variant, text in variants.items():
+                    if node == text:
+                        found.add(name)
+                        return {"__param__": name, "variant": variant}
+        # 입력값이 아닌 id/토큰이 엑셀 업로드 응답 값과 같으면 응답에서 가져오도록
+        key, as_str = _upload_reference_key(node, upload_index)
+        if key is not None:
+            found.add("upload")
+            placeholder = {"__upload__": upload_index[key]}
+            if as_str:
+                placeholder["as_str"] = True
+            return placeholder
+        return node
+
+    # ==================== 업로드 ====================
+
+    def upload(self, file_path: str, channel_name: str, start_date: datetime,
+               end_date: datetime, promotion_type: str = "product") -> bool:
+        """
+        엑셀 업로드 + 프로모션 저장을 HTTP로 직접 수행
+
+        Returns:
+            성공 여부 (엑셀 양식/실패 응답이면 False, 저장 결과 불명은 재업로드하지 않도록 True)
+
+        Raises:
+            TemplateMissingError: 학습된 템플릿 없음
+            SessionExpiredError: 쿠키 만료
+        """
+        template = self._find_template(promotion_type, channel_name)
+        if template is None:
+            raise TemplateMissingError(f"{promotion_type}/{channel_name} 템플릿 없음")
+
+        filename = os.path.basename(file_path)
+        promotion_name = filename.replace(".xlsx", "").replace("_", " ")
+        start_at, end_at = upload_datetimes(start_date, end_date)
+
+        # 1) 엑셀 업로드
+        excel = template["excel"]
+        with open(file_path, "rb") as f:
+            resp = self._send(
+                excel,
+                data=excel.get("fields") or None,
+                files={excel["file_field"]: (filename, f, XLSX_MIME)},
+            )
+        upload_payload = self._check_response(resp, "엑셀 업로드")
+        if upload_payload is False:
+            return False
+
+        # 2) 저장
+        values = {
+            "name": lambda _: promotion_name,
+            "start": lambda fmt: format_datetime(start_at, fmt),
+            "end": lambda fmt: format_datetime(end_at, fmt),
+            "channel": lambda field: _channel_values(channel_name).get(field, channel_name),
+        }
+        save = template["save"]
+        body = self._render(save["body"], values, upload_payload)
+
+        if save["encoding"] == "json":
+            resp = self._send(save, sent=True, json=body)
+        else:
+            resp = self._send(save, sent=True, data=urlencode([tuple(pair) for pair in body]),
+                              extra_headers={"Content-Type": "application/x-www-form-urlencoded"})
+        if resp is None:
+            return True
+
+        # 엑셀 업로드 후 저장 요청은 서버에 반영됐을 수 있으므로 결과 불명은 재업로드하지 않음
+        return self._check_response(resp, "저장", sent=True) is not False
+
+    def _render(self, node, values: Dict, upload_payload):
+        if isinstance(node, dict):
+            if "__param__" in node:
+                return values[node["__param__"]](node.get("variant", ""))
+            if "__upload__" in node:
+                if upload_payload is None:
+                    raise TemplateMissingError("엑셀 업로드 응답에서 저장 데이터를 찾을 수 없음")
+                try:
+                    value = _get_path(upload_payload, node["__upload__"])
+                except (KeyError, IndexError, TypeError):
+                    raise TemplateMissingError("엑셀 업로드 응답 구조가 학습 때와 다름")
+                return str(value) if node.get("as_str") else value
+            return {k: self._render(v, values, upload_payload) for k, v in node.items()}
+        if isinstance(node, list):
+            return [self._render(v, values, upload_payload) for v in node]
+        return node
+
+    def _send(self, request_template: Dict, extra_headers: Optional[Dict[str, str]] = None,
+              sent: bool = False, **kwargs):
+        """
+        Args:
+            sent: 서버에 반영됐을 수 있는 요청 (저장) - 전송 후 끊김/응답 타임아웃은 결과 불명으로
+                  알리고 None 반환 (세션 만료로 보고 브라우저로 다시 올리면 중복 생성)
+
+        Raises:
+            SessionExpiredError: 요청 실패 (저장은 전송 전 실패만)
+        """
+        headers = dict(request_template.get("headers", {}))
+        headers.update(extra_headers or {})
+
+        # Laravel CSRF: 최신 XSRF-TOKEN 쿠키를 헤더로 전달
+        xsrf = self.session.cookies.get("XSRF-TOKEN")
+        if xsrf:
+            headers["X-XSRF-TOKEN"] = unquote(xsrf)
+
+        try:
+            return self.session.request(
+                request_template["method"],
+                request_template["url"],
+                headers=headers,
+                timeout=self.timeout,
+                allow_redirects=False,
+                **kwargs,
+            )
+        except requests.RequestException as e:
+            if sent and _may_have_reached_server(e):
+                print(f"    ⚠️  저장 결과 확인 필요 ({type(e).__name__}) "
+                      f"- 저장됐을 수 있어 재업로드하지 않음, 비플로우에서 확인하세요")
+                return None
+            raise SessionExpiredError(f"요청 실패: {e}")
+
+    def _check_response(self, resp, step: str, sent: bool = False):
+        """
+        응답 검사 (UI 알럿 키워드 판정과 동일)
+
+        Args:
+            sent: 서버에 반영됐을 수 있는 요청 (저장) - 리다이렉트/HTML 응답은 로그인 페이지일 때만
+                  세션 만료로 보고, 그 외에는 결과 불명으로 알리고 성공 처리 (브라우저로 다시 올리면 중복 생성)
+
+        Returns:
+            JSON 본문 (JSON 아니면 None), 실패 응답이면 False
+        """
+        if resp.status_code in (301, 302, 303):
+            location = resp.headers.get("Location", "")
+            if not sent or any(m in location.lower() for m in _LOGIN_MARKERS):
+                raise SessionExpiredError(f"{step}: 세션 만료 (HTTP {resp.status_code})")
+            print(f"    ⚠️  {step} 결과 확인 필요 (HTTP {resp.status_code} → {location or '?'}) "
+                  f"- 저장됐을 수 있어 재업로드하지 않음, 비플로우에서 확인하세요")
+            return None
+
+        if resp.status_code in (401, 419):
+            raise SessionExpiredError(f"{step}: 세션 만료 (HTTP {resp.status_code})")
+
+        try:
+            payload = resp.json()
+        except ValueError:
+            payload = None
+
+        message = self._response_message(payload) if payload is not None else resp.text[:200]
+
+        if resp.status_code >= 400:
+            print(f"    ✗ {step} 실패 (HTTP {resp.status_code}): {message}")
+            return False
+
+        if payload is None and "<html" in resp.text[:500].lower():
+            if not sent or any(m in resp.text.lower() for m in _LOGIN_MARKERS):
+                # 로그인 페이지로 응답
+                raise SessionExpiredError(f"{step}: HTML 응답")
+            print(f"    ⚠️  {step} 결과 확인 필요 (HTML 응답) - 저장됐을 수 있어 재업로드하지 않음, 비플로우에서 확인하세요")
+            return None
+
+        if payload is not None and self._is_failure(payload, message):
+            kind = "엑셀 양식 오류" if any(k in message for k in self.EXCEL_ERROR_KEYWORDS) else "실패"
+            print(f"    ✗ {step} {kind}: {message}")
+            return False
+
+        return payload
+
+    @staticmethod
+    def _response_message(payload) -> str:
+        if not isinstance(payload, dict):
+            return ""
+        parts = []
+        for key in ("message", "msg", "error", "errors", "result_message"):
+            value = payload.get(key)
+            if value:
+                parts.append(value if isinstance(value, str) else json.dumps(value, ensure_ascii=False))
+        return " ".join(parts)
+
+    def _is_failure(self, payload, message: str) -> bool:
+        if isinstance(payload, dict):
+            for key in ("success", "result", "ok"):
+                if payload.get(key) is False:
+                    return True
+            if str(payload.get("status", "")).lower() in ("error", "fail", "failed"):
+                return True
+            if payload.get("errors"):
+                return True
+        return any(k in message for k in self.EXCEL_ERROR_KEYWORDS + self.FAIL_KEYWORDS)
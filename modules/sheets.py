@@ -3,12 +3,141 @@
 상품 프로모션과 브랜드 프로모션 지원
 """
 
+import sys
+from pathlib import Path
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+import time
+import threading
 import gspread
+from gspread.utils import DateTimeOption, ValueRenderOption
 from google.oauth2.service_account import Credentials
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+import config
+
+
+SCOPES = [
+    'https://www.googleapis.com/auth/spreadsheets',
+    'https://www.googleapis.com/auth/drive'
+]
+
+DATE_COLUMNS = ['시작일', '종료일', '설정일']
+
+# read_sheet 결과 DataFrame 인덱스 이름 (값 = 원래 시트 행 번호, 설정일 기입에 사용)
+SHEET_ROW_INDEX = '시트행'
+
+# 구글 시트 SERIAL_NUMBER 날짜 기준일
+SHEETS_SERIAL_EPOCH = pd.Timestamp('1899-12-30')
+
+
+def parse_sheet_id(sheet_url: str) -> str:
+    """시트 URL에서 스프레드시트 ID 추출"""
+    return sheet_url.split('/d/')[1].split('/')[0]
+
+
+def parse_sheet_gid(sheet_url: str) -> Optional[int]:
+    """시트 URL의 gid (없으면 None)"""
+    if 'gid=' not in sheet_url:
+        return None
+    return int(sheet_url.split('gid=')[1].split('&')[0].split('#')[0])
+
+
+class SheetsSession:
+    """
+    프로세스 공용 구글 시트 세션
+
+    인증 클라이언트는 1회만 만들고 (토큰 갱신은 google-auth가 처리),
+    스프레드시트 핸들과 워크시트 목록(title ↔ gid)은 TTL 동안 재사용
+    """
+
+    def __init__(self, credentials_path: str, ttl_seconds: Optional[float] = None):
+        self.credentials_path = credentials_path
+        self.ttl_seconds = config.SHEETS_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self._lock = threading.RLock()
+        self._client: Optional[gspread.Client] = None
+        # sheet_id → (캐시 시각, 스프레드시트)
+        self._spreadsheets: Dict[str, Tuple[float, gspread.Spreadsheet]] = {}
+        # sheet_id → (캐시 시각, 워크시트 목록)
+        self._worksheets: Dict[str, Tuple[float, List[gspread.Worksheet]]] = {}
+
+    def client(self) -> gspread.Client:
+        with self._lock:
+            if self._client is None:
+                creds = Credentials.from_service_account_file(self.credentials_path, scopes=SCOPES)
+                self._client = gspread.authorize(creds)
+            return self._client
+
+    def spreadsheet(self, sheet_url: str) -> gspread.Spreadsheet:
+        sheet_id = parse_sheet_id(sheet_url)
+        with self._lock:
+            cached = self._spreadsheets.get(sheet_id)
+            if cached and not self._expired(cached[0]):
+                return cached[1]
+            spreadsheet = self.client().open_by_key(sheet_id)
+            self._spreadsheets[sheet_id] = (time.monotonic(), spreadsheet)
+            return spreadsheet
+
+    def worksheets(self, sheet_url: str, refresh: bool = False) -> List[gspread.Worksheet]:
+        """워크시트 목록 (시트 순서)"""
+        sheet_id = parse_sheet_id(sheet_url)
+        with self._lock:
+            cached = self._worksheets.get(sheet_id)
+            if cached and not refresh and not self._expired(cached[0]):
+                return cached[1]
+            worksheets = self.spreadsheet(sheet_url).worksheets()
+            self._worksheets[sheet_id] = (time.monotonic(), worksheets)
+            return worksheets
+
+    def sheet_names(self, sheet_url: str) -> List[str]:
+        return [ws.title for ws in self.worksheets(sheet_url)]
+
+    def worksheet(self, sheet_url: str, title: Optional[str] = None,
+                  gid: Optional[int] = None) -> gspread.Worksheet:
+        """
+        제목 또는 gid로 워크시트 찾기 (둘 다 없으면 첫 번째 시트)
+
+        캐시에 없으면 목록을 1회 새로 받아 다시 찾음 (그 사이 추가/이름 변경된 시트)
+
+        Raises:
+            gspread.WorksheetNotFound: 새로 받은 목록에도 없는 경우
+        """
+        for refresh in (False, True):
+            worksheets = self.worksheets(sheet_url, refresh=refresh)
+            for ws in worksheets:
+                if title is not None and ws.title == title:
+                    return ws
+                if title is None and gid is not None and ws.id == gid:
+                    return ws
+            if title is None and gid is None and worksheets:
+                return worksheets[0]
+        raise gspread.WorksheetNotFound(title if title is not None else f"gid={gid}")
+
+    def invalidate(self):
+        """스프레드시트/워크시트 캐시 비우기 (클라이언트는 유지)"""
+        with self._lock:
+            self._spreadsheets.clear()
+            self._worksheets.clear()
+
+    def _expired(self, cached_at: float) -> bool:
+        return time.monotonic() - cached_at > self.ttl_seconds
+
+
+_SESSIONS: Dict[str, SheetsSession] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def get_sheets_session(credentials_path: str) -> SheetsSession:
+    """서비스 계정 파일별 공용 세션 (프로세스 전체에서 재사용)"""
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(credentials_path)
+        if session is None:
+            session = SheetsSession(credentials_path)
+            _SESSIONS[credentials_path] = session
+        return session
 
 
 def get_sheet_list(sheet_url: str, credentials_path: str) -> list:
@@ -22,20 +151,7 @@ def get_sheet_list(sheet_url: str, credentials_path: str) -> list:
     Returns:
         list: 시트 이름 리스트
     """
-    scopes = [
-        'https://www.googleapis.com/auth/spreadsheets',
-        'https://www.googleapis.com/auth/drive'
-    ]
-    creds = Credentials.from_service_account_file(credentials_path, scopes=scopes)
-    client = gspread.authorize(creds)
-    
-    sheet_id = sheet_url.split('/d/')[1].split('/')[0]
-    spreadsheet = client.open_by_key(sheet_id)
-    
-    worksheets = spreadsheet.worksheets()
-    sheet_names = [ws.title for ws in worksheets]
-    
-    return sheet_names
+    return get_sheets_session(credentials_path).sheet_names(sheet_url)
 
 
 def select_sheet_interactive(sheet_names: list) -> str:
@@ -99,60 +215,248 @@ def read_sheet(sheet_url: str, credentials_path: str, column_range: str,
     Returns:
         DataFrame: 읽은 데이터
     """
-    # 인증
-    scopes = [
-        'https://www.googleapis.com/auth/spreadsheets',
-        'https://www.googleapis.com/auth/drive'
+    worksheet = _select_worksheet(get_sheets_session(credentials_path), sheet_url, sheet_name, interactive)
+    data = _fetch_values(worksheet, [(column_range, column_mapping, start_row)])[0]
+    return _frame_from_values(data, column_mapping, start_row)
+
+
+def read_sheets_batch(sheet_url: str, credentials_path: str,
+                      ranges: Dict[str, Tuple[str, dict, int]],
+                      sheet_name: Optional[str] = None, interactive: bool = True) -> Dict[str, pd.DataFrame]:
+    """
+    여러 범위를 values.batchGet 한 번에 읽어 범위별 DataFrame으로 분리 (read_sheet와 같은 결과)
+
+    Args:
+        sheet_url: 구글 시트 URL
+        credentials_path: 서비스 계정 JSON 파일 경로
+        ranges: {키: (컬럼 범위, 컬럼 매핑, 데이터 시작 행)} (예: {"product": ("K:R", PRODUCT_COLUMNS, 4)})
+        sheet_name: 읽을 시트 이름
+        interactive: 시트 선택 인터랙티브 모드
+
+    Returns:
+        {키: DataFrame}
+    """
+    worksheet = _select_worksheet(get_sheets_session(credentials_path), sheet_url, sheet_name, interactive)
+    keys = list(ranges)
+    value_ranges = _fetch_values(worksheet, [ranges[key] for key in keys])
+    return {
+        key: _frame_from_values(values, ranges[key][1], ranges[key][2])
+        for key, values in zip(keys, value_ranges)
+    }
+
+
+def _fetch_values(worksheet, specs: List[Tuple[str, dict, int]]) -> List[list]:
+    """
+    범위별 셀 값 조회 (values.batchGet)
+
+    UNFORMATTED_VALUE 모드에서는 할인 컬럼만 표시 문자열로 한 번 더 받아 교체
+    ("100%" 서식 셀은 1로 와서 1%와 구분할 수 없으므로 표시 문자열의 "%"로 판단)
+
+    Args:
+        specs: [(컬럼 범위, 컬럼 매핑, 데이터 시작 행)]
+
+    Returns:
+        범위별 행 리스트
+    """
+    value_ranges = worksheet.batch_get([_data_range(column_range, start_row)
+                                        for column_range, _, start_row in specs],
+                                       **_value_render_options())
+    values = [list(rows) for rows in value_ranges]
+    if not config.SHEETS_UNFORMATTED_VALUES:
+        return values
+
+    targets = [
+        (spec_index, offset, f"{letter}{start_row}:{letter}")
+        for spec_index, (_, column_mapping, start_row) in enumerate(specs)
+        for offset, (letter, name) in enumerate(column_mapping.items())
+        if _is_discount_column(name)
     ]
-    creds = Credentials.from_service_account_file(credentials_path, scopes=scopes)
-    client = gspread.authorize(creds)
-    
-    # 시트 열기
-    sheet_id = sheet_url.split('/d/')[1].split('/')[0]
-    spreadsheet = client.open_by_key(sheet_id)
-    
-    # 시트 선택
+    if targets:
+        formatted = worksheet.batch_get([cell_range for _, _, cell_range in targets])
+        for (spec_index, offset, _), column in zip(targets, formatted):
+            values[spec_index] = _replace_column(values[spec_index], offset, column)
+    return values
+
+
+def _replace_column(rows: list, offset: int, column: list) -> list:
+    """행 리스트의 offset 번째 값을 단일 컬럼 조회 결과로 제자리 교체 (뒤쪽 빈 셀이 잘린 행 보정)"""
+    cells = [cell[0] if cell else '' for cell in column]
+    cells.extend([''] * (len(rows) - len(cells)))
+    for row, cell in zip(rows, cells):
+        if len(row) > offset:
+            row[offset] = cell
+        elif cell != '':
+            row.extend([''] * (offset - len(row)))
+            row.append(cell)
+    return rows
+
+
+def _value_render_options() -> dict:
+    """
+    값 조회 옵션 (config.SHEETS_UNFORMATTED_VALUES)
+
+    True: 숫자는 숫자, 날짜는 일련번호로 받아 문자열 파싱 생략 (텍스트 셀만 파싱, 할인 컬럼은 _fetch_values에서 표시 문자열)
+    False: 화면 표시 문자열 (기존 방식)
+    """
+    if not config.SHEETS_UNFORMATTED_VALUES:
+        return {}
+    return {
+        "value_render_option": ValueRenderOption.unformatted,
+        "date_time_render_option": DateTimeOption.serial_number,
+    }
+
+
+def _data_range(column_range: str, start_row: int) -> str:
+    """"K:R", 4 → "K4:R" """
+    columns = column_range.split(":")
+    start_col = columns[0]
+    end_col = columns[1] if len(columns) > 1 else columns[0]
+    return f"{start_col}{start_row}:{end_col}"
+
+
+def _select_worksheet(session: SheetsSession, sheet_url: str, sheet_name: Optional[str],
+                      interactive: bool) -> gspread.Worksheet:
+    """이름/URL gid/인터랙티브 선택 순으로 읽을 워크시트 결정"""
     if sheet_name is None:
         if interactive:
-            sheet_names = [ws.title for ws in spreadsheet.worksheets()]
-            selected_name = select_sheet_interactive(sheet_names)
-            worksheet = spreadsheet.worksheet(selected_name)
+            selected_name = select_sheet_interactive(session.sheet_names(sheet_url))
+            worksheet = session.worksheet(sheet_url, title=selected_name)
         else:
             if 'gid=' in sheet_url:
                 try:
-                    gid = sheet_url.split('gid=')[1].split('&')[0].split('#')[0]
-                    worksheet = spreadsheet.get_worksheet_by_id(int(gid))
+                    worksheet = session.worksheet(sheet_url, gid=parse_sheet_gid(sheet_url))
                     print(f"✓ URL의 gid로 시트 선택: {worksheet.title}")
                 except:
-                    worksheet = spreadsheet.get_worksheet(0)
+                    worksheet = session.worksheet(sheet_url)
                     print(f"✓ 첫 번째 시트 사용: {worksheet.title}")
             else:
-                worksheet = spreadsheet.get_worksheet(0)
+                worksheet = session.worksheet(sheet_url)
                 print(f"✓ 첫 번째 시트 사용: {worksheet.title}")
     else:
         try:
-            worksheet = spreadsheet.worksheet(sheet_name)
+            worksheet = session.worksheet(sheet_url, title=sheet_name)
             print(f"✓ 지정된 시트 사용: {sheet_name}")
         except:
             print(f"⚠️  시트 '{sheet_name}'을 찾을 수 없습니다.")
             if interactive:
-                sheet_names = [ws.title for ws in spreadsheet.worksheets()]
-                selected_name = select_sheet_interactive(sheet_names)
-                worksheet = spreadsheet.worksheet(selected_name)
+                selected_name = select_sheet_interactive(session.sheet_names(sheet_url))
+                worksheet = session.worksheet(sheet_url, title=selected_name)
             else:
                 raise ValueError(f"시트 '{sheet_name}'을 찾을 수 없습니다.")
-    
-    # 데이터 가져오기
-    columns = column_range.split(":")
-    start_col = columns[0]
-    end_col = columns[1] if len(columns) > 1 else columns[0]
-    data_range = f"{start_col}{start_row}:{end_col}"
-    data = worksheet.get(data_range)
-    
+    return worksheet
+
+
+def _parse_discount_value(val):
+    """할인 값 문자열 파싱 ("10%", "1,000원" → 숫자, 실패/빈 값 → 0)"""
+    if pd.isna(val):
+        return 0.0
+    if isinstance(val, (int, float)):
+        return float(val)
+    
+    val_str = str(val).strip()
+    if not val_str or val_str == '':
+        return 0.0
+    
+    if '%' in val_str:
+        val_str = val_str.replace('%', '').strip()
+    if '원' in val_str:
+        val_str = val_str.replace('원', '').strip()
+    val_str = val_str.replace(',', '')
+    
+    try:
+        return float(val_str)
+    except:
+        return 0.0
+
+
+def _is_discount_column(name: str) -> bool:
+    """할인 값 컬럼 (상품: 내부할인, 브랜드: 할인/할인2 - 타입 컬럼 제외)"""
+    return '할인' in name and '타입' not in name
+
+
+def _number_cells(series: pd.Series) -> pd.Series:
+    """숫자(int/float, bool 제외)로 받은 셀 마스크 - UNFORMATTED_VALUE 조회 결과"""
+    return series.map(type).isin((int, float))
+
+
+def _discount_column(series: pd.Series) -> pd.Series:
+    """
+    할인 컬럼 → float (빈 값 0)
+
+    숫자 셀은 그대로 float 변환 (할인 컬럼은 표시 문자열로 조회하므로 보통 텍스트),
+    텍스트 셀은 _discount_text_values로 한 번에 파싱 (셀마다 _parse_discount_value와 같은 값)
+    """
+    is_number = _number_cells(series)
+    values = series.where(is_number).astype('float64')
+    is_text = ~is_number & series.notna()
+    if is_text.any():
+        values[is_text] = _discount_text_values(series[is_text])
+    return values.fillna(0.0)
+
+
+def _discount_text_values(texts: pd.Series) -> pd.Series:
+    """
+    할인 텍스트 셀 → float ('%', '원', ',' 제거 후 한 번에 숫자 변환)
+
+    할인 값은 종류가 적으므로 고유 값만 파싱해 코드로 펼침,
+    to_numeric이 못 읽은 값만 _parse_discount_value로 다시 파싱
+    (전각 숫자 '１０', '1_000' 등 float()만 읽는 형식, 빈 값/잘못된 값 → 0)
+    """
+    codes, uniques = pd.factorize(texts.astype(str))
+    cleaned = (
+        pd.Series(uniques, dtype=object)
+        .str.replace('%', '', regex=False)
+        .str.replace('원', '', regex=False)
+        .str.replace(',', '', regex=False)
+        .str.strip()
+    )
+    values = pd.to_numeric(cleaned, errors='coerce')
+    failed = values.isna() & (cleaned != '')
+    if failed.any():
+        values[failed] = cleaned[failed].map(_parse_discount_value)
+    return pd.Series(values.fillna(0.0).to_numpy()[codes], index=texts.index)
+
+
+def _empty_mask(series: pd.Series) -> pd.Series:
+    """빈 셀 마스크 (NaN/None, 텍스트 셀은 '' 또는 'nan')"""
+    mask = series.isna()
+    is_text = series.map(type) == str
+    if is_text.any():
+        texts = series[is_text]
+        mask[is_text] = (texts == '') | (texts.str.strip() == 'nan')
+    return mask
+
+
+def _date_column(series: pd.Series) -> pd.Series:
+    """
+    날짜 컬럼 (빈 값 없는 부분) → datetime
+
+    SERIAL_NUMBER 날짜(1899-12-30 기준 일수, 소수부는 시각)는 한 번에 변환 (텍스트 경로처럼 시각 유지, 초 단위 반올림),
+    텍스트 셀만 pd.to_datetime(format='mixed')로 파싱
+    """
+    is_serial = _number_cells(series)
+    if not is_serial.any():
+        return pd.to_datetime(series, format='mixed', errors='coerce')
+
+    serials = series[is_serial].astype('float64')
+    result = pd.Series(pd.NaT, index=series.index, dtype='datetime64[ns]')
+    result[is_serial] = (SHEETS_SERIAL_EPOCH + pd.to_timedelta(serials, unit='D')).dt.round('s')
+    if not is_serial.all():
+        result[~is_serial] = pd.to_datetime(series[~is_serial], format='mixed', errors='coerce')
+    return result
+
+
+def _frame_from_values(data: list, column_mapping: dict, start_row: int = 4) -> pd.DataFrame:
+    """
+    시트 값(행 리스트) → 정리된 DataFrame (번호/할인/날짜 변환, 유효 행만)
+
+    인덱스는 원래 시트 행 번호 (SHEET_ROW_INDEX, 필터링 후에도 유지)
+    """
     # DataFrame 생성 (행마다 컬럼 개수 맞추기)
     num_cols = len(column_mapping)
     padded_data = [row + [''] * (num_cols - len(row)) if len(row) < num_cols else row[:num_cols] for row in data]
-    df = pd.DataFrame(padded_data, columns=list(column_mapping.values()))
+    df = pd.DataFrame(padded_data, columns=list(column_mapping.values()),
+                      index=pd.RangeIndex(start_row, start_row + len(padded_data), name=SHEET_ROW_INDEX))
     
     # 빈 문자열을 NaN으로 변환
     df = df.replace('', np.nan)
@@ -166,41 +470,19 @@ def read_sheet(sheet_url: str, credentials_path: str, column_range: str,
     # 번호 컬럼을 숫자로 변환
     df[first_col] = pd.to_numeric(df[first_col], errors='coerce')
     
-    # 할인 값 처리
-    def parse_discount_value(val):
-        if pd.isna(val):
-            return 0.0
-        if isinstance(val, (int, float)):
-            return float(val)
-        
-        val_str = str(val).strip()
-        if not val_str or val_str == '':
-            return 0.0
-        
-        if '%' in val_str:
-            val_str = val_str.replace('%', '').strip()
-        if '원' in val_str:
-            val_str = val_str.replace('원', '').strip()
-        val_str = val_str.replace(',', '')
-        
-        try:
-            return float(val_str)
-        except:
-            return 0.0
-    
     # 할인 컬럼 처리 (상품: 내부할인, 브랜드: 할인)
     for col in df.columns:
-        if '할인' in col and '타입' not in col:
-            df[col] = df[col].apply(parse_discount_value)
+        if _is_discount_column(col):
+            df[col] = _discount_column(df[col])
     
     # 날짜 변환
-    for col in ['시작일', '종료일', '설정일']:
+    for col in DATE_COLUMNS:
         if col in df.columns:
-            # 빈 값 마스크 생성 (문자열 변환 전)
-            mask_empty = df[col].isna() | (df[col] == '') | (df[col].astype(str).str.strip() == 'nan')
-            # 빈 값이 아닌 것만 날짜로 변환
-            df.loc[~mask_empty, col] = pd.to_datetime(df[col][~mask_empty], format='mixed', errors='coerce')
-            df.loc[mask_empty, col] = pd.NaT
+            # 빈 값이 아닌 것만 날짜로 변환 (빈 값은 NaT)
+            mask_empty = _empty_mask(df[col])
+            dates = pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns]')
+            dates[~mask_empty] = _date_column(df[col][~mask_empty])
+            df[col] = dates
     
     # NaN 제거
     df = df[df[first_col].notna()]
@@ -213,77 +495,173 @@ def read_sheet(sheet_url: str, credentials_path: str, column_range: str,
     return df
 
 
-def update_setting_dates(sheet_url: str, credentials_path: str, 
-                         ids: list, id_column: str, setting_column: str,
+def update_setting_dates(sheet_url: str, credentials_path: str,
+                         sheet_rows, setting_column: str,
                          sheet_name: Optional[str] = None):
     """
     구글 시트의 설정일 컬럼에 오늘 날짜 기입
-    
+
+    read_sheet가 남긴 시트 행 번호로 바로 기입 (시트를 다시 읽지 않음),
+    연속된 행은 하나의 범위로 묶어 batch_update 1회
+
     Args:
         sheet_url: 구글 시트 URL
         credentials_path: 서비스 계정 JSON 파일 경로
-        ids: 업데이트할 ID 리스트 (상품번호 또는 브랜드번호)
-        id_column: ID 컬럼 (예: "M", "C")
+        sheet_rows: 기입할 시트 행 번호 (read_sheet 결과의 인덱스, 예: df[df["설정일"].isna()].index)
         setting_column: 설정일 컬럼 (예: "R", "I")
         sheet_name: 시트 이름
     """
-    if not ids:
+    ranges = _row_ranges(sheet_rows)
+    if not ranges:
         return
-    
+
     print(f"\n📝 구글 시트 설정일 업데이트 중...")
-    
-    # 인증
-    scopes = [
-        'https://www.googleapis.com/auth/spreadsheets',
-        'https://www.googleapis.com/auth/drive'
-    ]
-    creds = Credentials.from_service_account_file(credentials_path, scopes=scopes)
-    client = gspread.authorize(creds)
-    
-    # 시트 열기
-    sheet_id = sheet_url.split('/d/')[1].split('/')[0]
-    spreadsheet = client.open_by_key(sheet_id)
-    
+
+    # 인증/시트 열기 (공용 세션 캐시)
+    session = get_sheets_session(credentials_path)
+
     # 시트 선택
     if sheet_name:
-        worksheet = spreadsheet.worksheet(sheet_name)
-    elif 'gid=' in sheet_url:
-        gid = sheet_url.split('gid=')[1].split('&')[0].split('#')[0]
-        worksheet = spreadsheet.get_worksheet_by_id(int(gid))
+        worksheet = session.worksheet(sheet_url, title=sheet_name)
     else:
-        worksheet = spreadsheet.get_worksheet(0)
-    
-    # 전체 데이터 가져오기
-    all_data = worksheet.get(f'{id_column}4:{setting_column}')
-    
+        worksheet = session.worksheet(sheet_url, gid=parse_sheet_gid(sheet_url))
+
     now = datetime.now()
     today = f"{now.year}. {now.month}. {now.day}"
-    update_count = 0
-    
-    # 상품/브랜드 번호를 문자열로 변환
-    ids_str = [str(pid) for pid in ids]
-    
-    # 업데이트할 행 찾기
-    updates = []
-    id_col_index = ord(id_column) - ord('A')
-    setting_col_index = ord(setting_column) - ord('A')
-    offset = setting_col_index - id_col_index
-    
-    for idx, row in enumerate(all_data, start=4):
-        if len(row) > 0:
-            row_id = str(row[0]).strip()
-            
-            if row_id in ids_str:
-                cell_address = f'{setting_column}{idx}'
-                updates.append({
-                    'range': cell_address,
-                    'values': [[today]]
-                })
-                update_count += 1
-    
+
+    updates = [
+        {
+            'range': f'{setting_column}{first}:{setting_column}{last}',
+            'values': [[today]] * (last - first + 1),
+        }
+        for first, last in ranges
+    ]
+    update_count = sum(last - first + 1 for first, last in ranges)
+
     # 일괄 업데이트
-    if updates:
-        worksheet.batch_update(updates)
-        print(f"✓ {update_count}개 항목의 설정일 업데이트 완료 ({today})")
-    else:
-        print(f"⚠️  업데이트할 항목을 찾지 못했습니다")
\ No newline at end of file
+    worksheet.batch_update(updates)
+    print(f"✓ {update_count}개 항목의 설정일 업데이트 완료 ({today}, 범위 {len(updates)}개)")
+
+
+def _row_ranges(sheet_rows) -> list:
+    """시트 행 번호 → 연속 구간 [(시작행, 끝행), ...] (중복 제거, 오름차순)"""
+    rows = np.unique(np.asarray(sheet_rows, dtype='int64'))
+    if rows.size == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(rows) != 1)
+    starts = np.concatenate(([rows[0]], rows[breaks + 1]))
+    ends = np.concatenate((rows[breaks], [rows[-1]]))
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+def benchmark_parse_values(n_rows: int = 200000, seed: int = 0) -> dict:
+    """
+    시트 값 파싱 단계 벤치마크 (표시 문자열 vs UNFORMATTED_VALUE/SERIAL_NUMBER, 상품 K:R 형식)
+
+    같은 데이터를 두 형식으로 만들어 _frame_from_values 시간을 비교하고 결과 일치 확인
+    (UNFORMATTED는 _fetch_values처럼 할인 컬럼을 표시 문자열로 교체한 뒤 파싱, "100%" 포함)
+
+    Returns:
+        {"formatted": 초, "unformatted": 초, "speedup": 배}
+    """
+    import io
+    import time
+    import contextlib
+
+    rng = np.random.default_rng(seed)
+    starts = pd.Timestamp('2025-11-01') + pd.to_timedelta(rng.integers(0, 60, n_rows), unit='D')
+    ends = starts + pd.to_timedelta(rng.integers(1, 30, n_rows), unit='D')
+    product_ids = rng.integers(100_000_000, 999_999_999, n_rows)
+    is_percent = rng.random(n_rows) < 0.7
+    percents = rng.integers(1, 90, n_rows)
+    percents[::50] = 100  # "100%" 서식 셀 (UNFORMATTED 값 1)
+    amounts = rng.integers(1, 50, n_rows) * 1000
+    has_setting = rng.random(n_rows) < 0.3
+
+    def serial(ts):
+        return int((ts - SHEETS_SERIAL_EPOCH).days)
+
+    formatted, unformatted, discount_column = [], [], []
+    for i in range(n_rows):
+        start, end = starts[i], ends[i]
+        discount_type = 'P' if is_percent[i] else 'W'
+        setting = '2025. 10. 1' if has_setting[i] else ''
+        formatted.append([
+            start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d'), str(product_ids[i]), discount_type,
+            f"{percents[i]}%" if is_percent[i] else f"{amounts[i]:,}원", 'SSG', '', setting,
+        ])
+        unformatted.append([
+            serial(start), serial(end), int(product_ids[i]), discount_type,
+            percents[i] / 100 if is_percent[i] else int(amounts[i]), 'SSG', '',
+            serial(pd.Timestamp('2025-10-01')) if has_setting[i] else '',
+        ])
+        discount_column.append([formatted[-1][4]])
+
+    timings = {}
+    frames = {}
+    for name, data in [("formatted", formatted), ("unformatted", unformatted)]:
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            if name == "unformatted":
+                # 할인 컬럼(O)은 표시 문자열 조회 결과로 교체 (_fetch_values와 동일)
+                data = _replace_column(data, 4, discount_column)
+            frames[name] = _frame_from_values(data, config.PRODUCT_COLUMNS)
+            timings[name] = time.perf_counter() - started
+
+    a, b = frames["formatted"], frames["unformatted"]
+    assert (a.loc[a['내부할인타입'] == 'P', '내부할인'] == 100).any(), "100% 케이스 없음"
+    for col in ['시작일', '종료일', '설정일']:
+        a_dates = pd.to_datetime(a[col]).astype('datetime64[ns]')
+        b_dates = pd.to_datetime(b[col]).astype('datetime64[ns]')
+        assert a_dates.equals(b_dates), f"{col} 불일치"
+    assert a['상품번호'].equals(b['상품번호']) and a['내부할인'].equals(b['내부할인']), "번호/할인 불일치"
+    timings["speedup"] = timings["formatted"] / timings["unformatted"]
+
+    print(f"시트 값 파싱 {n_rows:,}행 (결과 동일)")
+    print(f"  formatted:   {timings['formatted']:.2f}초")
+    print(f"  unformatted: {timings['unformatted']:.2f}초 ({timings['speedup']:.1f}배)")
+    return timings
+
+
+def benchmark_discount_parsing(n_rows: int = 200000, seed: int = 0) -> dict:
+    """
+    할인 컬럼 파싱 벤치마크 (셀마다 _parse_discount_value vs _discount_column, 표시 문자열 시트)
+
+    Returns:
+        {"apply": 초, "vectorized": 초, "speedup": 배}
+    """
+    import time
+
+    rng = np.random.default_rng(seed)
+    percents = rng.integers(1, 90, n_rows).astype(str)
+    amounts = pd.Series(rng.integers(1, 50, n_rows) * 1000).map('{:,}'.format).to_numpy()
+    kind = rng.random(n_rows)
+    cells = np.where(kind < 0.6, np.char.add(percents, '%'),
+                     np.where(kind < 0.9, np.char.add(amounts.astype(str), '원'),
+                              np.where(kind < 0.97, '', '미정')))
+    series = pd.Series(cells, dtype=object)
+
+    started = time.perf_counter()
+    expected = series.apply(_parse_discount_value)
+    apply_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    result = _discount_column(series)
+    vectorized_seconds = time.perf_counter() - started
+
+    assert result.equals(expected.astype('float64')), "할인 값 불일치"
+    timings = {
+        "apply": apply_seconds,
+        "vectorized": vectorized_seconds,
+        "speedup": apply_seconds / vectorized_seconds,
+    }
+
+    print(f"할인 값 파싱 {n_rows:,}행 (결과 동일)")
+    print(f"  apply:      {timings['apply']:.3f}초")
+    print(f"  vectorized: {timings['vectorized']:.3f}초 ({timings['speedup']:.1f}배)")
+    return timings
+
+
+if __name__ == "__main__":
+    benchmark_parse_values()
+    benchmark_discount_parsing()
@@ -0,0 +1,239 @@
+"""
+업로드 상태 저널 모듈
+SQLite에 업로드 이벤트를 추가 기록하고 파일별 현재 상태를 같은 트랜잭션에서 갱신
+(병렬 업로드 워커/프로세스가 동시에 기록해도 파일이 깨지지 않음)
+"""
+
+import sys
+from pathlib import Path
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+import os
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+import config
+
+
+# 이전 버전의 JSON 상태 파일 (처음 열 때 저널로 옮기고 .migrated로 이름 변경)
+LEGACY_STATUS_FILENAME = "upload_status.json"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS upload_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    filename TEXT NOT NULL,
+    event TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT,
+    at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS upload_files (
+    filename TEXT PRIMARY KEY,
+    type TEXT,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_attempt TEXT,
+    uploaded_at TEXT,
+    last_error TEXT,
+    grp TEXT,
+    part TEXT,
+    skipped TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_upload_files_status ON upload_files (status);
+"""
+
+# upload_files 컬럼 ↔ 상태 dict 키 (기존 JSON 형식과 동일한 키)
+_FIELDS = {
+    "type": "type",
+    "status": "status",
+    "attempts": "attempts",
+    "last_attempt": "last_attempt",
+    "uploaded_at": "uploaded_at",
+    "last_error": "last_error",
+    "grp": "group",
+    "part": "part",
+    "skipped": "skipped",
+}
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class UploadJournal:
+    """
+    파일별 업로드 상태 저널
+
+    - upload_events: 등록/결과 이벤트 추가 전용 기록
+    - upload_files: 파일별 현재 상태 (status 인덱스로 미완료 조회)
+    쓰기는 호출마다 BEGIN IMMEDIATE 트랜잭션 1개 (WAL 모드, 잠금 대기 후 재시도)
+    """
+
+    def __init__(self, path: str, legacy_json_path: Optional[str] = None):
+        self.path = path
+        path_dir = os.path.dirname(path)
+        if path_dir:
+            os.makedirs(path_dir, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+        if legacy_json_path and os.path.exists(legacy_json_path):
+            self.migrate_json(legacy_json_path)
+
+    @classmethod
+    def for_output_dir(cls, output_dir: str) -> "UploadJournal":
+        """OUTPUT_DIR의 저널 (기존 upload_status.json이 있으면 이전)"""
+        return cls(
+            os.path.join(output_dir, config.UPLOAD_JOURNAL_FILENAME),
+            legacy_json_path=os.path.join(output_dir, LEGACY_STATUS_FILENAME),
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        # 호출마다 연결 (스레드 간 연결 공유 없음), timeout 동안 다른 쓰기 잠금 대기
+        conn = sqlite3.connect(self.path, timeout=config.UPLOAD_JOURNAL_TIMEOUT,
+                               isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def register(self, files_status: Dict[str, Dict]):
+        """
+        업로드 대상 파일 등록 (같은 파일명은 새 상태로 교체)
+
+        Args:
+            files_status: {파일명: {"type", "status", "attempts", "group", "part", "skipped"...}}
+        """
+        now = _now()
+        with self._transaction() as conn:
+            for filename, info in files_status.items():
+                row = self._row_values(info)
+                conn.execute(
+                    "INSERT OR REPLACE INTO upload_files (filename, " + ", ".join(_FIELDS) + ") "
+                    "VALUES (?, " + ", ".join("?" for _ in _FIELDS) + ")",
+                    (filename, *row),
+                )
+                conn.execute(
+                    "INSERT INTO upload_events (filename, event, status, error, at) VALUES (?, ?, ?, ?, ?)",
+                    (filename, "register", info.get("status", "pending"), None, now),
+                )
+
+    def record(self, filename: str, file_type: str, success: bool, error_msg: str = ""):
+        """업로드 결과 기록 (시도 횟수 +1, 성공 시 오류 메시지 삭제)"""
+        now = _now()
+        status = "success" if success else "failed"
+        error = None if success else error_msg
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO upload_events (filename, event, status, error, at) VALUES (?, ?, ?, ?, ?)",
+                (filename, "result", status, error, now),
+            )
+            conn.execute(
+                """
+                INSERT INTO upload_files (filename, type, status, attempts, last_attempt, uploaded_at, last_error)
+                VALUES (?, ?, ?, 1, ?, ?, ?)
+                ON CONFLICT (filename) DO UPDATE SET
+                    type = excluded.type,
+                    status = excluded.status,
+                    attempts = upload_files.attempts + 1,
+                    last_attempt = excluded.last_attempt,
+                    uploaded_at = COALESCE(excluded.uploaded_at, upload_files.uploaded_at),
+                    last_error = excluded.last_error
+                """,
+                (filename, file_type, status, now, now if success else None, error),
+            )
+
+    def files(self, statuses: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+        """
+        파일별 현재 상태 (statuses를 주면 해당 상태만, status 인덱스 사용)
+
+        Returns:
+            {파일명: 상태 dict} - 기존 upload_status.json의 "files"와 같은 형식 (등록 순서)
+        """
+        query = "SELECT filename, " + ", ".join(_FIELDS) + " FROM upload_files"
+        params: tuple = ()
+        if statuses is not None:
+            statuses = tuple(statuses)
+            query += " WHERE status IN (" + ", ".join("?" for _ in statuses) + ")"
+            params = statuses
+        query += " ORDER BY rowid"
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
+        return {row["filename"]: self._row_info(row) for row in rows}
+
+    def clear(self):
+        """모든 상태/이벤트 삭제 (처음부터 다시 시작)"""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM upload_files")
+            conn.execute("DELETE FROM upload_events")
+
+    def migrate_json(self, json_path: str) -> int:
+        """
+        기존 upload_status.json을 저널로 이전 (이미 있는 파일명은 유지) 후 .migrated로 이름 변경
+
+        Returns:
+            이전한 파일 수
+        """
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                files_status = json.load(f).get("files", {})
+        except Exception as e:
+            print(f"⚠️  상태 파일 이전 실패 (손상된 파일은 건너뜀): {e}")
+            files_status = {}
+
+        now = _now()
+        migrated = 0
+        with self._transaction() as conn:
+            for filename, info in files_status.items():
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO upload_files (filename, " + ", ".join(_FIELDS) + ") "
+                    "VALUES (?, " + ", ".join("?" for _ in _FIELDS) + ")",
+                    (filename, *self._row_values(info)),
+                )
+                if cursor.rowcount:
+                    migrated += 1
+                    conn.execute(
+                        "INSERT INTO upload_events (filename, event, status, error, at) VALUES (?, ?, ?, ?, ?)",
+                        (filename, "migrate", info.get("status", "pending"), info.get("last_error"), now),
+                    )
+
+        os.replace(json_path, json_path + ".migrated")
+        print(f"✓ 업로드 상태 {migrated}개 저널로 이전 ({os.path.basename(json_path)})")
+        return migrated
+
+    @staticmethod
+    def _row_values(info: Dict) -> tuple:
+        values = []
+        for column, key in _FIELDS.items():
+            value = info.get(key)
+            if column == "status" and value is None:
+                value = "pending"
+            elif column == "attempts":
+                value = int(value or 0)
+            values.append(value)
+        return tuple(values)
+
+    @staticmethod
+    def _row_info(row: sqlite3.Row) -> Dict:
+        return {key: row[column] for column, key in _FIELDS.items() if row[column] is not None}
@@ -7,10 +7,18 @@ Selenium을 사용하여 프로모션 관리에 엑셀 파일 업로드
 상품 프로모션과 브랜드 프로모션 지원
 """
 
+import sys
+from pathlib import Path
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
 import os
+import re
 import time
+import queue
+import threading
 from datetime import datetime
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -23,6 +31,10 @@ from selenium.common.exceptions import (
     StaleElementReferenceException,
 )
 
+import config
+from modules.beeflow_session import SessionExpiredError, enable_network_capture, read_network_requests
+from modules.promotion_http import PromotionHTTPUploader, TemplateMissingError
+
 
 class BeeflowUploader:
     """비플로우 프로모션 업로더"""
@@ -31,13 +43,35 @@ class BeeflowUploader:
     MAX_LOGIN_RETRIES = 3
     MAX_CHANNEL_SELECT_RETRIES = 3
     MAX_FILE_UPLOAD_RETRIES = 2
-    MAX_ALERT_WAIT_RETRIES = 3
 
-    def __init__(self, email: str, password: str):
+    # 조건 대기 상한 (초) - 조건이 충족되면 즉시 다음 단계 진행
+    ELEMENT_TIMEOUT = 5.0          # 요소 표시/클릭 가능
+    OVERLAY_TIMEOUT = 1.5          # 캘린더 오버레이 사라짐
+    CALENDAR_STEP_TIMEOUT = 2.0    # 캘린더 화면 전환 (연/월/일/시간)
+    ALERT_TIMEOUT = 3.0            # JS alert 표시
+    RESULT_MODAL_TIMEOUT = 1.0     # 업로드 결과 모달 표시
+    SAVE_RESULT_TIMEOUT = 1.5      # 저장 후 확인 모달/alert 표시
+    RENDER_TIMEOUT = 1.0           # Vue 렌더 반영 (animation frame)
+    SAVE_VERIFY_TIMEOUT = 10.0     # 첫 HTTP 저장 프로모션이 목록에 표시
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, email: str, password: str, wait_timeouts: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            email: 비플로우 이메일
+            password: 비플로우 비밀번호
+            wait_timeouts: 대기 상한 덮어쓰기 (예: {"ALERT_TIMEOUT": 5.0})
+        """
         self.email = email
         self.password = password
         self.driver = None
         self.wait = None
+        self.http_uploader: Optional[PromotionHTTPUploader] = None
+
+        for name, seconds in (wait_timeouts or {}).items():
+            if not name.endswith("_TIMEOUT") or not hasattr(self, name):
+                raise ValueError(f"알 수 없는 대기 설정: {name}")
+            setattr(self, name, float(seconds))
 
     def init_driver(self):
         """Chrome 드라이버 초기화"""
@@ -47,10 +81,56 @@ class BeeflowUploader:
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--window-size=1920,1080')
         options.add_argument('--disable-blink-features=AutomationControlled')
+        if config.PROMOTION_HTTP_UPLOAD:
+            enable_network_capture(options)
 
         self.driver = webdriver.Chrome(options=options)
+        self.driver.set_script_timeout(self.RENDER_TIMEOUT)
         self.wait = WebDriverWait(self.driver, 15)
 
+    # ==================== 조건 대기 ====================
+
+    def _wait_until(self, condition, timeout: float):
+        """조건 충족까지 대기 (충족 시 조건 반환값, 시간 초과 시 None)"""
+        try:
+            return WebDriverWait(
+                self.driver,
+                timeout,
+                poll_frequency=self.POLL_INTERVAL,
+                ignored_exceptions=(StaleElementReferenceException,),
+            ).until(condition)
+        except TimeoutException:
+            return None
+
+    def _wait_for_render(self):
+        """Vue 렌더 반영 대기 (animation frame 2회 = DOM 패치 + 페인트 완료)"""
+        try:
+            self.driver.execute_async_script(
+                "var done = arguments[arguments.length - 1];"
+                "requestAnimationFrame(function () {"
+                "  requestAnimationFrame(function () { done(true); });"
+                "});"
+            )
+        except Exception:
+            pass
+
+    def _wait_for_visible_button(self, xpath: str, timeout: float):
+        """표시 + 활성화된 첫 버튼 대기"""
+        def condition(driver):
+            for btn in driver.find_elements(By.XPATH, xpath):
+                if btn.is_displayed() and btn.is_enabled():
+                    return btn
+            return False
+
+        return self._wait_until(condition, timeout)
+
+    def _wait_overlay_gone(self, timeout: Optional[float] = None) -> bool:
+        """캘린더 오버레이가 사라질 때까지 대기"""
+        return bool(self._wait_until(
+            lambda _: not self._is_calendar_overlay_present(),
+            timeout if timeout is not None else self.OVERLAY_TIMEOUT,
+        ))
+
     def _is_calendar_overlay_present(self) -> bool:
         """캘린더 오버레이가 화면을 가리고 있는지 확인"""
         try:
@@ -75,8 +155,7 @@ class BeeflowUploader:
                 )
                 if cancel_btn.is_displayed():
                     self.driver.execute_script("arguments[0].click();", cancel_btn)
-                    time.sleep(0.5)
-                    if not self._is_calendar_overlay_present():
+                    if self._wait_overlay_gone():
                         return True
             except Exception:
                 pass
@@ -85,8 +164,7 @@ class BeeflowUploader:
             try:
                 overlay = self.driver.find_element(By.CSS_SELECTOR, ".vdatetime-overlay")
                 self.driver.execute_script("arguments[0].click();", overlay)
-                time.sleep(0.5)
-                if not self._is_calendar_overlay_present():
+                if self._wait_overlay_gone():
                     return True
             except Exception:
                 pass
@@ -94,19 +172,22 @@ class BeeflowUploader:
             # 3) ESC
             try:
                 self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
-                time.sleep(0.5)
-                if not self._is_calendar_overlay_present():
+                if self._wait_overlay_gone():
                     return True
             except Exception:
                 pass
 
         return False
 
-    def _wait_for_alert(self, timeout: float = 1.0) -> Optional[str]:
-        """알럿 대기 및 텍스트 반환"""
+    def _wait_for_alert(self, timeout: Optional[float] = None) -> Optional[str]:
+        """알럿 대기 및 텍스트 반환 (표시되는 즉시 반환, 상한 초과 시 None)"""
+        alert = self._wait_until(
+            EC.alert_is_present(),
+            timeout if timeout is not None else self.ALERT_TIMEOUT,
+        )
+        if not alert:
+            return None
         try:
-            time.sleep(timeout)
-            alert = self.driver.switch_to.alert
             return alert.text.strip()
         except NoAlertPresentException:
             return None
@@ -169,7 +250,11 @@ class BeeflowUploader:
 
         for attempt in range(max_attempts):
             try:
-                time.sleep(1)
+                # 팝업 표시 대기
+                self._wait_until(
+                    EC.visibility_of_element_located((By.CSS_SELECTOR, ".vdatetime-popup")),
+                    self.ELEMENT_TIMEOUT,
+                )
 
                 # 1. 연도 선택
                 try:
@@ -181,21 +266,28 @@ class BeeflowUploader:
 
                         if current_year != target_date.year:
                             self.driver.execute_script("arguments[0].click();", year_div)
-                            time.sleep(0.8)
 
-                            year_items = self.driver.find_elements(
-                                By.CSS_SELECTOR, ".vdatetime-popup__list-picker__item"
-                            )
+                            year_items = self._wait_until(
+                                EC.visibility_of_all_elements_located(
+                                    (By.CSS_SELECTOR, ".vdatetime-popup__list-picker__item")
+                                ),
+                                self.CALENDAR_STEP_TIMEOUT,
+                            ) or []
                             for item in year_items:
                                 if item.text == str(target_date.year):
                                     self.driver.execute_script(
                                         "arguments[0].scrollIntoView(true);", item
                                     )
-                                    time.sleep(0.3)
                                     self.driver.execute_script(
                                         "arguments[0].click();", item
                                     )
-                                    time.sleep(1)
+                                    # 날짜 화면 복귀 대기
+                                    self._wait_until(
+                                        EC.visibility_of_element_located(
+                                            (By.CSS_SELECTOR, ".vdatetime-popup__month-selector__current")
+                                        ),
+                                        self.CALENDAR_STEP_TIMEOUT,
+                                    )
                                     break
                 except Exception:
                     pass
@@ -204,13 +296,14 @@ class BeeflowUploader:
                 try:
                     max_month_attempts = 24
                     for _ in range(max_month_attempts):
-                        month_selector = self.driver.find_element(
-                            By.CSS_SELECTOR, ".vdatetime-popup__month-selector__current"
+                        month_text = self._wait_until(
+                            lambda d: d.find_element(
+                                By.CSS_SELECTOR, ".vdatetime-popup__month-selector__current"
+                            ).text.strip(),
+                            self.CALENDAR_STEP_TIMEOUT,
                         )
-                        month_text = month_selector.text.strip()
 
                         if not month_text:
-                            time.sleep(0.5)
                             continue
 
                         parts = month_text.split("월")
@@ -223,34 +316,21 @@ class BeeflowUploader:
                         ):
                             break
 
-                        if current_year_in_month < target_date.year:
-                            next_btn = self.driver.find_element(
-                                By.CSS_SELECTOR, ".vdatetime-popup__month-selector__next"
-                            )
-                            self.driver.execute_script("arguments[0].click();", next_btn)
-                        elif current_year_in_month > target_date.year:
-                            prev_btn = self.driver.find_element(
-                                By.CSS_SELECTOR, ".vdatetime-popup__month-selector__previous"
-                            )
-                            self.driver.execute_script("arguments[0].click();", prev_btn)
+                        if (current_year_in_month, current_month) < (target_date.year, target_date.month):
+                            step_selector = ".vdatetime-popup__month-selector__next"
                         else:
-                            if current_month < target_date.month:
-                                next_btn = self.driver.find_element(
-                                    By.CSS_SELECTOR, ".vdatetime-popup__month-selector__next"
-                                )
-                                self.driver.execute_script(
-                                    "arguments[0].click();", next_btn
-                                )
-                            else:
-                                prev_btn = self.driver.find_element(
-                                    By.CSS_SELECTOR,
-                                    ".vdatetime-popup__month-selector__previous",
-                                )
-                                self.driver.execute_script(
-                                    "arguments[0].click();", prev_btn
-                                )
+                            step_selector = ".vdatetime-popup__month-selector__previous"
+
+                        step_btn = self.driver.find_element(By.CSS_SELECTOR, step_selector)
+                        self.driver.execute_script("arguments[0].click();", step_btn)
 
-                        time.sleep(0.4)
+                        # 월 표시가 바뀔 때까지 대기
+                        self._wait_until(
+                            lambda d: d.find_element(
+                                By.CSS_SELECTOR, ".vdatetime-popup__month-selector__current"
+                            ).text.strip() not in ("", month_text),
+                            self.CALENDAR_STEP_TIMEOUT,
+                        )
                 except Exception:
                     pass
 
@@ -264,7 +344,7 @@ class BeeflowUploader:
                     for item in date_items:
                         if item.text.strip() == str(target_date.day):
                             self.driver.execute_script("arguments[0].click();", item)
-                            time.sleep(0.5)
+                            self._wait_for_render()
                             break
                 except Exception:
                     pass
@@ -276,53 +356,41 @@ class BeeflowUploader:
                         "//div[@class='vdatetime-popup__actions__button' and text()='Ok']",
                     )
                     self.driver.execute_script("arguments[0].click();", ok_btn)
-                    time.sleep(1)
                 except Exception:
                     pass
 
                 # 5. 시간 선택
                 try:
-                    time.sleep(1)
-                    time_pickers = self.driver.find_elements(
-                        By.CSS_SELECTOR, ".vdatetime-popup__list-picker"
-                    )
+                    # 시/분 피커 표시 대기
+                    time_pickers = self._wait_until(
+                        lambda d: (
+                            lambda pickers: pickers if len(pickers) >= 2 else False
+                        )(d.find_elements(By.CSS_SELECTOR, ".vdatetime-popup__list-picker")),
+                        self.CALENDAR_STEP_TIMEOUT,
+                    ) or []
 
                     if len(time_pickers) >= 2:
-                        # 시
-                        hour_picker = time_pickers[0]
-                        target_hour = "23" if is_end_time else "00"
-
-                        hour_items = hour_picker.find_elements(
-                            By.CSS_SELECTOR, ".vdatetime-popup__list-picker__item"
-                        )
-                        for item in hour_items:
-                            if item.text.strip() == target_hour:
-                                self.driver.execute_script(
-                                    "arguments[0].scrollIntoView(true);", item
-                                )
-                                time.sleep(0.2)
-                                self.driver.execute_script("arguments[0].click();", item)
-                                break
-
-                        time.sleep(0.3)
-
-                        # 분
-                        minute_picker = time_pickers[1]
-                        target_minute = "59" if is_end_time else "00"
+                        targets = [
+                            (time_pickers[0], "23" if is_end_time else "00"),  # 시
+                            (time_pickers[1], "59" if is_end_time else "00"),  # 분
+                        ]
 
-                        minute_items = minute_picker.find_elements(
-                            By.CSS_SELECTOR, ".vdatetime-popup__list-picker__item"
-                        )
-                        for item in minute_items:
-                            if item.text.strip() == target_minute:
-                                self.driver.execute_script(
-                                    "arguments[0].scrollIntoView(true);", item
-                                )
-                                time.sleep(0.2)
-                                self.driver.execute_script("arguments[0].click();", item)
-                                break
-
-                        time.sleep(0.3)
+                        for picker, target_value in targets:
+                            items = picker.find_elements(
+                                By.CSS_SELECTOR, ".vdatetime-popup__list-picker__item"
+                            )
+                            for item in items:
+                                if item.text.strip() == target_value:
+                                    self.driver.execute_script(
+                                        "arguments[0].scrollIntoView(true);", item
+                                    )
+                                    self.driver.execute_script("arguments[0].click();", item)
+                                    # 선택 표시 반영 대기
+                                    self._wait_until(
+                                        lambda _: "--selected" in (item.get_attribute("class") or ""),
+                                        self.CALENDAR_STEP_TIMEOUT,
+                                    )
+                                    break
                 except Exception:
                     pass
 
@@ -333,7 +401,7 @@ class BeeflowUploader:
                         "//div[@class='vdatetime-popup__actions__button' and text()='Ok']",
                     )
                     self.driver.execute_script("arguments[0].click();", ok_btn)
-                    time.sleep(0.5)
+                    self._wait_overlay_gone()
                 except Exception:
                     pass
 
@@ -348,10 +416,85 @@ class BeeflowUploader:
 
         return False
 
+    # vdatetime 컴포넌트에 직접 값 설정 (컴포넌트의 Luxon 인스턴스로 confirm 호출)
+    _SET_DATETIME_JS = """
+        var input = arguments[0], p = arguments[1];
+        var root = input.closest('.vdatetime');
+        var vm = root && root.__vue__;
+        if (!vm || typeof vm.confirm !== 'function' || typeof vm.newPopupDatetime !== 'function') {
+            return false;
+        }
+        var base = vm.datetime ? vm.datetime.setZone(vm.zone) : vm.newPopupDatetime();
+        vm.confirm(base.set({
+            year: p.year, month: p.month, day: p.day,
+            hour: p.hour, minute: p.minute, second: 0, millisecond: 0
+        }));
+        return true;
+    """
+
+    # 설정된 값 읽기 (컴포넌트 모델 + 화면 input 값)
+    _READ_DATETIME_JS = """
+        var input = arguments[0];
+        var root = input.closest('.vdatetime');
+        var vm = root && root.__vue__;
+        if (!vm || !vm.datetime) {
+            return null;
+        }
+        return {
+            model: vm.datetime.setZone(vm.zone).toFormat('yyyy-MM-dd HH:mm'),
+            input: input.value || ''
+        };
+    """
+
+    def set_datetime_direct(self, date_input, target_date: datetime, is_end_time: bool = False) -> bool:
+        """
+        vdatetime 피커를 열지 않고 컴포넌트 모델에 날짜 + 시간 직접 설정 후 재확인
+
+        Returns:
+            설정값이 읽어온 값과 일치하면 True (실패 시 캘린더 클릭 방식으로 대체)
+        """
+        target = {
+            "year": target_date.year,
+            "month": target_date.month,
+            "day": target_date.day,
+            "hour": 23 if is_end_time else 0,
+            "minute": 59 if is_end_time else 0,
+        }
+        expected = "{year:04d}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}".format(**target)
+
+        try:
+            if not self.driver.execute_script(self._SET_DATETIME_JS, date_input, target):
+                return False
+
+            self._wait_for_render()
+            value = self.driver.execute_script(self._READ_DATETIME_JS, date_input)
+        except Exception:
+            return False
+
+        return bool(value) and value.get("model") == expected and bool(value.get("input"))
+
+    def _set_date_input(self, index: int, target_date: datetime, is_end_time: bool) -> bool:
+        """index번째 날짜 입력 설정 (직접 설정 → 실패 시 캘린더 클릭)"""
+        date_inputs = self.driver.find_elements(
+            By.CSS_SELECTOR, ".vdatetime input.form-control"
+        )
+        if len(date_inputs) <= index:
+            # 입력이 없으면 기존과 같이 건너뜀
+            return True
+
+        if self.set_datetime_direct(date_inputs[index], target_date, is_end_time):
+            self._close_calendar_overlay()
+            return True
+
+        self.driver.execute_script("arguments[0].click();", date_inputs[index])
+        if not self.select_date_in_calendar(target_date, is_end_time=is_end_time):
+            return False
+
+        self._close_calendar_overlay()
+        return True
+
     def select_channel_from_multiselect(self, channel_name: str) -> bool:
         """multiselect에서 채널 선택 (CHANNEL_MASTER 기반)"""
-        import config
-        
         for attempt in range(self.MAX_CHANNEL_SELECT_RETRIES):
             try:
                 # 오버레이 있으면 닫기
@@ -361,13 +504,9 @@ class BeeflowUploader:
                             continue
                         return False
 
-                # 표준 채널명 → uploader_name 변환 (CHANNEL_MASTER 사용)
-                uploader_name = None
-                for standard, info in config.CHANNEL_MASTER.items():
-                    if channel_name == standard:
-                        uploader_name = info["uploader_name"]
-                        break
-                
+                # 표준 채널명 → uploader_name 변환 (채널 레지스트리)
+                uploader_name = config.CHANNEL_REGISTRY.field_of(channel_name, "uploader_name")
+
                 if not uploader_name:
                     print(f"    ⚠️ 알 수 없는 채널: {channel_name}")
                     return False
@@ -382,10 +521,15 @@ class BeeflowUploader:
                 self.driver.execute_script(
                     "arguments[0].scrollIntoView(true);", multiselect
                 )
-                time.sleep(0.5)
-
                 self.driver.execute_script("arguments[0].click();", multiselect)
-                time.sleep(1.0)
+
+                # 옵션 목록 표시 대기
+                self._wait_until(
+                    EC.visibility_of_any_elements_located(
+                        (By.CSS_SELECTOR, ".multiselect__element")
+                    ),
+                    self.ELEMENT_TIMEOUT,
+                )
 
                 # 채널 옵션 선택
                 channel_options = self.driver.find_elements(
@@ -409,7 +553,7 @@ class BeeflowUploader:
                             By.CSS_SELECTOR, ".multiselect__option"
                         )
                         self.driver.execute_script("arguments[0].click();", clickable)
-                        time.sleep(0.5)
+                        self._wait_for_render()
                         return True  # 성공적으로 선택
 
                 # 여기까지 왔으면 채널을 못 찾은 것
@@ -439,7 +583,80 @@ class BeeflowUploader:
         promotion_type: str = "product",
     ) -> bool:
         """
-        프로모션 업로드 (재시도 로직 포함, 내부 로그 최소화)
+        프로모션 업로드 (학습된 HTTP 요청 우선, 없으면 브라우저 UI)
+
+        Returns:
+            bool: 업로드 + 저장까지 정상 완료되면 True, 실패하면 False
+        """
+        if not config.PROMOTION_HTTP_UPLOAD:
+            return self._upload_promotion_ui(file_path, channel_name, start_date, end_date, promotion_type)
+
+        http = self._get_http_uploader()
+        if http.has_template(promotion_type, channel_name):
+            verified = http.is_verified(promotion_type, channel_name)
+            try:
+                ok = http.upload(file_path, channel_name, start_date, end_date, promotion_type)
+            except (SessionExpiredError, TemplateMissingError) as e:
+                print(f"    ⚠️  HTTP 업로드 불가 ({e}) → 브라우저 업로드")
+                self.http_uploader = None
+            else:
+                if ok and not verified:
+                    # 학습한 템플릿의 첫 저장은 프로모션 목록에서 실제 생성 여부 확인
+                    promotion_name = os.path.basename(file_path).replace(".xlsx", "").replace("_", " ")
+                    ok = self._promotion_listed(promotion_name)
+                    http.confirm_template(promotion_type, channel_name, saved=ok)
+                    if ok:
+                        print(f"    ✓ HTTP 업로드 결과 확인 ({promotion_type}) → 이후 확인 없이 HTTP 업로드")
+                    else:
+                        print("    ✗ HTTP 저장 프로모션을 목록에서 찾지 못함 → 템플릿 폐기, 비플로우에서 확인하세요")
+                return ok
+
+        # 브라우저 업로드 요청을 캡처해 다음 파일부터 HTTP로 전송
+        read_network_requests(self.driver)
+
+        def learn():
+            learned = self._get_http_uploader().learn(
+                self.driver, read_network_requests(self.driver),
+                os.path.basename(file_path).replace(".xlsx", "").replace("_", " "),
+                channel_name, start_date, end_date, promotion_type,
+            )
+            if learned:
+                print(f"    ✓ 업로드 요청 학습 완료 ({promotion_type}) → 이후 HTTP 업로드")
+
+        return self._upload_promotion_ui(
+            file_path, channel_name, start_date, end_date, promotion_type, on_saved=learn
+        )
+
+    def _promotion_listed(self, promotion_name: str) -> bool:
+        """프로모션 목록 페이지에 해당 이름이 표시되는지 확인"""
+        try:
+            self.driver.get(config.BEEFLOW_PROMOTION_LIST_URL)
+        except Exception:
+            return False
+        return self._wait_until(
+            lambda driver: promotion_name in driver.page_source, self.SAVE_VERIFY_TIMEOUT
+        ) is not None
+
+    def _get_http_uploader(self) -> PromotionHTTPUploader:
+        """현재 브라우저 쿠키로 HTTP 업로더 생성 (세션 만료 시 재생성)"""
+        if self.http_uploader is None:
+            self.http_uploader = PromotionHTTPUploader(self.driver.get_cookies())
+        return self.http_uploader
+
+    def _upload_promotion_ui(
+        self,
+        file_path: str,
+        channel_name: str,
+        start_date: datetime,
+        end_date: datetime,
+        promotion_type: str = "product",
+        on_saved: Optional[Callable[[], None]] = None,
+    ) -> bool:
+        """
+        브라우저 UI로 프로모션 업로드 (재시도 로직 포함, 내부 로그 최소화)
+
+        Args:
+            on_saved: 저장 완료 후 페이지 이동 전 호출 (요청 캡처 학습용)
 
         Returns:
             bool: 업로드 + 저장까지 정상 완료되면 True, 실패하면 False
@@ -448,8 +665,8 @@ class BeeflowUploader:
         promotion_name = filename.replace(".xlsx", "").replace("_", " ")
 
         # 알럿/모달 텍스트 키워드
-        excel_keywords = ["엑셀 양식", "양식이 맞지", "양식이 올바르지", "엑셀 형식", "엑셀형식"]
-        fail_keywords = ["실패", "에러", "오류", "잘못된", "불러올 수 없습니다"]
+        excel_keywords = PromotionHTTPUploader.EXCEL_ERROR_KEYWORDS
+        fail_keywords = PromotionHTTPUploader.FAIL_KEYWORDS
 
         for main_attempt in range(self.MAX_FILE_UPLOAD_RETRIES):
             try:
@@ -465,40 +682,24 @@ class BeeflowUploader:
                 self.driver.execute_script(
                     "arguments[0].scrollIntoView(true);", name_input
                 )
-                time.sleep(0.2)
                 try:
                     name_input.clear()
                 except Exception:
                     self.driver.execute_script("arguments[0].value='';", name_input)
-                time.sleep(0.1)
                 name_input.send_keys(promotion_name)
 
                 # 시작일 설정
-                date_inputs = self.driver.find_elements(
-                    By.CSS_SELECTOR, ".vdatetime input.form-control"
-                )
-                if date_inputs:
-                    self.driver.execute_script("arguments[0].click();", date_inputs[0])
-                    if not self.select_date_in_calendar(start_date, is_end_time=False):
-                        # 시작일 설정 실패 → 재시도 or 실패
-                        if main_attempt < self.MAX_FILE_UPLOAD_RETRIES - 1:
-                            continue
-                        return False
-
-                    self._close_calendar_overlay()
+                if not self._set_date_input(0, start_date, is_end_time=False):
+                    # 시작일 설정 실패 → 재시도 or 실패
+                    if main_attempt < self.MAX_FILE_UPLOAD_RETRIES - 1:
+                        continue
+                    return False
 
                 # 종료일 설정
-                date_inputs = self.driver.find_elements(
-                    By.CSS_SELECTOR, ".vdatetime input.form-control"
-                )
-                if len(date_inputs) > 1:
-                    self.driver.execute_script("arguments[0].click();", date_inputs[1])
-                    if not self.select_date_in_calendar(end_date, is_end_time=True):
-                        if main_attempt < self.MAX_FILE_UPLOAD_RETRIES - 1:
-                            continue
-                        return False
-
-                    self._close_calendar_overlay()
+                if not self._set_date_input(1, end_date, is_end_time=True):
+                    if main_attempt < self.MAX_FILE_UPLOAD_RETRIES - 1:
+                        continue
+                    return False
 
                 # 채널 선택
                 selected = self.select_channel_from_multiselect(channel_name)
@@ -512,105 +713,53 @@ class BeeflowUploader:
                 self._click_checkbox(promotion_type)
 
                 # 엑셀 업로드 버튼 클릭
-                upload_buttons = self.driver.find_elements(
-                    By.XPATH, "//button[contains(text(), '엑셀 업로드')]"
+                upload_btn = self._wait_for_visible_button(
+                    "//button[contains(text(), '엑셀 업로드')]", self.ELEMENT_TIMEOUT
                 )
-                clicked_upload_btn = False
-                for btn in upload_buttons:
-                    if btn.is_displayed() and btn.is_enabled():
-                        self.driver.execute_script(
-                            "arguments[0].scrollIntoView(true);", btn
-                        )
-                        time.sleep(0.2)
-                        self.driver.execute_script("arguments[0].click();", btn)
-                        clicked_upload_btn = True
-                        break
-
-                if not clicked_upload_btn:
+                if not upload_btn:
                     if main_attempt < self.MAX_FILE_UPLOAD_RETRIES - 1:
                         continue
                     return False
 
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", upload_btn)
+                self.driver.execute_script("arguments[0].click();", upload_btn)
+
                 # 파일 업로드
                 abs_file_path = self._get_absolute_path(file_path)
 
-                file_inputs = self.driver.find_elements(
-                    By.CSS_SELECTOR, "input[type='file']"
+                file_inputs = self._wait_until(
+                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, "input[type='file']")),
+                    self.ELEMENT_TIMEOUT,
                 )
                 if file_inputs:
                     file_inputs[0].send_keys(abs_file_path)
-                    time.sleep(0.5)
                 else:
                     if main_attempt < self.MAX_FILE_UPLOAD_RETRIES - 1:
                         continue
                     return False
 
-                # 모달 업로드 버튼 클릭
-                time.sleep(0.5)
-                modal_upload_btns = self.driver.find_elements(
-                    By.XPATH,
+                # 모달 업로드 버튼 클릭 (파일 선택 후 활성화 대기)
+                modal_upload_btn = self._wait_for_visible_button(
                     "//div[contains(@class, 'modal')]//button[contains(text(), '업로드')]",
+                    self.ELEMENT_TIMEOUT,
                 )
-                if not modal_upload_btns:
-                    modal_upload_btns = self.driver.find_elements(
-                        By.XPATH, "//button[contains(text(), '업로드')]"
+                if not modal_upload_btn:
+                    modal_upload_btn = self._wait_for_visible_button(
+                        "//button[contains(text(), '업로드')]", self.POLL_INTERVAL
                     )
 
-                clicked_modal_upload = False
-                if modal_upload_btns:
-                    for btn in modal_upload_btns:
-                        if btn.is_displayed() and btn.is_enabled():
-                            self.driver.execute_script("arguments[0].click();", btn)
-                            clicked_modal_upload = True
-                            break
-
-                if not clicked_modal_upload:
-                    if main_attempt < self.MAX_FILE_UPLOAD_RETRIES - 1:
-                        continue
-                    return False
-
-                # 알럿 처리
-                had_any_alert_error = False
-
-                # 1차 알럿
-                for alert_attempt in range(self.MAX_ALERT_WAIT_RETRIES):
-                    alert_text = self._wait_for_alert(timeout=0.7 + alert_attempt * 0.3)
-                    if alert_text:
-                        self.driver.switch_to.alert.accept()
-                        time.sleep(0.5)
-
-                        if any(k in alert_text for k in excel_keywords):
-                            had_any_alert_error = True
-                            break
-                        elif any(k in alert_text for k in fail_keywords):
-                            had_any_alert_error = True
-                            break
-                        else:
-                            break
-                    elif alert_attempt == self.MAX_ALERT_WAIT_RETRIES - 1:
-                        break
-
-                if had_any_alert_error:
+                if not modal_upload_btn:
                     if main_attempt < self.MAX_FILE_UPLOAD_RETRIES - 1:
                         continue
                     return False
 
-                # 2차 알럿
-                for alert_attempt in range(self.MAX_ALERT_WAIT_RETRIES):
-                    alert_text = self._wait_for_alert(timeout=0.7 + alert_attempt * 0.3)
-                    if alert_text:
-                        self.driver.switch_to.alert.accept()
-                        time.sleep(0.5)
+                self.driver.execute_script("arguments[0].click();", modal_upload_btn)
 
-                        if any(k in alert_text for k in excel_keywords):
-                            had_any_alert_error = True
-                            break
-                        elif any(k in alert_text for k in fail_keywords):
-                            had_any_alert_error = True
-                            break
-                        else:
-                            break
-                    elif alert_attempt == self.MAX_ALERT_WAIT_RETRIES - 1:
+                # 알럿 처리 (1차, 2차)
+                had_any_alert_error = False
+                for _ in range(2):
+                    if self._accept_alert_has_error(excel_keywords, fail_keywords):
+                        had_any_alert_error = True
                         break
 
                 if had_any_alert_error:
@@ -619,7 +768,12 @@ class BeeflowUploader:
                     return False
 
                 # 결과 모달 검사 (텍스트는 안 찍고, 에러 키워드만 체크)
-                time.sleep(0.7)
+                self._wait_until(
+                    EC.visibility_of_any_elements_located(
+                        (By.CSS_SELECTOR, ".modal, .v--modal-box")
+                    ),
+                    self.RESULT_MODAL_TIMEOUT,
+                )
                 modals = self.driver.find_elements(
                     By.CSS_SELECTOR, ".modal, .v--modal-box"
                 )
@@ -654,7 +808,9 @@ class BeeflowUploader:
                         for btn in close_btns:
                             if btn.is_displayed() and btn.is_enabled():
                                 self.driver.execute_script("arguments[0].click();", btn)
-                                time.sleep(0.3)
+                                self._wait_until(
+                                    EC.invisibility_of_element(modal), self.RESULT_MODAL_TIMEOUT
+                                )
                                 break
                     except Exception:
                         pass
@@ -670,8 +826,10 @@ class BeeflowUploader:
                     for btn in close_btns:
                         if btn.is_displayed():
                             self.driver.execute_script("arguments[0].click();", btn)
+                            self._wait_until(
+                                EC.invisibility_of_element(btn), self.RESULT_MODAL_TIMEOUT
+                            )
                             break
-                    time.sleep(0.3)
                 except Exception:
                     pass
 
@@ -683,29 +841,39 @@ class BeeflowUploader:
                     if btn.is_displayed() and btn.is_enabled():
                         self.driver.execute_script("arguments[0].click();", btn)
                         break
-                time.sleep(0.7)
 
-                # 중복 리스트 모달 확인 버튼 처리
-                try:
-                    confirm_btns = self.driver.find_elements(
-                        By.CSS_SELECTOR, ".br-btn-purple"
-                    )
-                    for btn in confirm_btns:
+                # 중복 리스트 모달 확인 버튼 또는 alert 대기
+                def save_result(driver):
+                    if EC.alert_is_present()(driver):
+                        return "alert"
+                    for btn in driver.find_elements(By.CSS_SELECTOR, ".br-btn-purple"):
                         if btn.is_displayed() and btn.is_enabled() and "확인" in btn.text:
-                            self.driver.execute_script("arguments[0].click();", btn)
-                            time.sleep(0.5)
-                            break
-                except Exception:
-                    pass
+                            return btn
+                    return False
+
+                result = self._wait_until(save_result, self.SAVE_RESULT_TIMEOUT)
+
+                # 중복 리스트 모달 확인 버튼 처리
+                alert_present = result == "alert"
+                if result is not None and not alert_present:
+                    try:
+                        self.driver.execute_script("arguments[0].click();", result)
+                    except Exception:
+                        pass
+                    alert_present = self._wait_for_alert(self.SAVE_RESULT_TIMEOUT) is not None
 
                 # JS alert 처리
-                try:
-                    time.sleep(0.5)
-                    alert = self.driver.switch_to.alert
-                    alert.accept()
-                    time.sleep(0.3)
-                except Exception:
-                    pass
+                if alert_present:
+                    try:
+                        self.driver.switch_to.alert.accept()
+                    except Exception:
+                        pass
+
+                if on_saved:
+                    try:
+                        on_saved()
+                    except Exception as e:
+                        print(f"    ⚠️  업로드 요청 학습 실패: {e}")
 
                 # 다음 업로드를 위해 새 페이지로 이동
                 self.driver.get("https://b-flow.co.kr/distribution/promotion/create#/")
@@ -733,6 +901,20 @@ class BeeflowUploader:
 
         return False
 
+    def _accept_alert_has_error(self, excel_keywords: List[str], fail_keywords: List[str]) -> bool:
+        """알럿이 뜨면 수락하고 엑셀 양식/실패 키워드 포함 여부 반환 (알럿 없으면 False)"""
+        alert_text = self._wait_for_alert()
+        if not alert_text:
+            return False
+
+        try:
+            self.driver.switch_to.alert.accept()
+        except NoAlertPresentException:
+            pass
+        self._wait_until(lambda d: not EC.alert_is_present()(d), self.ALERT_TIMEOUT)
+
+        return any(k in alert_text for k in excel_keywords + fail_keywords)
+
     def _click_checkbox(self, promotion_type: str):
         """체크박스 클릭 (상품 또는 브랜드)"""
         checkbox_label = "상품" if promotion_type == "product" else "브랜드"
@@ -764,7 +946,6 @@ class BeeflowUploader:
             self.driver.execute_script(
                 "arguments[0].scrollIntoView(true);", checkboxes[0]
             )
-            time.sleep(0.3)
 
             if not checkboxes[0].is_selected():
                 try:
@@ -772,7 +953,10 @@ class BeeflowUploader:
                 except Exception:
                     parent_div = checkboxes[0].find_element(By.XPATH, "..")
                     self.driver.execute_script("arguments[0].click();", parent_div)
-                time.sleep(2)
+
+                # 선택 상태 반영 + 화면 갱신 대기
+                self._wait_until(EC.element_to_be_selected(checkboxes[0]), self.ELEMENT_TIMEOUT)
+                self._wait_for_render()
 
     def _get_absolute_path(self, file_path: str) -> str:
         """절대 경로 가져오기"""
@@ -800,6 +984,56 @@ class BeeflowUploader:
             self.driver.quit()
 
 
+def parse_upload_filename(filename: str) -> Tuple[datetime, datetime, str, str]:
+    """
+    업로드 파일명 파싱 ("YYMMDD-YYMMDD_상품_채널명_N.xlsx")
+
+    Returns:
+        (시작일, 종료일, 프로모션 타입("product"/"brand"), 채널명)
+    """
+    name_without_ext = os.path.basename(filename).replace(".xlsx", "")
+    parts = name_without_ext.split("_")
+
+    if len(parts) < 3:
+        raise ValueError(f"파일명 형식이 예상과 다릅니다: {filename}")
+
+    # 날짜 범위
+    date_range = parts[0]
+    dates = date_range.split("-")
+    if len(dates) != 2:
+        raise ValueError(f"날짜 구간 형식이 잘못되었습니다: {date_range}")
+
+    start_date = datetime.strptime("20" + dates[0], "%Y%m%d")
+    end_date = datetime.strptime("20" + dates[1], "%Y%m%d")
+
+    # 프로모션 타입
+    promotion_type = "brand" if "브랜드" in parts[1] else "product"
+
+    # 채널명
+    channel_name = parts[2]
+
+    return start_date, end_date, promotion_type, channel_name
+
+
+# 분할 파일 접미사 ("..._20000_1of3.xlsx")
+_PART_SUFFIX_RE = re.compile(r"_(\d+)of(\d+)$")
+
+
+def parse_upload_part(filename: str) -> Tuple[str, int, int]:
+    """
+    업로드 파일명의 파트 정보 (큰 그룹을 나눈 파일들을 하나의 논리 그룹으로 묶기 위함)
+
+    Returns:
+        (그룹 키 "YYMMDD-YYMMDD_상품_채널명", 파트 번호, 전체 파트 수) - 분할되지 않은 파일은 1, 1
+    """
+    name_without_ext = os.path.basename(filename).replace(".xlsx", "")
+    group_key = "_".join(name_without_ext.split("_")[:3])
+    match = _PART_SUFFIX_RE.search(name_without_ext)
+    if not match:
+        return group_key, 1, 1
+    return group_key, int(match.group(1)), int(match.group(2))
+
+
 def upload_promotions(
     output_files: List[str],
     output_dir: str,
@@ -832,30 +1066,7 @@ def upload_promotions(
             filename = os.path.basename(file_path)
 
             try:
-                name_without_ext = filename.replace(".xlsx", "")
-                parts = name_without_ext.split("_")
-
-                if len(parts) < 3:
-                    raise ValueError(f"파일명 형식이 예상과 다릅니다: {filename}")
-
-                # 날짜 범위
-                date_range = parts[0]
-                dates = date_range.split("-")
-                if len(dates) != 2:
-                    raise ValueError(f"날짜 구간 형식이 잘못되었습니다: {date_range}")
-
-                start_date = datetime.strptime("20" + dates[0], "%Y%m%d")
-                end_date = datetime.strptime("20" + dates[1], "%Y%m%d")
-
-                # 프로모션 타입
-                raw_type = parts[1]
-                if "브랜드" in raw_type:
-                    promotion_type = "brand"
-                else:
-                    promotion_type = "product"
-
-                # 채널명
-                channel_name = parts[2]
+                start_date, end_date, promotion_type, channel_name = parse_upload_filename(filename)
 
                 desc = f"{filename} ({promotion_type} / {channel_name})"
                 print("\n" + "-" * 60)
@@ -905,6 +1116,203 @@ def upload_promotions(
         uploader.close()
 
 
+class UploadRateLimiter:
+    """전체 워커 공통 업로드 시작 간격 제한 (분당 최대 N건)"""
+
+    def __init__(self, per_minute: Optional[float] = None):
+        self.interval = 60.0 / per_minute if per_minute else 0.0
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def acquire(self):
+        """다음 업로드 가능 시점까지 대기"""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_at)
+            self._next_at = start_at + self.interval
+        if start_at > now:
+            time.sleep(start_at - now)
+
+
+class UploadPipeline:
+    """
+    업로드 세션 풀 (생산자/소비자)
+
+    start() 즉시 세션 K개가 로그인하고 큐를 기다림 → 파일이 만들어지는 대로 submit(),
+    모두 넣은 뒤 close()로 남은 업로드를 마치고 결과 반환
+    """
+
+    _STOP = None
+
+    def __init__(
+        self,
+        email: str,
+        password: str,
+        workers: int,
+        rate_limit_per_minute: Optional[float] = None,
+        on_result: Optional[Callable[[str, bool, str], None]] = None,
+        wait_timeouts: Optional[Dict[str, float]] = None,
+        total: Optional[int] = None,
+    ):
+        """
+        Args:
+            email, password: 비플로우 로그인 정보
+            workers: 동시 세션 수 (K)
+            rate_limit_per_minute: 전체 워커 합산 분당 업로드 시작 수 (None이면 제한 없음)
+            on_result: 파일별 결과 콜백 (file_path, 성공 여부, 오류 메시지) - 락 안에서 순차 호출
+            wait_timeouts: BeeflowUploader 대기 상한 덮어쓰기
+            total: 전체 파일 수 (미리 알면 진행 표시에 사용)
+        """
+        self.email = email
+        self.password = password
+        self.workers = max(1, workers)
+        self.on_result = on_result
+        self.wait_timeouts = wait_timeouts
+        self.total = total
+
+        self.results: Dict[str, bool] = {}
+        self._queue: "queue.Queue[Optional[Tuple[int, str]]]" = queue.Queue()
+        self._limiter = UploadRateLimiter(rate_limit_per_minute)
+        self._result_lock = threading.Lock()
+        self._submitted = 0
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> "UploadPipeline":
+        """세션 시작 (로그인은 각 워커 스레드에서 병렬 진행)"""
+        total_text = f"{self.total}개 파일 " if self.total is not None else ""
+        print(f"  [업로드 풀] 세션 {self.workers}개로 {total_text}업로드")
+        self._threads = [
+            threading.Thread(target=self._worker, args=(n,), name=f"uploader-{n}", daemon=True)
+            for n in range(1, self.workers + 1)
+        ]
+        for t in self._threads:
+            t.start()
+        return self
+
+    def submit(self, file_path: str):
+        """업로드 대기열에 파일 추가"""
+        self._submitted += 1
+        self._queue.put((self._submitted, file_path))
+
+    def close(self, cancel: bool = False) -> Dict[str, bool]:
+        """
+        더 이상 파일이 없음을 알리고 모든 세션 종료까지 대기
+
+        Args:
+            cancel: True면 아직 시작하지 않은 파일은 업로드하지 않음 (결과에도 넣지 않음)
+
+        Returns:
+            {파일 경로: 성공 여부}
+        """
+        if cancel:
+            self._drain()
+        for _ in self._threads:
+            self._queue.put(self._STOP)
+        for t in self._threads:
+            t.join()
+
+        # 모든 세션이 로그인 실패/종료해 남은 파일
+        for idx, file_path in self._drain():
+            self._report(idx, file_path, False, "업로드 세션 없음", 0)
+
+        return self.results
+
+    def _drain(self) -> List[Tuple[int, str]]:
+        remaining = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return remaining
+            if item is not self._STOP:
+                remaining.append(item)
+
+    def _report(self, idx: int, file_path: str, ok: bool, error_msg: str, worker_no: int):
+        with self._result_lock:
+            self.results[file_path] = ok
+            mark = "✅ 완료" if ok else f"❌ {error_msg or '실패'}"
+            position = f"{idx}/{self.total}" if self.total is not None else f"{idx}"
+            print(f"[{position}] {os.path.basename(file_path)} (세션 {worker_no}) → {mark}")
+            if self.on_result:
+                try:
+                    self.on_result(file_path, ok, error_msg)
+                except Exception as e:
+                    print(f"  ⚠️ 결과 기록 실패: {e}")
+
+    def _worker(self, worker_no: int):
+        uploader = BeeflowUploader(self.email, self.password, wait_timeouts=self.wait_timeouts)
+        try:
+            uploader.init_driver()
+            if not uploader.login():
+                print(f"  ✗ 세션 {worker_no} 로그인 실패 - 워커 종료")
+                return
+
+            while True:
+                item = self._queue.get()
+                if item is self._STOP:
+                    return
+                idx, file_path = item
+
+                try:
+                    start_date, end_date, promotion_type, channel_name = parse_upload_filename(file_path)
+                    self._limiter.acquire()
+                    ok = uploader.upload_promotion(
+                        file_path=file_path,
+                        channel_name=channel_name,
+                        start_date=start_date,
+                        end_date=end_date,
+                        promotion_type=promotion_type,
+                    )
+                    self._report(idx, file_path, ok, "" if ok else "업로드 실패", worker_no)
+                except Exception as e:
+                    self._report(idx, file_path, False, str(e), worker_no)
+        except Exception as e:
+            print(f"  ✗ 세션 {worker_no} 오류: {type(e).__name__}")
+        finally:
+            try:
+                uploader.close()
+            except Exception:
+                pass
+
+
+def upload_files_parallel(
+    output_files: List[str],
+    email: str,
+    password: str,
+    workers: int,
+    rate_limit_per_minute: Optional[float] = None,
+    on_result: Optional[Callable[[str, bool, str], None]] = None,
+    wait_timeouts: Optional[Dict[str, float]] = None,
+) -> Dict[str, bool]:
+    """
+    로그인된 업로더 세션 K개가 공유 큐에서 파일을 가져가 병렬 업로드
+
+    Args:
+        output_files: 업로드할 파일 경로 리스트
+        email, password: 비플로우 로그인 정보
+        workers: 동시 세션 수 (K)
+        rate_limit_per_minute: 전체 워커 합산 분당 업로드 시작 수 (None이면 제한 없음)
+        on_result: 파일별 결과 콜백 (file_path, 성공 여부, 오류 메시지) - 락 안에서 순차 호출
+        wait_timeouts: BeeflowUploader 대기 상한 덮어쓰기
+
+    Returns:
+        {파일 경로: 성공 여부}
+    """
+    pipeline = UploadPipeline(
+        email, password,
+        workers=min(workers, len(output_files)),
+        rate_limit_per_minute=rate_limit_per_minute,
+        on_result=on_result,
+        wait_timeouts=wait_timeouts,
+        total=len(output_files),
+    )
+    for file_path in output_files:
+        pipeline.submit(file_path)
+    return pipeline.start().close()
+
+
 if __name__ == "__main__":
     from pathlib import Path
 